@@ -0,0 +1,71 @@
+"""
+Benchmark resolving bin items into mob records serially vs. in a process pool
+
+Usage: bench_binparsing.py BIN_PATH [BIN_PATH ...]
+"""
+
+import sys, os, time, concurrent.futures, multiprocessing
+import avb
+import binrecords
+
+CHUNK_SIZE = 250
+"""Bin items per worker task (matches `BinViewLoader.PROCESS_CHUNK_SIZE`)"""
+
+def load_serial(bin_path:str) -> int:
+	"""Resolve all items in this process"""
+
+	resolution_cache = binrecords.SourceResolutionCache()
+
+	with avb.open(bin_path) as bin_handle:
+		record_count = len(binrecords.mob_records_for_bin_items(bin_handle.content.items, resolution_cache))
+	
+	print(f"  Source lookups: {resolution_cache.saved():,} of {resolution_cache.lookups():,} saved")
+	return record_count
+
+def load_parallel(bin_path:str, process_count:int) -> int:
+	"""Resolve all items in a pool of worker processes"""
+
+	with avb.open(bin_path) as bin_handle:
+		item_count = len(bin_handle.content.items)
+
+	chunks = [(first_item, min(first_item + CHUNK_SIZE, item_count)) for first_item in range(0, item_count, CHUNK_SIZE)]
+
+	with concurrent.futures.ProcessPoolExecutor(
+		max_workers = process_count,
+		mp_context  = multiprocessing.get_context("spawn"),
+		initializer = binrecords.open_worker_bin,
+		initargs    = (bin_path,),
+	) as executor:
+		return sum(len(records) for records, _ in executor.map(binrecords.load_worker_mob_records, *zip(*chunks)))
+
+def main(bin_paths:list[str]) -> int:
+
+	if not bin_paths:
+		print(__doc__.strip(), file=sys.stderr)
+		return 1
+
+	cpu_count = os.cpu_count() or 1
+	process_counts = sorted({count for count in (2, 4, cpu_count) if count <= cpu_count})
+
+	for bin_path in bin_paths:
+
+		print(os.path.basename(bin_path))
+
+		time_start = time.perf_counter()
+		record_count = load_serial(bin_path)
+		time_serial = time.perf_counter() - time_start
+
+		print(f"  {'Serial':<12} {record_count:>8,} items {time_serial:>8.2f}s")
+
+		for process_count in process_counts:
+
+			time_start = time.perf_counter()
+			record_count = load_parallel(bin_path, process_count)
+			time_parallel = time.perf_counter() - time_start
+
+			print(f"  {str(process_count) + ' processes':<12} {record_count:>8,} items {time_parallel:>8.2f}s {time_serial/time_parallel:>6.1f}x")
+
+	return 0
+
+if __name__ == "__main__":
+	sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,85 @@
+"""
+Benchmark loading synthetic rows into a TRTTimelineViewModel,
+one row at a time versus with a bulk load
+"""
+
+import sys, time
+from timecode import Timecode
+from PySide6 import QtWidgets
+from trt_model import viewmodels, viewitems
+
+ROW_COUNTS = (1_000, 10_000, 100_000)
+"""Synthetic bin sizes to load"""
+
+PER_ROW_MAX_ROWS = 10_000
+"""Skip the one-row-at-a-time load above this many rows (it takes ages)"""
+
+def build_rows(row_count:int) -> list[dict[str, viewitems.TRTAbstractViewItem]]:
+	"""Build some synthetic timeline rows"""
+
+	return [{
+		"name":     viewitems.TRTStringViewItem(f"Reel {idx} v{idx % 13}"),
+		"start":    viewitems.TRTTimecodeViewItem(Timecode(86400 + idx, rate=24)),
+		"duration": viewitems.TRTDurationViewItem(Timecode(idx % 2000, rate=24)),
+		"frames":   viewitems.TRTNumericViewItem(idx % 2000),
+	} for idx in range(row_count)]
+
+def load_rows(app:QtWidgets.QApplication, rows:list[dict], bulk:bool) -> tuple[float, float]:
+	"""Load rows into a visible, sorted view.  Returns `(first_paint_secs, total_secs)`"""
+
+	view_model = viewmodels.TRTTimelineViewModel()
+	for field_name in ("frames", "duration", "start", "name"):
+		view_model.addHeader(viewitems.TRTAbstractViewHeaderItem(field_name, field_name.title()))
+
+	tree_view = QtWidgets.QTreeView()
+	tree_view.setModel(viewmodels.TRTSortFilterProxyModel())
+	tree_view.model().setSourceModel(view_model)
+	tree_view.setSortingEnabled(True)
+	tree_view.setUniformRowHeights(True)
+	tree_view.show()
+	app.processEvents()
+
+	time_first_paint = None
+	time_start = time.perf_counter()
+
+	if bulk:
+		view_model.beginBulkLoad()
+
+	for row in rows:
+		view_model.addTimeline(row)
+
+		if time_first_paint is None and view_model.rowCount():
+			app.processEvents()
+			time_first_paint = time.perf_counter() - time_start
+
+	if bulk:
+		view_model.endBulkLoad()
+
+	app.processEvents()
+	time_total = time.perf_counter() - time_start
+
+	tree_view.close()
+	return time_first_paint, time_total
+
+def main() -> int:
+
+	app = QtWidgets.QApplication(sys.argv)
+
+	print(f"{'Rows':>8}  {'Mode':<8}  {'First Paint':>12}  {'Total':>10}")
+
+	for row_count in ROW_COUNTS:
+
+		rows = build_rows(row_count)
+
+		for bulk in (False, True):
+
+			if not bulk and row_count > PER_ROW_MAX_ROWS:
+				continue
+
+			time_first_paint, time_total = load_rows(app, rows, bulk)
+			print(f"{row_count:>8}  {'Bulk' if bulk else 'Per-Row':<8}  {time_first_paint*1000:>10.1f}ms  {time_total:>9.3f}s")
+
+	return 0
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,115 @@
+"""
+Micro-benchmark `TRTTimelineViewModel.data()` as a view repaints its viewport,
+comparing per-cell header lookups against the model's cached row layout,
+with and without a column store
+"""
+
+import sys, time
+from timecode import Timecode
+from PySide6 import QtCore, QtWidgets
+from trt_model import viewmodels, viewitems
+
+ROW_COUNT = 100_000
+"""Synthetic bin size"""
+
+VISIBLE_ROWS = 60
+"""Rows painted per repaint"""
+
+REPAINTS = 500
+"""Repaints to simulate, scrolling a little between each"""
+
+SCROLL_STEP = 7
+"""Rows scrolled between repaints"""
+
+PAINT_ROLES = (
+	QtCore.Qt.ItemDataRole.DisplayRole,
+	QtCore.Qt.ItemDataRole.DecorationRole,
+	QtCore.Qt.ItemDataRole.FontRole,
+	QtCore.Qt.ItemDataRole.TextAlignmentRole,
+	QtCore.Qt.ItemDataRole.ForegroundRole,
+	QtCore.Qt.ItemDataRole.BackgroundRole,
+	QtCore.Qt.ItemDataRole.CheckStateRole,
+	QtCore.Qt.ItemDataRole.SizeHintRole,
+	QtCore.Qt.ItemDataRole.ToolTipRole,
+)
+"""Roles a `QStyledItemDelegate` asks for when painting a cell (tool tips on hover)"""
+
+class HeaderLookupViewModel(viewmodels.TRTTimelineViewModel):
+	"""The previous `data()`: look up the field name and the item for every call"""
+
+	def data(self, index:QtCore.QModelIndex, /, role:QtCore.Qt.ItemDataRole) -> object:
+		if not index.isValid():
+			return None
+		
+		timeline   = self._timelines[index.row()]
+		field_name = self._headers[index.column()].field_name()
+
+		if field_name not in timeline:
+			return None
+
+		return timeline.get(field_name).data(role)
+
+def build_model(model_class:type, row_count:int, column_store:bool=False) -> viewmodels.TRTTimelineViewModel:
+
+	view_model = model_class(column_store=column_store)
+	for field_name in ("notes", "tape", "frames", "duration", "start", "name"):
+		view_model.addHeader(viewitems.TRTAbstractViewHeaderItem(field_name, field_name.title()))
+
+	view_model.addTimelines({
+		"name":     viewitems.TRTStringViewItem(f"A{idx * 7919 % 400:03}C{idx % 97:03}_{idx:06}"),
+		"start":    viewitems.TRTTimecodeViewItem(Timecode(86400 + idx, rate=24)),
+		"duration": viewitems.TRTDurationViewItem(Timecode(idx % 2000, rate=24)),
+		"frames":   viewitems.TRTNumericViewItem(idx % 2000),
+		"tape":     viewitems.TRTStringViewItem(f"Tape {idx * 31 % 40}"),
+		# "notes" is left empty, like sparse user columns
+	} for idx in range(row_count))
+
+	return view_model
+
+def repaint_viewports(view_model:viewmodels.TRTTimelineViewModel) -> tuple[int, float]:
+	"""Request every paint role for every visible cell, scrolling between repaints.  Returns `(data_calls, secs)`"""
+
+	column_count = view_model.columnCount()
+	data_calls = 0
+
+	time_start = time.perf_counter()
+
+	for repaint in range(REPAINTS):
+
+		first_row = (repaint * SCROLL_STEP) % (view_model.rowCount() - VISIBLE_ROWS)
+
+		for row in range(first_row, first_row + VISIBLE_ROWS):
+			for column in range(column_count):
+				index = view_model.index(row, column, QtCore.QModelIndex())
+				for role in PAINT_ROLES:
+					view_model.data(index, role)
+				data_calls += len(PAINT_ROLES)
+
+	return data_calls, time.perf_counter() - time_start
+
+def main() -> int:
+
+	app = QtWidgets.QApplication(sys.argv)
+
+	print(f"{VISIBLE_ROWS} rows x {len(PAINT_ROLES)} roles per cell, {REPAINTS} repaints of a {ROW_COUNT:,}-row model")
+
+	calls_per_sec = []
+
+	for label, model_class, column_store in (
+		("Header lookup", HeaderLookupViewModel, False),
+		("Row layout",    viewmodels.TRTTimelineViewModel, False),
+		("Column store",  viewmodels.TRTTimelineViewModel, True),
+	):
+
+		view_model = build_model(model_class, ROW_COUNT, column_store)
+		data_calls, secs = repaint_viewports(view_model)
+		calls_per_sec.append(data_calls / secs)
+
+		print(f"  {label:<14} {data_calls:>10,} calls {secs:>7.2f}s {calls_per_sec[-1]:>12,.0f} calls/s")
+	
+	print(f"  {'Speedup':<14} {calls_per_sec[1] / calls_per_sec[0]:>41.2f}x (row layout over header lookup)")
+
+	return 0
+
+if __name__ == "__main__":
+	sys.exit(main())
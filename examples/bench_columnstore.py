@@ -0,0 +1,61 @@
+"""
+Benchmark memory used per row by TRTTimelineViewModel, with and without the column store
+"""
+
+import sys, gc, tracemalloc, datetime
+import avbutils
+from timecode import Timecode
+from PySide6 import QtWidgets
+from trt_model import viewmodels, viewitems
+
+ROW_COUNT = 50_000
+"""Synthetic bin size"""
+
+def build_row(idx:int) -> dict[str, viewitems.TRTAbstractViewItem]:
+	"""Build a synthetic clip row similar to what the bin loader produces"""
+
+	return {
+		"name":     viewitems.TRTStringViewItem(f"A{idx % 400:03}C{idx % 30:03}_{idx}"),
+		"color":    viewitems.TRTClipColorViewItem(None),
+		"start":    viewitems.TRTTimecodeViewItem(Timecode(86400 + idx, rate=24)),
+		"end":      viewitems.TRTTimecodeViewItem(Timecode(86400 + idx + 500, rate=24)),
+		"duration": viewitems.TRTDurationViewItem(Timecode(500, rate=24)),
+		"modified": viewitems.TRTDateTimeViewItem(datetime.datetime(2024, 1, 1) + datetime.timedelta(minutes=idx)),
+		"types":    viewitems.TRTEnumViewItem(avbutils.BinDisplayItemTypes.MASTER_CLIP),
+		"tape":     viewitems.TRTStringViewItem(f"Tape {idx % 12}"),
+		"frames":   viewitems.TRTFeetFramesViewItem(500),
+	}
+
+def measure_model(column_store:bool) -> int:
+	"""Load synthetic rows and return the bytes retained by the view model"""
+
+	gc.collect()
+	tracemalloc.start()
+
+	view_model = viewmodels.TRTTimelineViewModel(column_store=column_store)
+	view_model.beginBulkLoad()
+	for idx in range(ROW_COUNT):
+		view_model.addTimeline(build_row(idx))
+	view_model.endBulkLoad()
+
+	gc.collect()
+	retained, _ = tracemalloc.get_traced_memory()
+	tracemalloc.stop()
+
+	del view_model
+	return retained
+
+def main() -> int:
+
+	app = QtWidgets.QApplication(sys.argv)
+
+	print(f"{ROW_COUNT:,} rows")
+
+	for column_store in (False, True):
+		retained = measure_model(column_store)
+		print(f"{'Column store' if column_store else 'Dict rows':<14} {retained/1024/1024:>8.1f} MB  {retained/ROW_COUNT:>8.0f} bytes/row")
+
+	return 0
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,92 @@
+"""
+Benchmark opening a huge synthetic bin in a view, comparing the eager
+TRTTimelineViewModel against TRTLazyTimelineViewModel fed from a row source
+"""
+
+import sys, time, tracemalloc
+from timecode import Timecode
+from PySide6 import QtWidgets
+from trt_model import viewmodels, viewitems, rowsources
+
+LAZY_ROW_COUNT = 1_000_000
+"""Synthetic bin size for the lazy model"""
+
+EAGER_ROW_COUNT = 100_000
+"""Synthetic bin size for the eager model (a million rows takes ages)"""
+
+SCROLL_STEPS = 200
+"""Pages to scroll through, reading every visible cell, after opening"""
+
+FIELD_NAMES = ("frames", "start", "name")
+
+def build_row(idx:int) -> dict[str, viewitems.TRTAbstractViewItem]:
+
+	return {
+		"name":   viewitems.TRTStringViewItem(f"A{idx * 7919 % 400:03}C{idx % 97:03}_{idx:07}"),
+		"start":  viewitems.TRTTimecodeViewItem(Timecode(86400 + idx, rate=24)),
+		"frames": viewitems.TRTNumericViewItem(idx % 2000),
+	}
+
+def add_headers(view_model:viewmodels.TRTTimelineViewModel|viewmodels.TRTLazyTimelineViewModel):
+	for field_name in FIELD_NAMES:
+		view_model.addHeader(viewitems.TRTAbstractViewHeaderItem(field_name, field_name.title()))
+
+def open_and_scroll(app:QtWidgets.QApplication, view_model) -> tuple[float, float, int]:
+	"""Show a model in a view and scroll through it.  Returns `(open_secs, scroll_secs, peak_bytes)`"""
+
+	tree_view = QtWidgets.QTreeView()
+	tree_view.setUniformRowHeights(True)
+	tree_view.setModel(viewmodels.TRTSortFilterProxyModel())
+
+	time_start = time.perf_counter()
+	tree_view.model().setSourceModel(view_model)
+	tree_view.show()
+	app.processEvents()
+	time_open = time.perf_counter() - time_start
+
+	time_start = time.perf_counter()
+	scroll_bar = tree_view.verticalScrollBar()
+	for _ in range(SCROLL_STEPS):
+		scroll_bar.setValue(scroll_bar.maximum())
+		app.processEvents()
+	time_scroll = time.perf_counter() - time_start
+
+	_, peak_bytes = tracemalloc.get_traced_memory()
+	tree_view.close()
+
+	return time_open, time_scroll, peak_bytes
+
+def main() -> int:
+
+	app = QtWidgets.QApplication(sys.argv)
+
+	print(f"{'Model':<8} {'Rows':>10} {'Build':>8} {'Open':>8} {'Scroll':>8} {'Peak memory':>12}")
+
+	# Eager: every row is built up front
+	tracemalloc.start()
+	time_start = time.perf_counter()
+	eager_model = viewmodels.TRTTimelineViewModel()
+	add_headers(eager_model)
+	eager_model.addTimelines(build_row(idx) for idx in range(EAGER_ROW_COUNT))
+	time_build = time.perf_counter() - time_start
+	time_open, time_scroll, peak_bytes = open_and_scroll(app, eager_model)
+	tracemalloc.stop()
+	print(f"{'Eager':<8} {EAGER_ROW_COUNT:>10,} {time_build:>7.2f}s {time_open:>7.2f}s {time_scroll:>7.2f}s {peak_bytes / 1024 / 1024:>10.1f}MB")
+
+	del eager_model
+
+	# Lazy: rows are built as they're scrolled to
+	tracemalloc.start()
+	time_start = time.perf_counter()
+	lazy_model = viewmodels.TRTLazyTimelineViewModel(rowsources.TRTGeneratedRowSource(LAZY_ROW_COUNT, build_row))
+	add_headers(lazy_model)
+	time_build = time.perf_counter() - time_start
+	time_open, time_scroll, peak_bytes = open_and_scroll(app, lazy_model)
+	tracemalloc.stop()
+	print(f"{'Lazy':<8} {LAZY_ROW_COUNT:>10,} {time_build:>7.2f}s {time_open:>7.2f}s {time_scroll:>7.2f}s {peak_bytes / 1024 / 1024:>10.1f}MB")
+	print(f"  {lazy_model.rowCount():,} rows fetched, {lazy_model.pageLoadCount():,} pages loaded, {lazy_model.pageEvictionCount():,} evicted, {lazy_model.cachedPageCount()} cached")
+
+	return 0
+
+if __name__ == "__main__":
+	sys.exit(main())
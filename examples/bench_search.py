@@ -0,0 +1,78 @@
+"""
+Benchmark "Find in bin" filtering latency per keystroke on a large synthetic bin
+
+Filtering happens in the thread pool, so this also measures the longest the
+GUI thread went without processing events while each search was running.
+"""
+
+import sys, time
+from timecode import Timecode
+from PySide6 import QtCore, QtWidgets
+from trt_model import viewmodels, viewitems
+
+ROW_COUNT = 100_000
+"""Synthetic bin size"""
+
+TYPED_TEXT = "a012c0044"
+"""Text to "type" into the search box, one character at a time"""
+
+FRAME_BUDGET_MS = 1000 / 60
+"""One frame at 60Hz"""
+
+def build_model(row_count:int) -> viewmodels.TRTTimelineViewModel:
+	"""Build a view model full of synthetic clips"""
+
+	view_model = viewmodels.TRTTimelineViewModel()
+	for field_name in ("tape", "start", "name"):
+		view_model.addHeader(viewitems.TRTAbstractViewHeaderItem(field_name, field_name.title()))
+
+	view_model.addTimelines({
+		"name":  viewitems.TRTStringViewItem(f"A{idx % 400:03}C{idx % 97:03}_{idx:06}"),
+		"start": viewitems.TRTTimecodeViewItem(Timecode(86400 + idx, rate=24)),
+		"tape":  viewitems.TRTStringViewItem(f"Tape {idx % 40}"),
+	} for idx in range(row_count))
+
+	return view_model
+
+def main() -> int:
+
+	app = QtWidgets.QApplication(sys.argv)
+
+	proxy_model = viewmodels.TRTSortFilterProxyModel()
+	proxy_model.setSourceModel(build_model(ROW_COUNT))
+	proxy_model.setFilterDebounceInterval(0)
+
+	# Tick often to see how long the GUI thread is kept busy
+	tick_times:list[float] = []
+	ticker = QtCore.QTimer()
+	ticker.setInterval(1)
+	ticker.timeout.connect(lambda: tick_times.append(time.perf_counter()))
+	ticker.start()
+
+	event_loop = QtCore.QEventLoop()
+	proxy_model.sig_filter_applied.connect(event_loop.quit)
+
+	print(f"{ROW_COUNT:,} rows")
+	print(f"{'Search Text':<12} {'Matches':>8} {'Latency':>10} {'Longest Stall':>14}")
+
+	for typed_count in range(1, len(TYPED_TEXT) + 1):
+
+		search_text = TYPED_TEXT[:typed_count]
+
+		time_start = time.perf_counter()
+		tick_times[:] = [time_start]
+
+		proxy_model.setSearchText(search_text)
+		event_loop.exec()
+
+		match_count = proxy_model.rowCount()
+		time_end    = time.perf_counter()
+		latency_ms  = (time_end - time_start) * 1000
+		stall_ms    = max(b - a for a, b in zip(tick_times, tick_times[1:] + [time_end])) * 1000
+
+		print(f"{search_text:<12} {match_count:>8,} {latency_ms:>8.1f}ms {stall_ms:>12.1f}ms{'' if stall_ms <= FRAME_BUDGET_MS else '  (over one frame)'}")
+
+	return 0
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,74 @@
+"""
+Benchmark sorting a large synthetic bin by column, comparing QCollator string
+comparisons (as `lessThan` used to do) against precomputed typed sort keys
+"""
+
+import sys, time
+from timecode import Timecode
+from PySide6 import QtCore, QtWidgets
+from trt_model import viewmodels, viewitems
+
+ROW_COUNT = 100_000
+"""Synthetic bin size"""
+
+SORT_FIELDS = ("start", "name", "tape")
+"""Fields to sort by, one at a time"""
+
+class CollatorSortFilterProxyModel(viewmodels.TRTSortFilterProxyModel):
+	"""The previous sorting behaviour: compare the sort role strings of each pair of rows"""
+
+	def sort(self, column:int, order:QtCore.Qt.SortOrder=QtCore.Qt.SortOrder.AscendingOrder):
+		QtCore.QSortFilterProxyModel.sort(self, column, order)
+
+	def lessThan(self, source_left:QtCore.QModelIndex, source_right:QtCore.QModelIndex) -> bool:
+		return self._sort_collator.compare(
+			source_left.data(self.sortRole()),
+			source_right.data(self.sortRole())
+		) <= 0
+
+def build_model(row_count:int) -> viewmodels.TRTTimelineViewModel:
+	"""Build a view model full of synthetic clips, in no particular order"""
+
+	view_model = viewmodels.TRTTimelineViewModel()
+	for field_name in reversed(SORT_FIELDS):
+		view_model.addHeader(viewitems.TRTAbstractViewHeaderItem(field_name, field_name.title()))
+
+	view_model.addTimelines({
+		"name":  viewitems.TRTStringViewItem(f"A{idx * 7919 % 400:03}C{idx % 97:03}_{idx:06}"),
+		"start": viewitems.TRTTimecodeViewItem(Timecode(86400 + (idx * 7919 % row_count), rate=24)),
+		"tape":  viewitems.TRTStringViewItem(f"Tape {idx * 31 % 40}"),
+	} for idx in range(row_count))
+
+	return view_model
+
+def main() -> int:
+
+	app = QtWidgets.QApplication(sys.argv)
+
+	view_model = build_model(ROW_COUNT)
+
+	print(f"{ROW_COUNT:,} rows")
+	print(f"{'Field':<8} {'QCollator':>12} {'Sort Keys':>12} {'Speedup':>8}")
+
+	for field_name in SORT_FIELDS:
+
+		column = view_model.fields().index(field_name)
+		timings = []
+
+		for proxy_class in (CollatorSortFilterProxyModel, viewmodels.TRTSortFilterProxyModel):
+
+			proxy_model = proxy_class()
+			proxy_model.setSourceModel(view_model)
+
+			time_start = time.perf_counter()
+			proxy_model.sort(column, QtCore.Qt.SortOrder.AscendingOrder)
+			timings.append(time.perf_counter() - time_start)
+
+			proxy_model.setSourceModel(None)
+
+		print(f"{field_name:<8} {timings[0]*1000:>10.0f}ms {timings[1]*1000:>10.0f}ms {timings[0]/timings[1]:>7.1f}x")
+
+	return 0
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,111 @@
+"""
+Benchmark changing the global FFOA/LFOA across many timelines, comparing
+per-timeline `TRTTrimmedTimelineInfo` updates against the batched `TRTDataModel`,
+then applying marker presets to reels with many markers
+"""
+
+import sys, time, datetime, types
+import avbutils
+from timecode import Timecode, TimecodeRange
+from trt_model import datamodels
+
+TIMELINE_COUNT = 2_000
+"""Synthetic session size (reels across all bins)"""
+
+OFFSET_CHANGES = 50
+"""Global FFOA/LFOA changes to apply, as when scrubbing through values"""
+
+MARKER_TIMELINE_COUNT = 1_000
+MARKERS_PER_TIMELINE  = 500
+"""Synthetic session for matching marker presets"""
+
+MARKER_AUTHORS = ("editor", "assistant", "vfx", "sound")
+
+def build_markers(timeline_idx:int, marker_count:int) -> list:
+	"""Markers of all colors and a few authors, in no particular order (only the fields presets match are filled in)"""
+
+	colors = list(avbutils.MarkerColors)
+
+	return [types.SimpleNamespace(
+		frm_offset = (idx * 7919 + timeline_idx) % (marker_count * 48),
+		color      = colors[(idx + timeline_idx) % len(colors)],
+		author     = MARKER_AUTHORS[idx % len(MARKER_AUTHORS)],
+		comment    = f"Note {idx}",
+	) for idx in range(marker_count)]
+
+def build_timeline_infos(timeline_count:int, marker_count:int=0) -> list[datamodels.TRTTimelineInfo]:
+	"""Synthetic reels of 15-25 minutes at 24fps"""
+
+	now = datetime.datetime.now()
+
+	return [datamodels.TRTTimelineInfo(
+		timeline_name     = f"R{idx:04}",
+		timeline_tc_range = TimecodeRange(start=Timecode("01:00:00:00", rate=24), duration=24 * 60 * (15 + idx % 10)),
+		timeline_color    = None,
+		date_created      = now,
+		date_modified     = now,
+		markers           = build_markers(idx, marker_count),
+		bin_path          = f"R{idx:04}.avb",
+		bin_lock          = None,
+	) for idx in range(timeline_count)]
+
+def main() -> int:
+
+	timeline_infos = build_timeline_infos(TIMELINE_COUNT)
+
+	trimmed_infos = [datamodels.TRTTrimmedTimelineInfo(timeline_info) for timeline_info in timeline_infos]
+
+	time_start = time.perf_counter()
+	for change in range(OFFSET_CHANGES):
+		for trimmed_info in trimmed_infos:
+			trimmed_info.setGlobalFFOA(Timecode(8 * 24 + change, rate=24))
+			trimmed_info.setGlobalLFOA(Timecode(4 * 24 + change, rate=24))
+		total_frames = sum(trimmed_info.timelineTimecodeTrimmed().duration.frame_number for trimmed_info in trimmed_infos)
+	time_per_timeline = time.perf_counter() - time_start
+
+	data_model = datamodels.TRTDataModel()
+	data_model.addTimelines(timeline_infos)
+
+	time_start = time.perf_counter()
+	for change in range(OFFSET_CHANGES):
+		data_model.setGlobalFFOA(8 * 24 + change)
+		data_model.setGlobalLFOA(4 * 24 + change)
+		total_frames_batched = data_model.totalRunningTimeFrames()
+	time_batched = time.perf_counter() - time_start
+
+	print(f"{TIMELINE_COUNT:,} timelines, {OFFSET_CHANGES} FFOA/LFOA changes")
+	print(f"  {'Per timeline':<14} {time_per_timeline:>8.3f}s  total {total_frames:,} frames")
+	print(f"  {'Batched':<14} {time_batched:>8.3f}s  total {total_frames_batched:,} frames  {time_per_timeline/time_batched:>6.1f}x")
+
+	marker_model = datamodels.TRTDataModel()
+	marker_model.addTimelines(build_timeline_infos(MARKER_TIMELINE_COUNT, MARKERS_PER_TIMELINE))
+
+	colors = list(avbutils.MarkerColors)
+
+	time_start = time.perf_counter()
+	for color in colors:
+		marker_model.setMarkerFFOAFromPreset(datamodels.TRTMarkerPresetInfo("FFOA", color=color, author="editor"))
+		marker_model.setMarkerLFOAFromPreset(datamodels.TRTMarkerPresetInfo("LFOA", color=color))
+	time_presets = time.perf_counter() - time_start
+
+	marker_presets = [datamodels.TRTMarkerPresetInfo(color.name, color=color, author="editor") for color in colors]
+
+	time_start = time.perf_counter()
+	marker_model.setMarkerPresets(marker_presets)
+	time_compile = time.perf_counter() - time_start
+
+	time_start = time.perf_counter()
+	for marker_preset in marker_presets:
+		marker_model.setMarkerFFOAFromPreset(marker_preset)
+		marker_model.setMarkerLFOAFromPreset(marker_preset)
+	time_switch = time.perf_counter() - time_start
+
+	print(f"{MARKER_TIMELINE_COUNT:,} timelines with {MARKERS_PER_TIMELINE} markers each")
+	print(f"  {'Presets':<14} {time_presets / len(colors) * 1000:>8.2f}ms per FFOA/LFOA preset pair")
+	print(f"  {'Match all':<14} {time_compile * 1000:>8.2f}ms to match {len(marker_presets)} presets at once")
+	print(f"  {'Switch':<14} {time_switch / len(marker_presets) * 1000:>8.2f}ms per FFOA/LFOA switch between matched presets")
+
+	return 0
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,197 @@
+"""
+On-disk cache of parsed bin contents, so unchanged bins don't need parsing again
+
+Like `binrecords`, nothing in here touches Qt.
+"""
+
+import os, time, typing, pickle, zlib, hashlib, sqlite3, contextlib, dataclasses
+
+@dataclasses.dataclass(frozen=True)
+class BinFingerprint:
+	"""Identifies one particular state of a bin file"""
+
+	path:str
+	size:int
+	mtime_ns:int
+	content_hash:str
+
+	@classmethod
+	def from_path(cls, bin_path:os.PathLike) -> "BinFingerprint":
+		"""Fingerprint a bin file as it is now"""
+
+		bin_path = os.path.abspath(bin_path)
+		stat = os.stat(bin_path)
+
+		content_hash = hashlib.blake2b(digest_size=16)
+		with open(bin_path, "rb") as bin_file:
+			while chunk := bin_file.read(BinCache.HASH_CHUNK_SIZE):
+				content_hash.update(chunk)
+
+		return cls(bin_path, stat.st_size, stat.st_mtime_ns, content_hash.hexdigest())
+
+	def key(self) -> str:
+		"""Cache key for this state of the bin"""
+		return f"{self.path}|{self.size}|{self.mtime_ns}|{self.content_hash}"
+
+	def isCurrent(self) -> bool:
+		"""Whether the file still looks the way it did when it was fingerprinted"""
+
+		try:
+			stat = os.stat(self.path)
+		except OSError:
+			return False
+
+		return stat.st_size == self.size and stat.st_mtime_ns == self.mtime_ns
+
+
+class BinCache:
+	"""Least-recently-used cache of bin snapshots in an SQLite database
+
+	A snapshot is a `dict` of picklable bin data (mob records, view settings, etc).
+	Entries are evicted, oldest use first, once their total size exceeds `max_bytes`.
+	"""
+
+	HASH_CHUNK_SIZE:int = 1024 * 1024
+	"""Bytes read at a time while hashing bin files"""
+
+	DEFAULT_MAX_BYTES:int = 256 * 1024 * 1024
+	"""Default size budget for cached snapshots"""
+
+	def __init__(self, database_path:os.PathLike, max_bytes:int=DEFAULT_MAX_BYTES):
+
+		self._database_path = database_path
+		self._max_bytes     = max_bytes
+
+		self._hits   = 0
+		self._misses = 0
+
+		os.makedirs(os.path.dirname(os.path.abspath(database_path)), exist_ok=True)
+
+		with self._connect() as db:
+			db.execute("""
+				CREATE TABLE IF NOT EXISTS bin_snapshots (
+					key         TEXT PRIMARY KEY,
+					path        TEXT NOT NULL,
+					data        BLOB NOT NULL,
+					data_size   INTEGER NOT NULL,
+					last_used   REAL NOT NULL
+				)
+			""")
+			db.execute("CREATE INDEX IF NOT EXISTS bin_snapshots_last_used ON bin_snapshots (last_used)")
+
+	@contextlib.contextmanager
+	def _connect(self) -> typing.Iterator[sqlite3.Connection]:
+		"""A connection for one transaction (connections can't be shared between loader threads)"""
+
+		with contextlib.closing(sqlite3.connect(self._database_path, timeout=10)) as db:
+			with db:
+				yield db
+
+	def load(self, fingerprint:BinFingerprint) -> dict|None:
+		"""The cached snapshot for this state of a bin, if there is one"""
+
+		with self._connect() as db:
+
+			row = db.execute("SELECT data FROM bin_snapshots WHERE key = ?", (fingerprint.key(),)).fetchone()
+
+			if row is None:
+				self._misses += 1
+				return None
+
+			db.execute("UPDATE bin_snapshots SET last_used = ? WHERE key = ?", (time.time(), fingerprint.key()))
+
+		try:
+			snapshot = pickle.loads(zlib.decompress(row[0]))
+		except Exception as e:
+			print(f"Discarding unreadable cached bin {fingerprint.path}: {e}")
+			self.remove(fingerprint.path)
+			self._misses += 1
+			return None
+
+		self._hits += 1
+		return snapshot
+
+	def store(self, fingerprint:BinFingerprint, snapshot:dict) -> bool:
+		"""Cache a snapshot of a bin, replacing any older ones for the same path
+
+		Nothing is stored if the bin has changed since it was fingerprinted, or if the snapshot can't be pickled.
+		"""
+
+		if not fingerprint.isCurrent():
+			return False
+
+		try:
+			data = zlib.compress(pickle.dumps(snapshot, protocol=pickle.HIGHEST_PROTOCOL), 1)
+		except Exception as e:
+			print(f"Not caching bin {fingerprint.path}: {e}")
+			return False
+
+		if len(data) > self._max_bytes:
+			return False
+
+		with self._connect() as db:
+			db.execute("DELETE FROM bin_snapshots WHERE path = ?", (fingerprint.path,))
+			db.execute(
+				"INSERT INTO bin_snapshots (key, path, data, data_size, last_used) VALUES (?, ?, ?, ?, ?)",
+				(fingerprint.key(), fingerprint.path, data, len(data), time.time())
+			)
+			self._evict(db)
+
+		return True
+
+	def _evict(self, db:sqlite3.Connection):
+		"""Remove the least recently used snapshots until they fit the size budget"""
+
+		total_bytes = db.execute("SELECT COALESCE(SUM(data_size), 0) FROM bin_snapshots").fetchone()[0]
+
+		if total_bytes <= self._max_bytes:
+			return
+
+		for key, data_size in db.execute("SELECT key, data_size FROM bin_snapshots ORDER BY last_used").fetchall():
+
+			db.execute("DELETE FROM bin_snapshots WHERE key = ?", (key,))
+			total_bytes -= data_size
+
+			if total_bytes <= self._max_bytes:
+				break
+
+	def remove(self, bin_path:os.PathLike):
+		"""Remove any cached snapshots of a bin"""
+
+		with self._connect() as db:
+			db.execute("DELETE FROM bin_snapshots WHERE path = ?", (os.path.abspath(bin_path),))
+
+	def clear(self):
+		"""Remove all cached snapshots and reset the counters"""
+
+		with self._connect() as db:
+			db.execute("DELETE FROM bin_snapshots")
+
+		self._hits   = 0
+		self._misses = 0
+
+	def maxBytes(self) -> int:
+		"""Size budget for cached snapshots"""
+		return self._max_bytes
+
+	def setMaxBytes(self, max_bytes:int):
+		"""Set the size budget for cached snapshots, evicting the least recently used as needed"""
+
+		self._max_bytes = max_bytes
+
+		with self._connect() as db:
+			self._evict(db)
+
+	def totalBytes(self) -> int:
+		"""Size of all cached snapshots"""
+
+		with self._connect() as db:
+			return db.execute("SELECT COALESCE(SUM(data_size), 0) FROM bin_snapshots").fetchone()[0]
+
+	def hits(self) -> int:
+		"""Number of loads that found a cached snapshot"""
+		return self._hits
+
+	def misses(self) -> int:
+		"""Number of loads that had to parse the bin"""
+		return self._misses
@@ -0,0 +1,253 @@
+"""
+Plain mob records from Avid bins, for loading bins in worker processes
+
+Nothing in here touches Qt, and records only contain picklable values, so
+they can be built in a process pool and handed back to the GUI process.
+"""
+
+import typing, types, itertools
+import avb, avbutils, timecode
+
+RECORD_VERSION:int = 3
+"""Bump whenever the contents of records change, so older cached records aren't used"""
+
+_worker_bin_handle:avb.file.AVBFile|None = None
+"""The bin opened by `open_worker_bin()` in this worker process"""
+
+_worker_resolution_cache:"SourceResolutionCache|None" = None
+"""Source lookups shared by everything this worker process resolves from its bin"""
+
+class SourceResolutionCache:
+	"""Source lookups shared by all mobs in one load of a bin, keyed by mob ID
+
+	Subclips and linked clips refer to the same source mobs over and over, so anything
+	resolved from a source mob only needs resolving the first time it's referenced.
+	"""
+
+	def __init__(self):
+
+		self._resolved:dict[tuple[str, str], typing.Any] = {}
+		"""Resolved values by `(kind, mob_id)`"""
+
+		self._lookups     = 0
+		self._resolutions = 0
+
+	def resolve(self, kind:str, mob_id:str|None, resolver:typing.Callable[[], typing.Any]) -> typing.Any:
+		"""The value of a kind of lookup for a mob, calling `resolver()` only the first time (or every time, for a `mob_id` of `None`)"""
+
+		self._lookups += 1
+
+		if mob_id is None:
+			self._resolutions += 1
+			return resolver()
+
+		key = (kind, mob_id)
+
+		if key not in self._resolved:
+			self._resolutions += 1
+			self._resolved[key] = resolver()
+
+		return self._resolved[key]
+
+	def lookups(self) -> int:
+		"""Number of lookups requested"""
+		return self._lookups
+
+	def resolutions(self) -> int:
+		"""Number of lookups that had to be resolved"""
+		return self._resolutions
+
+	def saved(self) -> int:
+		"""Number of lookups answered from the cache"""
+		return self._lookups - self._resolutions
+
+	def stats(self) -> dict[str, int]:
+		return {"lookups": self.lookups(), "resolutions": self.resolutions(), "saved": self.saved()}
+
+def _first_reference_id(component:avb.components.Component) -> str|None:
+	"""Mob ID of the first mob a component refers to, which subclips of the same clip share"""
+
+	try:
+		source, _ = next(avbutils.source_references_for_component(component))
+	except StopIteration:
+		return None
+	
+	return str(source.mob.mob_id)
+
+def _physical_source(comp:avb.trackgroups.Composition) -> tuple[bool, typing.Any, str|None]:
+	"""Whether a composition has a physical source (tape or source file), and its type and name"""
+
+	if not avbutils.sourcerefs.composition_has_physical_source(comp):
+		return False, None, None
+	
+	return True, avbutils.sourcerefs.physical_source_type_for_composition(comp), avbutils.sourcerefs.physical_source_name_for_composition(comp)
+
+def _file_source_drive(component:avb.components.Component) -> str|None:
+	"""Last known volume of the media file a component refers to"""
+
+	try:
+	# TODO: Do if comp itself is file source first, otherwise...
+		file_source_clip, offset = next(avbutils.file_references_for_component(component))
+	except StopIteration as e:
+		return None
+	
+	if isinstance(file_source_clip.mob.descriptor.locator, avb.misc.MSMLocator):
+		return file_source_clip.mob.descriptor.locator.last_known_volume
+	
+	return None
+
+def _timecode_track(mob:avb.trackgroups.Composition) -> avb.trackgroups.Track|None:
+	"""A mob's first timecode track"""
+
+	try:
+		return next(avbutils.get_tracks_from_composition(mob, type=avbutils.TrackTypes.TIMECODE, index=1))
+	except:
+		return None
+
+def mob_record_for_bin_item(bin_item:avb.bin.BinItem, resolution_cache:SourceResolutionCache|None=None) -> dict:
+	"""Resolve the info shown in the bin for a bin item
+	
+	Pass the same `resolution_cache` for every item in a bin to avoid resolving shared sources repeatedly.
+	"""
+
+	resolution_cache = resolution_cache if resolution_cache is not None else SourceResolutionCache()
+
+	bin_item_role = avbutils.BinDisplayItemTypes.from_bin_item(bin_item)
+
+	comp = bin_item.mob
+
+	tape_name = None
+	source_file_name = None
+	timecode_range = None
+	user_attributes = dict()
+	source_drive = None
+
+	if avbutils.BinDisplayItemTypes.SEQUENCE in bin_item_role:
+		timecode_range = avbutils.get_timecode_range_for_composition(comp)
+		user_attributes = comp.attributes.get("_USER",{})
+
+	else:
+
+		primary_component = avbutils.sourcerefs.primary_track_for_composition(comp).component
+		reference_id = _first_reference_id(primary_component)
+
+		has_physical_source, physical_source_type, physical_source_name = resolution_cache.resolve("physical_source", reference_id, lambda: _physical_source(comp))
+
+		if has_physical_source:
+		
+			if physical_source_type == avbutils.SourceMobRole.SOURCE_FILE:
+				source_file_name = physical_source_name
+			else:
+				tape_name = physical_source_name
+
+		# Drive info
+		if "descriptor" in comp.property_data and isinstance(comp.descriptor, avb.essence.MediaDescriptor) and isinstance(comp.descriptor.locator, avb.misc.MSMLocator):
+			source_drive = comp.descriptor.locator.last_known_volume
+		else:
+			source_drive = resolution_cache.resolve("drive", reference_id, lambda: _file_source_drive(primary_component))
+
+		# Timecode
+		# NOTE: This is all pretty sloppy here.
+		try:
+			timecode_range = avbutils.get_timecode_range_for_composition(comp)
+		except Exception as e:
+			pass
+
+		attributes_reverse = []
+		for source, offset in avbutils.source_references_for_component(primary_component):
+
+			source_mob_id = str(source.mob.mob_id)
+
+			source_attributes = resolution_cache.resolve("user_attributes", source_mob_id, lambda: source.mob.attributes.get("_USER",{}) if "attributes" in source.mob.property_data else None)
+			if source_attributes is not None:
+				attributes_reverse.append(source_attributes)
+
+			# Timecode
+			tc_track = resolution_cache.resolve("timecode_track", source_mob_id, lambda: _timecode_track(source.mob))
+
+			if tc_track is not None:
+				tc_component, offset = avbutils.resolve_base_component_from_component(tc_track.component, offset + source.start_time)
+
+				if not isinstance(tc_component, avb.components.Timecode):
+					print("Hmm",tc_component)
+					continue
+
+				timecode_range = timecode.TimecodeRange(
+					start = timecode.Timecode(tc_component.start + offset.frame_number, rate=offset.rate),
+					duration=comp.length
+				)
+		for a in reversed(attributes_reverse):
+			user_attributes.update(a)
+		if "attributes" in comp.property_data:
+			user_attributes.update(comp.attributes.get("_USER",{}))
+
+	markers = avbutils.get_markers_from_timeline(comp)
+	clip_color = avbutils.composition_clip_color(comp)
+
+	return {
+		"mob_id":          str(comp.mob_id),
+		"name":            comp.name or "",
+		"clip_color":      tuple(clip_color.as_rgb16()) if clip_color else None,
+		"timecode_range":  timecode_range,
+		"last_modified":   comp.last_modified,
+		"creation_time":   comp.creation_time,
+		"item_types":      bin_item_role,
+		"marker":          markers[0] if markers else None,
+		"tracks":          avbutils.format_track_labels(list(avbutils.get_tracks_from_composition(comp))) or None,
+		"tape":            tape_name or "",
+		"drive":           source_drive or "",
+		"source_file":     source_file_name or "",
+		"user_attributes": dict(user_attributes),
+	}
+
+def mob_records_for_bin_items(bin_items:typing.Iterable[avb.bin.BinItem], resolution_cache:SourceResolutionCache|None=None) -> list[dict]:
+	"""Records for bin items, skipping (and reporting) any that can't be resolved"""
+
+	resolution_cache = resolution_cache if resolution_cache is not None else SourceResolutionCache()
+	records = []
+
+	for bin_item in bin_items:
+		try:
+			records.append(mob_record_for_bin_item(bin_item, resolution_cache))
+		except Exception as e:
+			print(f"{e} {bin_item.mob}")
+
+	return records
+
+def open_worker_bin(bin_path:str):
+	"""Process pool initializer: open the bin once per worker process"""
+
+	global _worker_bin_handle, _worker_resolution_cache
+	_worker_bin_handle = avb.open(bin_path)
+	_worker_resolution_cache = SourceResolutionCache()
+
+def load_worker_mob_records(first_item:int, last_item:int) -> tuple[list[dict], dict[str, int]]:
+	"""Records for a range of items (exclusive) in the worker's bin, and the source resolution stats for them"""
+
+	if _worker_bin_handle is None:
+		raise RuntimeError("No bin has been opened in this worker (see `open_worker_bin()`)")
+
+	stats_before = _worker_resolution_cache.stats()
+	records = mob_records_for_bin_items(itertools.islice(_worker_bin_handle.content.items, first_item, last_item), _worker_resolution_cache)
+	stats_after = _worker_resolution_cache.stats()
+
+	return records, {stat: stats_after[stat] - stats_before[stat] for stat in stats_after}
+
+def view_settings_record(bin_view:avb.bin.BinViewSetting) -> types.SimpleNamespace:
+	"""Plain copy of a bin view setting with what the presenters use: `name`, `columns` and `property_data`
+
+	Property values are kept as they are, so the presenters see the same data from a cached
+	load as from a live one.  If any can't be pickled, the bin cache won't store the snapshot
+	and the bin is loaded live again next time.
+	"""
+
+	return types.SimpleNamespace(
+		name          = bin_view.name,
+		columns       = [dict(column) for column in bin_view.columns],
+		property_data = dict(avb.core.AVBPropertyData(bin_view.property_data)),
+	)
+
+def sift_settings_record(sift_items:typing.Iterable[avb.bin.SiftItem]) -> list[types.SimpleNamespace]:
+	"""Plain copies of bin sift settings"""
+
+	return [types.SimpleNamespace(method=sift_item.method, string=sift_item.string, column=sift_item.column) for sift_item in sift_items]
@@ -0,0 +1,227 @@
+"""
+Watch open bins for changes saved to disk
+"""
+
+import os, dataclasses
+from PySide6 import QtCore
+
+@dataclasses.dataclass
+class BinWatchStats:
+	"""Counters for the work done watching one bin"""
+
+	file_events:int = 0
+	"""Change notifications received from the file system watcher"""
+
+	polls:int = 0
+	"""Times the bin was checked by the polling fallback"""
+
+	stat_calls:int = 0
+	"""Times the bin's size and modification time were read"""
+
+	coalesced_events:int = 0
+	"""Changes folded into an already pending check"""
+
+	stability_waits:int = 0
+	"""Times the bin was still being written, so the check was put off"""
+
+	changes_reported:int = 0
+	"""Times the bin was reported as changed"""
+
+
+@dataclasses.dataclass
+class _WatchedBin:
+
+	path:str
+	signature:tuple[int,int]|None
+	"""Size and modification time when the bin was last reported (or first watched)"""
+
+	pending_signature:tuple[int,int]|None = None
+	"""Size and modification time at the previous stability check"""
+
+	timer:QtCore.QTimer|None = None
+	stats:BinWatchStats = dataclasses.field(default_factory=BinWatchStats)
+
+
+class BinWatcher(QtCore.QObject):
+	"""Report when watched bins have changed on disk
+
+	Avid saves a bin in stages, so a burst of change events is coalesced into one
+	check, and a change is only reported once the file has stopped changing.  Network
+	mounts don't always deliver change events, so bins can also be polled.
+	"""
+
+	sig_bin_changed = QtCore.Signal(str)
+	"""A watched bin has changed and finished being written"""
+
+	COALESCE_INTERVAL:int = 500
+	"""Milliseconds to wait after a change event for more before checking the bin"""
+
+	STABILITY_INTERVAL:int = 1000
+	"""Milliseconds the bin's size and modification time must stay the same before it's considered written"""
+
+	POLL_INTERVAL:int = 0
+	"""Milliseconds between polling watched bins for changes (`0` to rely on change events only)"""
+
+	def __init__(self, *args, **kwargs):
+
+		super().__init__(*args, **kwargs)
+
+		self._watched:dict[str, _WatchedBin] = {}
+
+		self._coalesce_interval  = self.COALESCE_INTERVAL
+		self._stability_interval = self.STABILITY_INTERVAL
+
+		self._fs_watcher = QtCore.QFileSystemWatcher(self)
+		self._fs_watcher.fileChanged.connect(self._fileChanged)
+
+		self._poll_timer = QtCore.QTimer(self)
+		self._poll_timer.timeout.connect(self._pollBins)
+		self.setPollInterval(self.POLL_INTERVAL)
+
+	def watchBin(self, bin_path:os.PathLike):
+		"""Start watching a bin"""
+
+		bin_path = os.path.abspath(bin_path)
+
+		if bin_path in self._watched:
+			return
+
+		watched = _WatchedBin(bin_path, None)
+		watched.signature = self._signature(watched)
+
+		watched.timer = QtCore.QTimer(self)
+		watched.timer.setSingleShot(True)
+		watched.timer.timeout.connect(lambda: self._checkBin(bin_path))
+
+		self._watched[bin_path] = watched
+		self._fs_watcher.addPath(bin_path)
+
+	def unwatchBin(self, bin_path:os.PathLike):
+		"""Stop watching a bin"""
+
+		bin_path = os.path.abspath(bin_path)
+		watched = self._watched.pop(bin_path, None)
+
+		if watched is None:
+			return
+
+		watched.timer.stop()
+		watched.timer.deleteLater()
+
+		if bin_path in self._fs_watcher.files():
+			self._fs_watcher.removePath(bin_path)
+
+	def watchedBins(self) -> list[str]:
+		return list(self._watched)
+
+	def _signature(self, watched:_WatchedBin) -> tuple[int,int]|None:
+		"""Size and modification time of a bin (`None` if it's missing)"""
+
+		watched.stats.stat_calls += 1
+
+		try:
+			stat = os.stat(watched.path)
+		except OSError:
+			return None
+
+		return stat.st_size, stat.st_mtime_ns
+
+	@QtCore.Slot(str)
+	def _fileChanged(self, bin_path:str):
+
+		watched = self._watched.get(bin_path)
+		if watched is None:
+			return
+
+		watched.stats.file_events += 1
+
+		# Saving by replacing the file drops it from the watcher
+		if bin_path not in self._fs_watcher.files() and os.path.exists(bin_path):
+			self._fs_watcher.addPath(bin_path)
+
+		self._scheduleCheck(watched, self._coalesce_interval)
+
+	@QtCore.Slot()
+	def _pollBins(self):
+
+		for watched in self._watched.values():
+
+			watched.stats.polls += 1
+
+			if not watched.timer.isActive() and self._signature(watched) != watched.signature:
+				self._scheduleCheck(watched, 0)
+
+	def _scheduleCheck(self, watched:_WatchedBin, delay:int):
+
+		if watched.timer.isActive():
+			watched.stats.coalesced_events += 1
+
+		watched.pending_signature = None
+		watched.timer.start(delay)
+
+	def _checkBin(self, bin_path:str):
+		"""Report the bin if it has changed and stopped changing, otherwise check again later"""
+
+		watched = self._watched.get(bin_path)
+		if watched is None:
+			return
+
+		signature = self._signature(watched)
+
+		# The file may have been missing mid-replace when the change event arrived, so it wasn't re-added then
+		if signature is not None and bin_path not in self._fs_watcher.files():
+			self._fs_watcher.addPath(bin_path)
+
+		# Still being written (or this is the first look since it changed)
+		if signature != watched.pending_signature:
+			watched.stats.stability_waits += 1
+			watched.pending_signature = signature
+			watched.timer.start(self._stability_interval)
+			return
+
+		watched.pending_signature = None
+
+		if signature is None or signature == watched.signature:
+			return
+
+		watched.signature = signature
+		watched.stats.changes_reported += 1
+		self.sig_bin_changed.emit(bin_path)
+
+	def coalesceInterval(self) -> int:
+		return self._coalesce_interval
+
+	def setCoalesceInterval(self, interval:int):
+		"""Set the milliseconds to wait after a change event for more before checking the bin"""
+		self._coalesce_interval = interval
+
+	def stabilityInterval(self) -> int:
+		return self._stability_interval
+
+	def setStabilityInterval(self, interval:int):
+		"""Set the milliseconds a bin must stay unchanged before it's considered written"""
+		self._stability_interval = interval
+
+	def pollInterval(self) -> int:
+		return self._poll_timer.interval() if self._poll_timer.isActive() else 0
+
+	def setPollInterval(self, interval:int):
+		"""Set the milliseconds between polling watched bins (`0` to rely on change events only, e.g. for local disks)"""
+
+		if interval > 0:
+			self._poll_timer.start(interval)
+		else:
+			self._poll_timer.stop()
+
+	def stats(self, bin_path:os.PathLike) -> BinWatchStats:
+		"""Counters for a watched bin"""
+		return self._watched[os.path.abspath(bin_path)].stats
+
+	def totalStats(self) -> BinWatchStats:
+		"""Counters summed across all watched bins"""
+
+		total = BinWatchStats()
+		for watched in self._watched.values():
+			for field in dataclasses.fields(BinWatchStats):
+				setattr(total, field.name, getattr(total, field.name) + getattr(watched.stats, field.name))
+		return total
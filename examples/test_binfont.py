@@ -1,27 +1,19 @@
 import sys
-import avb
-import itertools, pathlib
-
-def get_bin_font_info(bin_content:avb.bin.Bin) -> str:
-
-	return "\t".join([str(x) for x in [
-		bin_content.attributes.get("ATTR__BIN_FONT_NAME"),
-		bin_content.mac_font
-	]])
+from trt_model import binscanner
 
 if __name__ == "__main__":
 
 	if not len(sys.argv) > 1:	
 		sys.exit(f"Usage: {__file__} bin_path.py")
 	
-	for bin_path in pathlib.Path(sys.argv[1]).rglob("*.avb", case_sensitive=False):
+	scanner = binscanner.TRTBinScanner(["font_info"])
+
+	for scan_result in scanner.scan(sys.argv[1:]):
 
-		if bin_path.name.startswith("."):
-			continue
+		if not scan_result.succeeded():
+			print(f"{scan_result.bin_path}: {scan_result.open_error or scan_result.errors['font_info']}")
+		else:
+			font_info = scan_result.results["font_info"]
+			print("\t".join([str(font_info["font_name"]), str(font_info["mac_font"])]), "\t", scan_result.bin_path)
 	
-		with avb.open(bin_path) as bin_handle:
-			try:
-				binfo = get_bin_font_info(bin_handle.content)
-				print(binfo, "\t", bin_path)
-			except Exception as e:
-				print(f"{bin_path}: {e}")
\ No newline at end of file
+	print(scanner.stats(), file=sys.stderr)
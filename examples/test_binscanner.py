@@ -0,0 +1,47 @@
+"""
+Scan every bin in a project with any of the built-in extractors, reporting throughput as it goes
+
+Usage: test_binscanner.py [--extract NAME,...] [--processes N] [--checkpoint PATH] PROJECT_PATH [PROJECT_PATH ...]
+"""
+
+import sys, argparse
+from trt_model import binscanner
+
+REPORT_INTERVAL = 100
+"""Bins between throughput reports"""
+
+def main() -> int:
+
+	parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+	parser.add_argument("paths", nargs="+", help="Project directories or bins")
+	parser.add_argument("--extract", default=",".join(binscanner.EXTRACTORS), help=f"Extractors to run (default: all of {', '.join(binscanner.EXTRACTORS)})")
+	parser.add_argument("--processes", type=int, default=None, help="Worker processes (default: one per CPU)")
+	parser.add_argument("--checkpoint", default=None, help="Checkpoint file, so an interrupted scan can be resumed")
+	args = parser.parse_args()
+
+	scanner = binscanner.TRTBinScanner(
+		extractors      = args.extract.split(","),
+		process_count   = args.processes,
+		checkpoint_path = args.checkpoint,
+	)
+
+	for scan_result in scanner.scan(args.paths):
+
+		if scan_result.open_error:
+			print(f"{scan_result.bin_path}: {scan_result.open_error}")
+		
+		for name, error in scan_result.errors.items():
+			print(f"{scan_result.bin_path}: {name}: {error}")
+		
+		if "timelines" in scan_result.results:
+			for timeline_info in scan_result.results["timelines"]:
+				print(f"{timeline_info.timeline_name}\t{timeline_info.timeline_tc_range.duration}\t{len(timeline_info.markers)} markers\t{scan_result.bin_path}")
+
+		if scanner.stats().bins_scanned % REPORT_INTERVAL == 0:
+			print(scanner.stats(), file=sys.stderr)
+	
+	print(scanner.stats(), file=sys.stderr)
+	return 0
+
+if __name__ == "__main__":
+	sys.exit(main())
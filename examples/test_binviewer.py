@@ -1,6 +1,6 @@
-import sys, os, pathlib
+import sys, os, pathlib, typing, threading
 from PySide6 import QtCore, QtWidgets
-from trt_model import viewmodels, viewitems
+from trt_model import viewmodels, viewitems, batching
 
 
 
@@ -10,66 +10,187 @@ class BinLoaderSignals(QtCore.QObject):
 	sig_load_complete = QtCore.Signal()
 
 	sig_total_rows_determiend = QtCore.Signal(int)
-	sig_row_loaded = QtCore.Signal(dict)
-	sig_header_added = QtCore.Signal(object)
+	sig_rows_loaded = QtCore.Signal(list)
+	sig_headers_determined = QtCore.Signal(list)
+	sig_headers_added = QtCore.Signal(list)
+
+
+class DeferredPropertyViewItem(viewitems.TRTAbstractViewItem):
+	"""A mob property whose references are only walked once the item is displayed (or sorted)"""
+
+	__slots__ = ("_property_data", "_bin_lock")
+
+	def __init__(self, property_data:typing.Any, bin_lock:threading.Lock):
+
+		super().__init__(None)
+
+		self._property_data = property_data
+		self._bin_lock      = bin_lock
+	
+	def raw_data(self) -> typing.Any:
+
+		if self._property_data is not None:
+
+			import avb
+
+			# The loader may still be reading from the same bin
+			with self._bin_lock:
+				self._data = list(avb.core.walk_references(self._property_data))
+			
+			self._property_data = None
+		
+		return self._data
+	
+	def _prepare_role(self, role:QtCore.Qt.ItemDataRole) -> typing.Any:
+		self.raw_data()
+		return super()._prepare_role(role)
+	
+	def sort_key(self) -> typing.Any:
+		self.raw_data()
+		return super().sort_key()
+
+
+def item_factory_for_property(key:str, val:typing.Any) -> typing.Type[viewitems.TRTAbstractViewItem]:
+	"""The view item type used to display a mob property"""
+
+	import avb
+
+	if isinstance(val, avb.core.AVBPropertyData):
+		return DeferredPropertyViewItem
+	elif key in ["usage_code", "mob_type_id", "media_kind_id"]:
+		return viewitems.TRTEnumViewItem
+	elif key in ["creation_time","last_modified"]:
+		return viewitems.TRTDateTimeViewItem
+	else:
+		return viewitems.TRTStringViewItem
+
+def header_for_property(key:str, item_factory:typing.Type[viewitems.TRTAbstractViewItem]) -> viewitems.TRTAbstractViewHeaderItem:
+
+	return viewitems.TRTAbstractViewHeaderItem(
+		field_name   = key,
+		display_name = key.replace("_"," ").title(),
+		item_factory = item_factory,
+	)
 
 class BinLoader(QtCore.QRunnable):
+	"""Load the raw properties of every mob in a bin
 
+	The columns are worked out up front from a sample of mobs, so the view gets its
+	header layout once instead of a column inserted each time a new property turns up.
+	Properties that need their references walked are only resolved when displayed, so
+	the bin is left open for them; close it with `closeBin()` when the rows are done with,
+	which also stops the load if it's still running.
+	"""
 
+	SCHEMA_SAMPLE_SIZE:int = 256
+	"""Number of mobs, spread across the bin, sampled to determine the columns"""
 
 	def __init__(self, bin_path:os.PathLike):
 
 		super().__init__()
+		self.setAutoDelete(False)
+
 		self._bin_path = bin_path
 		self._signals = BinLoaderSignals()
+
+		self._bin_handle = None
+		self._bin_lock = threading.Lock()
+		"""Held while reading from the bin, which is shared with deferred items in the GUI thread"""
+
+		self._is_cancelled = False
 	
 	def signals(self) -> BinLoaderSignals:
 		return self._signals
 	
+	def closeBin(self):
+		"""Close the bin once deferred items no longer need it, stopping the load if it's still running"""
+
+		with self._bin_lock:
+			self._is_cancelled = True
+			if self._bin_handle is not None:
+				self._bin_handle.close()
+				self._bin_handle = None
+	
+	@classmethod
+	def _sampleSchema(cls, items:typing.Sequence) -> dict[str, typing.Type[viewitems.TRTAbstractViewItem]]:
+		"""View item types by property key, in the order they were found in a sample of bin items"""
+
+		schema = dict()
+		step = max(1, len(items) // cls.SCHEMA_SAMPLE_SIZE)
+
+		for item in items[::step][:cls.SCHEMA_SAMPLE_SIZE]:
+			for key, val in item.mob.property_data.items():
+				if key not in schema:
+					schema[key] = item_factory_for_property(key, val)
+		
+		return schema
+	
+	def _rowForMob(self, mob) -> dict[str, viewitems.TRTAbstractViewItem]:
+
+		import avbutils
+
+		item_row = dict()
+
+		for key, val in mob.property_data.items():
+
+			item_factory = item_factory_for_property(key, val)
+
+			if item_factory is DeferredPropertyViewItem:
+				val = DeferredPropertyViewItem(val, self._bin_lock)
+			elif key == "usage_code":
+				val = viewitems.TRTEnumViewItem(avbutils.MobUsage(val))
+			elif key == "mob_type_id":
+				val = viewitems.TRTEnumViewItem(avbutils.MobTypes(val))
+			elif key == "media_kind_id":
+				val = viewitems.TRTEnumViewItem(avbutils.MediaKind(val))
+			else:
+				val = item_factory(val)
+			
+			item_row[key] = val
+		
+		return item_row
+	
 	def run(self):
 		
-		import avb, avbutils
+		import avb
 
 		self.signals().sig_load_start.emit()
 
-		header_keys = set()
-		with avb.open(self._bin_path) as bin_handle:
-			#self.signals().sig_total_rows_determiend.emit(len(bin_handle.content.items))
-			for item in bin_handle.content.items:
-
-				mob = item.mob
-				item_row = dict()
-
-				for key, val in mob.property_data.items():
-
-					# Dereference property data
-					if isinstance(val, avb.core.AVBPropertyData):
-						val = list(avb.core.walk_references(val))
-
-					if key == "usage_code":
-						val = viewitems.TRTEnumViewItem(avbutils.MobUsage(val))
-					elif key == "mob_type_id":
-						val = viewitems.TRTEnumViewItem(avbutils.MobTypes(val))
-					elif key == "media_kind_id":
-						val = viewitems.TRTEnumViewItem(avbutils.MediaKind(val))
-					elif key in ["creation_time","last_modified"]:
-						val = viewitems.TRTDateTimeViewItem(val)
-					else:
-						val = viewitems.TRTStringViewItem(val)
-					
-					if key not in header_keys:
-						header_keys.add(key)
-						self._signals.sig_header_added.emit(viewitems.TRTAbstractViewHeaderItem(
-							field_name   = key,
-							display_name = key.replace("_"," ").title(),
-							item_factory = viewitems.TRTStringViewItem,
-						))
-
-					item_row.update({key:val})
-					
-				self._signals.sig_row_loaded.emit(item_row)
+		row_batcher = batching.TRTRowBatcher(self._signals.sig_rows_loaded.emit)
+
+		with self._bin_lock:
+			if self._is_cancelled:
+				return
+			self._bin_handle = avb.open(self._bin_path)
+			items = list(self._bin_handle.content.items)
+			schema = self._sampleSchema(items)
+		
+		self._signals.sig_total_rows_determiend.emit(len(items))
+		self._signals.sig_headers_determined.emit([header_for_property(key, item_factory) for key, item_factory in schema.items()])
+
+		# Properties the sample missed are added as columns once all the rows are in
+		missed_schema = dict()
+
+		for item in items:
+
+			with self._bin_lock:
+				# Closed while loading (e.g. another bin was opened)
+				if self._is_cancelled:
+					return
+				item_row = self._rowForMob(item.mob)
+
+			for key, val in item_row.items():
+				if key not in schema and key not in missed_schema:
+					missed_schema[key] = type(val)
 			
-			self._signals.sig_load_complete.emit()
+			row_batcher.add(item_row)
+		
+		row_batcher.flush()
+
+		if missed_schema:
+			self._signals.sig_headers_added.emit([header_for_property(key, item_factory) for key, item_factory in missed_schema.items()])
+
+		self._signals.sig_load_complete.emit()
 
 
 class BinViewerMainWindow(QtWidgets.QMainWindow):
@@ -119,6 +240,7 @@ class BinViewerApp(QtWidgets.QApplication):
 		self._wnd_main.resize(1024,600)
 
 		self._view_model = viewmodels.TRTTimelineViewModel()
+		self._loader:BinLoader|None = None
 		self._wnd_main.treeViewer().model().setSourceModel(self._view_model)
 
 		self._wnd_main.show()
@@ -126,20 +248,35 @@ class BinViewerApp(QtWidgets.QApplication):
 	@QtCore.Slot(str)
 	def load_bin(self, bin_path:os.PathLike):
 
+		if self._loader is not None:
+			self._loader.closeBin()
+
+		self._view_model.clear()
+
 		self._loader = BinLoader(bin_path)
 		self._loader.signals().sig_load_start.connect(lambda: self._wnd_main.setWindowFilePath(bin_path))
 		self._loader.signals().sig_load_start.connect(lambda: self._wnd_main._prog_status.setVisible(True))
 		self._loader.signals().sig_load_start.connect(lambda: self._wnd_main._lbl_status.setText(f"Loading..."))
+		self._loader.signals().sig_load_start.connect(self._view_model.beginBulkLoad)
 
 		#self._loader.signals().sig_total_rows_determiend.connect(self._wnd_main._prog_status.setMaximum)
-		self._loader.signals().sig_header_added.connect(self._view_model.addHeader)
-		self._loader.signals().sig_row_loaded.connect(self._view_model.addTimeline)
-		#self._loader.signals().sig_row_loaded.connect(lambda: self._wnd_main._prog_status.setValue(self._wnd_main._prog_status.value()+1))
+		self._loader.signals().sig_headers_determined.connect(self._view_model.setHeaders)
+		self._loader.signals().sig_headers_added.connect(self.add_headers)
+		self._loader.signals().sig_rows_loaded.connect(self._view_model.addTimelines)
+		#self._loader.signals().sig_rows_loaded.connect(lambda: self._wnd_main._prog_status.setValue(self._wnd_main._prog_status.value()+1))
 		
+		self._loader.signals().sig_load_complete.connect(self._view_model.endBulkLoad)
 		self._loader.signals().sig_load_complete.connect(lambda: self._wnd_main._prog_status.setHidden(True))
 		self._loader.signals().sig_load_complete.connect(lambda: self._wnd_main._lbl_status.setText(f"{self._wnd_main._tree_viewer.model().rowCount()} mobs loaded"))
 		
 		self._thread_pool.start(self._loader)
+	
+	@QtCore.Slot(list)
+	def add_headers(self, headers:list[viewitems.TRTAbstractViewHeaderItem]):
+		"""Append columns the loader found after the layout was set"""
+
+		for header in headers:
+			self._view_model.addHeader(header, self._view_model.columnCount())
 
 
 
@@ -175,9 +175,11 @@ class BinViewViewerApp(QtWidgets.QApplication):
 	@QtCore.Slot(object)
 	def setBinViewProperties(self, binview_datamodel:avb.bin.BinViewSetting):
 
-		self._binview_properties_viewmodel.addHeader(viewitems.TRTAbstractViewHeaderItem(field_name="value", display_name="Value", icon=QtGui.QIcon.fromTheme(QtGui.QIcon.ThemeIcon.DialogInformation)))
-		self._binview_properties_viewmodel.addHeader(viewitems.TRTAbstractViewHeaderItem(field_name="name", display_name="Name", icon=QtGui.QIcon.fromTheme(QtGui.QIcon.ThemeIcon.FormatIndentMore)))
-		self._binview_properties_viewmodel.addHeader(viewitems.TRTAbstractViewHeaderItem(field_name="order", display_name="Order", icon=QtGui.QIcon.fromTheme(QtGui.QIcon.ThemeIcon.ListAdd)))
+		self._binview_properties_viewmodel.setHeaders([
+			viewitems.TRTAbstractViewHeaderItem(field_name="order", display_name="Order", icon=QtGui.QIcon.fromTheme(QtGui.QIcon.ThemeIcon.ListAdd)),
+			viewitems.TRTAbstractViewHeaderItem(field_name="name", display_name="Name", icon=QtGui.QIcon.fromTheme(QtGui.QIcon.ThemeIcon.FormatIndentMore)),
+			viewitems.TRTAbstractViewHeaderItem(field_name="value", display_name="Value", icon=QtGui.QIcon.fromTheme(QtGui.QIcon.ThemeIcon.DialogInformation)),
+		])
 
 		for idx, (k,v) in enumerate(binview_datamodel.property_data.items()):
 			self._binview_properties_viewmodel.addTimeline({
@@ -192,10 +194,12 @@ class BinViewViewerApp(QtWidgets.QApplication):
 	@QtCore.Slot(object)
 	def setBinViewFormatDescriptors(self, binview_datamodel:avb.bin.BinViewSetting):
 
-		self._binview_descriptors_viewmodel.addHeader(viewitems.TRTAbstractViewHeaderItem(field_name="type", display_name="Type", icon=QtGui.QIcon.fromTheme(QtGui.QIcon.ThemeIcon.DocumentProperties)))
-		self._binview_descriptors_viewmodel.addHeader(viewitems.TRTAbstractViewHeaderItem(field_name="value", display_name="Value", icon=QtGui.QIcon.fromTheme(QtGui.QIcon.ThemeIcon.DialogInformation)))
-		self._binview_descriptors_viewmodel.addHeader(viewitems.TRTAbstractViewHeaderItem(field_name="name", display_name="Name", icon=QtGui.QIcon.fromTheme(QtGui.QIcon.ThemeIcon.FormatIndentMore)))
-		self._binview_descriptors_viewmodel.addHeader(viewitems.TRTAbstractViewHeaderItem(field_name="column_id", display_name="Column ID", icon=QtGui.QIcon.fromTheme(QtGui.QIcon.ThemeIcon.ListAdd)))
+		self._binview_descriptors_viewmodel.setHeaders([
+			viewitems.TRTAbstractViewHeaderItem(field_name="column_id", display_name="Column ID", icon=QtGui.QIcon.fromTheme(QtGui.QIcon.ThemeIcon.ListAdd)),
+			viewitems.TRTAbstractViewHeaderItem(field_name="name", display_name="Name", icon=QtGui.QIcon.fromTheme(QtGui.QIcon.ThemeIcon.FormatIndentMore)),
+			viewitems.TRTAbstractViewHeaderItem(field_name="value", display_name="Value", icon=QtGui.QIcon.fromTheme(QtGui.QIcon.ThemeIcon.DialogInformation)),
+			viewitems.TRTAbstractViewHeaderItem(field_name="type", display_name="Type", icon=QtGui.QIcon.fromTheme(QtGui.QIcon.ThemeIcon.DocumentProperties)),
+		])
 
 		import json
 
@@ -221,11 +225,13 @@ class BinViewViewerApp(QtWidgets.QApplication):
 
 		
 
-		self._binview_columns_viewmodel.addHeader(viewitems.TRTAbstractViewHeaderItem("hidden", "Hidden", icon=QtGui.QIcon.fromTheme(QtGui.QIcon.ThemeIcon.EditFind)))
-		self._binview_columns_viewmodel.addHeader(viewitems.TRTAbstractViewHeaderItem("type", "Type", icon=QtGui.QIcon.fromTheme(QtGui.QIcon.ThemeIcon.DocumentProperties)))
-		self._binview_columns_viewmodel.addHeader(viewitems.TRTAbstractViewHeaderItem("format", "Format", icon=QtGui.QIcon.fromTheme(QtGui.QIcon.ThemeIcon.FormatTextItalic)))
-		self._binview_columns_viewmodel.addHeader(viewitems.TRTAbstractViewHeaderItem("title", "Name", icon=QtGui.QIcon.fromTheme(QtGui.QIcon.ThemeIcon.FormatIndentMore)))
-		self._binview_columns_viewmodel.addHeader(viewitems.TRTAbstractViewHeaderItem("order", "Order", icon=QtGui.QIcon.fromTheme(QtGui.QIcon.ThemeIcon.ListAdd)))
+		self._binview_columns_viewmodel.setHeaders([
+			viewitems.TRTAbstractViewHeaderItem("order", "Order", icon=QtGui.QIcon.fromTheme(QtGui.QIcon.ThemeIcon.ListAdd)),
+			viewitems.TRTAbstractViewHeaderItem("title", "Name", icon=QtGui.QIcon.fromTheme(QtGui.QIcon.ThemeIcon.FormatIndentMore)),
+			viewitems.TRTAbstractViewHeaderItem("format", "Format", icon=QtGui.QIcon.fromTheme(QtGui.QIcon.ThemeIcon.FormatTextItalic)),
+			viewitems.TRTAbstractViewHeaderItem("type", "Type", icon=QtGui.QIcon.fromTheme(QtGui.QIcon.ThemeIcon.DocumentProperties)),
+			viewitems.TRTAbstractViewHeaderItem("hidden", "Hidden", icon=QtGui.QIcon.fromTheme(QtGui.QIcon.ThemeIcon.EditFind)),
+		])
 		
 		for idx, column in enumerate(binview_datamodel.property_data["columns"]):
 			self._binview_columns_viewmodel.addTimeline({
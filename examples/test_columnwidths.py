@@ -1,25 +1,18 @@
 import sys
-import avb
-import pathlib
-
-def get_bin_column_width_info(bin_content:avb.bin.Bin) -> str:
-
-	import json
-	return json.loads(bin_content.attributes.get("BIN_COLUMNS_WIDTHS").decode("utf-8"))
+from trt_model import binscanner
 
 if __name__ == "__main__":
 
 	if not len(sys.argv) > 1:	
 		sys.exit(f"Usage: {__file__} bin_path.py")
 	
-	for bin_path in pathlib.Path(sys.argv[1]).rglob("*.avb", case_sensitive=False):
+	scanner = binscanner.TRTBinScanner(["column_widths"])
+
+	for scan_result in scanner.scan(sys.argv[1:]):
 
-		if bin_path.name.startswith("."):
-			continue
+		if not scan_result.succeeded():
+			print(f"{scan_result.bin_path}: {scan_result.open_error or scan_result.errors['column_widths']}")
+		else:
+			print(scan_result.results["column_widths"], "\t", scan_result.bin_path)
 	
-		with avb.open(bin_path) as bin_handle:
-			try:
-				binfo = get_bin_column_width_info(bin_handle.content)
-				print(binfo, "\t", bin_path)
-			except Exception as e:
-				print(f"{bin_path}: {e}")
\ No newline at end of file
+	print(scanner.stats(), file=sys.stderr)
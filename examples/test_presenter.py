@@ -3,10 +3,11 @@ This spiraled out of control into an Avid bin viewer
 I'll eventually pull this out and into its own project
 """
 
-import sys, os, enum
+import sys, os, enum, typing, concurrent.futures, multiprocessing
 import avb, avbutils, timecode
+import binrecords, bincache, binwatcher
 from PySide6 import QtCore, QtGui, QtWidgets
-from trt_model import presenters, viewitems, viewmodels, delegates
+from trt_model import presenters, viewitems, viewmodels, delegates, batching
 
 class PushButtonAction(QtWidgets.QPushButton):
 	"""A QPushButton with Action support"""
@@ -553,6 +554,7 @@ class BinTreeView(QtWidgets.QTreeView):
 		self.header().setFirstSectionMovable(True)
 		self.header().setDefaultAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
 
+		# One assignment per layout change: `setHeaders()` inserts all columns (or resets the model) in one go
 		self.model().columnsInserted.connect(
 			lambda parent_index, source_start, source_end:
 			self.assignItemDelegates(parent_index, source_start)
@@ -561,6 +563,9 @@ class BinTreeView(QtWidgets.QTreeView):
 			lambda source_parent, source_logical_start, source_logical_end, destination_parent, destination_logical_start:	# NOTE: Won't work for heirarchical models
 			self.assignItemDelegates(destination_parent, min(source_logical_start, destination_logical_start))
 		)
+		self.model().modelReset.connect(
+			lambda: self.assignItemDelegates(QtCore.QModelIndex(), 0)
+		)
 
 	@QtCore.Slot(object, int, int)
 	def assignItemDelegates(self, parent_index:QtCore.QModelIndex, logical_start_column:int):
@@ -584,7 +589,8 @@ class BinTreeView(QtWidgets.QTreeView):
 			elif format_id in self.ITEM_DELEGATES_PER_FORMAT_ID:
 				item_delegate = self.ITEM_DELEGATES_PER_FORMAT_ID[format_id]
 			
-			self.setItemDelegateForColumn(col, item_delegate)
+			if self.itemDelegateForColumn(col) is not item_delegate:
+				self.setItemDelegateForColumn(col, item_delegate)
 
 	def columnDisplayNames(self) -> list[str]:
 		"""Get all column display names, in order"""
@@ -640,6 +646,17 @@ class BinTreeView(QtWidgets.QTreeView):
 
 		self.sortByColumn(header_index, sort_order)
 		return True
+	
+	@QtCore.Slot(object)
+	def sortByColumnNames(self, sorting:list[tuple[QtCore.Qt.SortOrder, str]]):
+		"""Sort by several columns' display names in one pass (the last one is the primary sort)"""
+
+		self.model().setSortSpecification(sorting)
+
+		# Show the primary sort without the header re-sorting by that column alone
+		self.header().blockSignals(True)
+		self.header().setSortIndicator(self.model().sortColumn(), self.model().sortOrder())
+		self.header().blockSignals(False)
 
 	def sizeHintForColumn(self, column):
 		return super().sizeHintForColumn(column) + 24
@@ -656,20 +673,17 @@ class BinViewColumDefinitionsPresenter(presenters.LBItemDefinitionView):
 	def setBinView(self, bin_view:avb.bin.BinViewSetting):
 		self.viewModel().clear()
 
-		headers = [
+		self.setHeaders([
 			viewitems.TRTAbstractViewHeaderItem("order", "Order"),
 			viewitems.TRTAbstractViewHeaderItem("title", "Title"),
 			viewitems.TRTAbstractViewHeaderItem("format", "Format"),
 			viewitems.TRTAbstractViewHeaderItem("type", "Type"),
 			viewitems.TRTAbstractViewHeaderItem("hidden", "Is Hidden"),
-		]
-		
-		for header in headers[::-1]:
-			super().addHeader(header)
+		])
 
+		# Annotate copies: the loader may still be pickling these same columns into the bin cache
 		for idx, column in enumerate(bin_view.columns):
-			column.update({"order": idx})
-			self.addColumnDefinition(column)
+			self.addColumnDefinition(dict(column, order=idx))
 
 	@QtCore.Slot(object)
 	def addColumnDefinition(self, column_definition:dict[str,object]):
@@ -684,13 +698,10 @@ class BinViewPropertyDataPresenter(presenters.LBItemDefinitionView):
 
 		self.viewModel().clear()
 
-		headers = [
+		self.setHeaders([
 			viewitems.TRTAbstractViewHeaderItem("name", "Name"),
 			viewitems.TRTAbstractViewHeaderItem("value", "Value"),
-		]
-		
-		for header in headers[::-1]:
-			self.addHeader(header)
+		])
 		
 		for key,val in bin_view.property_data.items():
 			self.addRow({"name": key, "value": val})
@@ -765,14 +776,11 @@ class BinSortingPropertiesPresenter(presenters.LBItemDefinitionView):
 		
 		self.viewModel().clear()
 
-		headers = [
+		self.setHeaders([
 			viewitems.TRTAbstractViewHeaderItem("order", "Order"),
 			viewitems.TRTAbstractViewHeaderItem("direction", "Direction"),
 			viewitems.TRTAbstractViewHeaderItem("column", "Column")
-		]
-
-		for header in headers[::-1]:
-			self.addHeader(header)
+		])
 		
 		for order, (direction, column_name) in enumerate(sorting):
 			self.addRow({
@@ -791,9 +799,11 @@ class BinSiftSettingsPresenter(presenters.LBItemDefinitionView):
 	def setSiftSettings(self, sift_enabled:bool, sift_settings:list[avb.bin.SiftItem]):
 		self.sig_sift_enabled.emit(sift_enabled)
 
-		self.addHeader(viewitems.TRTAbstractViewHeaderItem(field_name="string", display_name="String"))
-		self.addHeader(viewitems.TRTAbstractViewHeaderItem(field_name="method", display_name="Method"))
-		self.addHeader(viewitems.TRTAbstractViewHeaderItem(field_name="column", display_name="Column"))
+		self.setHeaders([
+			viewitems.TRTAbstractViewHeaderItem(field_name="column", display_name="Column"),
+			viewitems.TRTAbstractViewHeaderItem(field_name="method", display_name="Method"),
+			viewitems.TRTAbstractViewHeaderItem(field_name="string", display_name="String"),
+		])
 		for idx, setting in enumerate(sift_settings):
 			self.addRow({
 				"order": idx,
@@ -808,26 +818,109 @@ class BinContentsPresenter(presenters.LBItemDefinitionView):
 	def setBinView(self, bin_view:avb.bin.BinViewSetting):
 
 		self.viewModel().clear()
+		self.clearMobs()
+
+		self.setHeaders(
+			viewitems.TRTAbstractViewHeaderItem(
+				field_name="40_"+column["title"] if column["type"] == 40 else str(column["type"]),
+				field_id=column["type"],
+				format_id=column["format"],
+				display_name=column["title"],
+			)
+			for column in bin_view.columns if not column["hidden"]
+		)
+	
+	def __init__(self, *args, **kwargs):
 
-		for column in bin_view.columns[::-1]:
+		super().__init__(*args, **kwargs)
 
-			if column["hidden"]:
-				continue
+		self._loaded_mobs:list[tuple[str, typing.Any]] = []
+		"""Mob ID and last modified date of each row, in view model order"""
 
-			self.addHeader(
-				viewitems.TRTAbstractViewHeaderItem(
-					field_name="40_"+column["title"] if column["type"] == 40 else str(column["type"]),
-					field_id=column["type"],
-					format_id=column["format"],
-					display_name=column["title"],
-				)
-			)
-	
 	@QtCore.Slot(object)
 	def addMob(self, mob_info:dict):
-		self.addRow(mob_info)
+		self.addMobs([mob_info])
+	
+	@QtCore.Slot(object)
+	def addMobs(self, mob_infos:list[dict]):
+		self._loaded_mobs.extend(self._mobVersion(mob_info) for mob_info in mob_infos)
+		self.addRows(mob_infos)
+	
+	@staticmethod
+	def _mobVersion(mob_info:dict) -> tuple[str, typing.Any]:
+		return mob_info.get(MOB_ID_FIELD), mob_info.get(avbutils.BIN_COLUMN_ROLES["Modified Date"])
+	
+	@QtCore.Slot(object)
+	def updateMobs(self, mob_infos:list[dict]):
+		"""Bring the contents up to date with a fresh load of the bin, only touching rows whose mobs were added, removed or modified"""
+
+		view_model   = self.viewModel()
+		reloaded     = {mob_info.get(MOB_ID_FIELD): mob_info for mob_info in mob_infos}
+		loaded_ids   = set(mob_id for mob_id, _ in self._loaded_mobs)
 
+		# Remove from the bottom up, one notification per run of adjacent rows
+		row = len(self._loaded_mobs) - 1
+		while row >= 0:
 
+			if self._loaded_mobs[row][0] in reloaded:
+				row -= 1
+				continue
+
+			last_row = row
+			while row >= 0 and self._loaded_mobs[row][0] not in reloaded:
+				row -= 1
+			
+			view_model.removeTimelines(row + 1, last_row)
+			del self._loaded_mobs[row + 1:last_row + 1]
+		
+		# Update modified mobs in place
+		for row, (mob_id, last_modified) in enumerate(self._loaded_mobs):
+
+			mob_info = reloaded[mob_id]
+
+			if self._mobVersion(mob_info) != (mob_id, last_modified):
+				view_model.setTimeline(row, self._processRow(mob_info))
+				self._loaded_mobs[row] = self._mobVersion(mob_info)
+		
+		# New mobs go on the end
+		self.addMobs([mob_info for mob_id, mob_info in reloaded.items() if mob_id not in loaded_ids])
+	
+	def clearMobs(self):
+		self._loaded_mobs = []
+
+
+
+MOB_ID_FIELD:str = "mob_id"
+"""Field holding each row's mob ID (not shown as a column)"""
+
+def mob_info_from_record(record:dict) -> dict:
+	"""Bin contents row from a plain mob record (see `binrecords`)"""
+
+	timecode_range = record["timecode_range"]
+
+	mob_info = {
+		MOB_ID_FIELD: record["mob_id"],
+		avbutils.BIN_COLUMN_ROLES["Name"]: record["name"],
+		avbutils.BIN_COLUMN_ROLES["Color"]: viewitems.TRTClipColorViewItem(QtGui.QColor.fromRgba64(*record["clip_color"]) if record["clip_color"] else None),
+		avbutils.BIN_COLUMN_ROLES["Start"]: timecode_range.start if timecode_range else "",
+		avbutils.BIN_COLUMN_ROLES["End"]: timecode_range.end if timecode_range else "",
+		avbutils.BIN_COLUMN_ROLES["Duration"]: viewitems.TRTDurationViewItem(timecode_range.duration) if timecode_range else "",
+		avbutils.BIN_COLUMN_ROLES["Modified Date"]: record["last_modified"],
+		avbutils.BIN_COLUMN_ROLES["Creation Date"]: record["creation_time"],
+		avbutils.BIN_COLUMN_ROLES[""]: record["item_types"],
+		avbutils.BIN_COLUMN_ROLES["Marker"]: viewitems.TRTMarkerViewItem(record["marker"]) if record["marker"] else None,
+		avbutils.BIN_COLUMN_ROLES["Tracks"]: record["tracks"],
+		avbutils.BIN_COLUMN_ROLES["Tape"]: record["tape"],
+		avbutils.BIN_COLUMN_ROLES["Drive"]: record["drive"],
+		avbutils.BIN_COLUMN_ROLES["Source File"]: record["source_file"],
+		avbutils.BIN_COLUMN_ROLES["Scene"]: record["user_attributes"].get("Scene") or "",
+		avbutils.BIN_COLUMN_ROLES["Take"]: record["user_attributes"].get("Take") or "",
+	}
+
+	for key, val in record["user_attributes"].items():
+		mob_info.update({"40_"+key: val})
+	
+	return mob_info
 
 class BinViewLoader(QtCore.QRunnable):
 	"""Load a given bin"""
@@ -839,19 +932,87 @@ class BinViewLoader(QtCore.QRunnable):
 		sig_got_bin_appearance_settings = QtCore.Signal(object, object, object, object, object, object, object)
 		sig_got_display_options = QtCore.Signal(object)
 		sig_got_view_settings = QtCore.Signal(object)
-		sig_got_mob = QtCore.Signal(object)
+		sig_got_mobs = QtCore.Signal(object)
+		sig_got_all_mobs = QtCore.Signal(object)
+		sig_got_resolution_stats = QtCore.Signal(object)
 		sig_got_sort_settings = QtCore.Signal(object)
 		sig_got_sift_settings = QtCore.Signal(bool, object)
 		sig_done_loading = QtCore.Signal()
 
-	def __init__(self, bin_path:os.PathLike, *args, **kwargs):
+	PROCESS_CHUNK_SIZE:int = 250
+	"""Number of bin items each worker process resolves at a time"""
+
+	PROCESS_MIN_ITEMS:int = 2000
+	"""Bins with fewer items than this are loaded in this thread, as starting worker processes would take longer"""
+
+	MOB_BATCH_SIZE:int = 500
+	"""Maximum number of mobs sent to the GUI thread at once"""
+
+	MOB_BATCH_INTERVAL:int = 100
+	"""Milliseconds after which mobs are sent to the GUI thread, even if the batch isn't full"""
+
+	def __init__(self, bin_path:os.PathLike, process_count:int=0, bin_cache:bincache.BinCache|None=None, collect_mobs:bool=False, *args, **kwargs):
 		super().__init__(*args, **kwargs)
 		self._bin_path = bin_path
+		self._process_count = process_count
+		"""Number of worker processes to resolve bin items with (`0` to load everything in this thread)"""
+		self._bin_cache = bin_cache
+		"""Cache of previously parsed bins, if any"""
+		self._bin_snapshot = {"record_version": binrecords.RECORD_VERSION, "mob_records": []}
+		"""Plain copy of everything loaded from the bin, for the bin cache"""
 		self._signals  = self.Signals()
+
+		self._resolution_cache = binrecords.SourceResolutionCache()
+		"""Source lookups shared by all mobs loaded in this thread"""
+
+		self._resolution_stats:dict[str, int] = {}
+		"""Source lookups made by worker processes"""
+
+		self._collected_mobs:list[dict]|None = [] if collect_mobs else None
+		"""All mobs, to emit at once with `sig_got_all_mobs` once loading is done (e.g. for diffing against a previous load)"""
+
+		self._mob_batcher = batching.TRTRowBatcher(
+			self._collected_mobs.extend if collect_mobs else self._signals.sig_got_mobs.emit,
+			max_rows=self.MOB_BATCH_SIZE,
+			max_interval=self.MOB_BATCH_INTERVAL
+		)
 	
 	def run(self):
 		self._signals.sig_begin_loading.emit()
 
+		fingerprint = bincache.BinFingerprint.from_path(self._bin_path) if self._bin_cache is not None else None
+		bin_snapshot = self._bin_cache.load(fingerprint) if fingerprint is not None else None
+
+		if bin_snapshot is not None and bin_snapshot.get("record_version") == binrecords.RECORD_VERSION:
+			self._loadBinSnapshot(bin_snapshot)
+		
+		else:
+			self._loadBin()
+
+			if fingerprint is not None:
+				self._bin_cache.store(fingerprint, self._bin_snapshot)
+		
+		if self._collected_mobs is not None:
+			self._signals.sig_got_all_mobs.emit(self._collected_mobs)
+		
+		self._signals.sig_done_loading.emit()
+	
+	def _loadBinSnapshot(self, bin_snapshot:dict):
+		"""Load everything from a cached snapshot, without opening the bin"""
+
+		self._signals.sig_got_display_options.emit(bin_snapshot["display_options"])
+		self._signals.sig_got_view_settings.emit(bin_snapshot["view_settings"])
+		self._signals.sig_got_display_mode.emit(bin_snapshot["display_mode"])
+		self._signals.sig_got_sift_settings.emit(*bin_snapshot["sift_settings"])
+		self._signals.sig_got_sort_settings.emit(bin_snapshot["sort_settings"])
+		self._signals.sig_got_bin_appearance_settings.emit(*bin_snapshot["appearance_settings"])
+
+		self._mob_batcher.extend(mob_info_from_record(record) for record in bin_snapshot["mob_records"])
+		self._mob_batcher.flush()
+	
+	def _loadBin(self):
+		"""Parse everything from the bin itself"""
+
 		with avb.open(self._bin_path) as bin_handle:
 			
 			self._loadBinDisplayItemTypes(bin_handle.content)
@@ -861,18 +1022,30 @@ class BinViewLoader(QtCore.QRunnable):
 			self._loadBinSorting(bin_handle.content.sort_columns)
 			self._loadBinAppearanceSettings(bin_handle.content)
 			
-			for bin_item in bin_handle.content.items:
-				try:
-					self._loadCompositionMob(bin_item)
-				except Exception as e:
-					print(f"{e} {bin_item.mob}")
+			item_count = len(bin_handle.content.items)
+
+			if self._process_count > 1 and item_count >= self.PROCESS_MIN_ITEMS:
+				self._loadCompositionMobsInProcesses(item_count)
+			
+			else:
+				for bin_item in bin_handle.content.items:
+					try:
+						self._loadCompositionMob(bin_item)
+					except Exception as e:
+						print(f"{e} {bin_item.mob}")
+			
+			self._mob_batcher.flush()
 		
-		self._signals.sig_done_loading.emit()
+		# Report how much work shared source lookups saved
+		for stat, count in self._resolution_cache.stats().items():
+			self._resolution_stats[stat] = self._resolution_stats.get(stat, 0) + count
+		self._signals.sig_got_resolution_stats.emit(self._resolution_stats)
 
 	def _loadBinDisplayMode(self, bin_content:avb.bin.Bin):
 		"""Load the display mode"""
 
-		self.signals().sig_got_display_mode.emit(avbutils.BinDisplayModes.get_mode_from_bin(bin_content))
+		self._bin_snapshot["display_mode"] = avbutils.BinDisplayModes.get_mode_from_bin(bin_content)
+		self.signals().sig_got_display_mode.emit(self._bin_snapshot["display_mode"])
 
 	def _loadBinAppearanceSettings(self, bin_content:avb.bin.Bin):
 		"""General and misc appearance settings stored around the bin"""
@@ -892,7 +1065,7 @@ class BinViewLoader(QtCore.QRunnable):
 		except:
 			bin_column_widths = {}
 
-		self.signals().sig_got_bin_appearance_settings.emit(
+		self._bin_snapshot["appearance_settings"] = (
 			bin_font,
 			bin_content.mac_font_size,
 			bin_content.forground_color,
@@ -901,133 +1074,52 @@ class BinViewLoader(QtCore.QRunnable):
 			bin_content.home_rect,
 			bin_content.was_iconic,
 		)
+
+		self.signals().sig_got_bin_appearance_settings.emit(*self._bin_snapshot["appearance_settings"])
 		
 	def _loadBinDisplayItemTypes(self, bin_content:avb.bin.Bin):
-		self._signals.sig_got_display_options.emit(avbutils.BinDisplayItemTypes.get_options_from_bin(bin_content))
+		self._bin_snapshot["display_options"] = avbutils.BinDisplayItemTypes.get_options_from_bin(bin_content)
+		self._signals.sig_got_display_options.emit(self._bin_snapshot["display_options"])
 	
 	def _loadBinView(self, bin_content:avb.bin.Bin):
 		
-		bin_view = bin_content.view_setting
-		bin_view.property_data = avb.core.AVBPropertyData(bin_view.property_data) # Dereference before closing file
-		
-		self._signals.sig_got_view_settings.emit(bin_view)
+		# Plain copy, dereferenced before closing the file
+		self._bin_snapshot["view_settings"] = binrecords.view_settings_record(bin_content.view_setting)
+		self._signals.sig_got_view_settings.emit(self._bin_snapshot["view_settings"])
 	
 	def _loadBinSiftSettings(self, is_sifted:bool, sifted_settings:list[avb.bin.SiftItem]):
-		self._signals.sig_got_sift_settings.emit(is_sifted, sifted_settings)
+		self._bin_snapshot["sift_settings"] = (bool(is_sifted), binrecords.sift_settings_record(sifted_settings))
+		self._signals.sig_got_sift_settings.emit(*self._bin_snapshot["sift_settings"])
 	
 	def _loadBinSorting(self, bin_sorting:list):
-		self.signals().sig_got_sort_settings.emit(bin_sorting)
+		self._bin_snapshot["sort_settings"] = [tuple(sort_column) for sort_column in bin_sorting]
+		self.signals().sig_got_sort_settings.emit(self._bin_snapshot["sort_settings"])
 
 	def _loadCompositionMob(self, bin_item:avb.bin.BinItem):
+		mob_record = binrecords.mob_record_for_bin_item(bin_item, self._resolution_cache)
+		self._bin_snapshot["mob_records"].append(mob_record)
+		self._mob_batcher.add(mob_info_from_record(mob_record))
+	
+	def _loadCompositionMobsInProcesses(self, item_count:int):
+		"""Resolve bin items in a pool of worker processes, in chunks, and emit them in bin order"""
+
+		chunks = [(first_item, min(first_item + self.PROCESS_CHUNK_SIZE, item_count)) for first_item in range(0, item_count, self.PROCESS_CHUNK_SIZE)]
+
+		# Spawn rather than fork: forking a process running Qt threads isn't safe
+		with concurrent.futures.ProcessPoolExecutor(
+			max_workers = self._process_count,
+			mp_context  = multiprocessing.get_context("spawn"),
+			initializer = binrecords.open_worker_bin,
+			initargs    = (str(self._bin_path),),
+		) as executor:
 			
-			#if not bin_item.user_placed:
-			#	return
-			
-			bin_item_role = avbutils.BinDisplayItemTypes.from_bin_item(bin_item)
-			#print(display_options)
-
-			comp = bin_item.mob
+			for records, resolution_stats in executor.map(binrecords.load_worker_mob_records, *zip(*chunks)):
 
-
-			tape_name = None
-			source_file_name = None
-			timecode_range = None
-			user_attributes = dict()
-			source_drive = None
-
-			if avbutils.BinDisplayItemTypes.SEQUENCE in bin_item_role:
-				timecode_range = avbutils.get_timecode_range_for_composition(comp)
-				user_attributes = comp.attributes.get("_USER",{})
-
-			else:
-
-				#primary_track = avbutils.format_track_label(avbutils.sourcerefs.primary_track_for_composition(comp))
-
-				if avbutils.sourcerefs.composition_has_physical_source(comp):
-				
-					if avbutils.sourcerefs.physical_source_type_for_composition(comp) == avbutils.SourceMobRole.SOURCE_FILE:
-						source_file_name = avbutils.sourcerefs.physical_source_name_for_composition(comp)
-					else:
-						tape_name = avbutils.sourcerefs.physical_source_name_for_composition(comp)
+				for stat, count in resolution_stats.items():
+					self._resolution_stats[stat] = self._resolution_stats.get(stat, 0) + count
 				
-				# Drive info
-				if "descriptor" in comp.property_data and isinstance(comp.descriptor, avb.essence.MediaDescriptor) and isinstance(comp.descriptor.locator, avb.misc.MSMLocator):
-					source_drive = comp.descriptor.locator.last_known_volume
-				else:
-					try:
-					# TODO: Do if comp itself is file source first, otherwise...
-						file_source_clip, offset = next(avbutils.file_references_for_component(avbutils.primary_track_for_composition(comp).component))
-					except StopIteration as e:
-						#print("No file soruce:",comp)
-						pass
-					else:
-						if isinstance(file_source_clip.mob.descriptor.locator, avb.misc.MSMLocator):
-							source_drive = file_source_clip.mob.descriptor.locator.last_known_volume
-							#print(source_drive)
-				
-				# Timecode
-				# NOTE: This is all pretty sloppy here.
-				try:
-					timecode_range = avbutils.get_timecode_range_for_composition(comp)
-				except Exception as e:
-					pass
-
-				attributes_reverse = []
-				for source, offset in avbutils.source_references_for_component(avbutils.sourcerefs.primary_track_for_composition(comp).component):
-					
-					if "attributes" in source.mob.property_data:
-						attributes_reverse.append(source.mob.attributes.get("_USER",{}))
-					
-					# Timecode
-					try:
-						tc_track = next(avbutils.get_tracks_from_composition(source.mob, type=avbutils.TrackTypes.TIMECODE, index=1))
-					except:
-						pass
-					else:
-						tc_component, offset = avbutils.resolve_base_component_from_component(tc_track.component, offset + source.start_time)
-						
-						if not isinstance(tc_component, avb.components.Timecode):
-							print("Hmm",tc_component)
-							continue
-						
-						timecode_range = timecode.TimecodeRange(
-							start = timecode.Timecode(tc_component.start + offset.frame_number, rate=offset.rate),
-							duration=comp.length
-						)
-				for a in reversed(attributes_reverse):
-					user_attributes.update(a)
-				if "attributes" in comp.property_data:
-					user_attributes.update(comp.attributes.get("_USER",{}))
-
-
-					
-
-
-			markers = avbutils.get_markers_from_timeline(comp)
-			#print(comp.property_data)
-
-			item = {
-				avbutils.BIN_COLUMN_ROLES["Name"]: comp.name or "",
-				avbutils.BIN_COLUMN_ROLES["Color"]: viewitems.TRTClipColorViewItem(avbutils.composition_clip_color(comp) if avbutils.composition_clip_color(comp) else None),
-				avbutils.BIN_COLUMN_ROLES["Start"]: timecode_range.start if timecode_range else "",
-				avbutils.BIN_COLUMN_ROLES["End"]: timecode_range.end if timecode_range else "",
-				avbutils.BIN_COLUMN_ROLES["Duration"]: viewitems.TRTDurationViewItem(timecode_range.duration) if timecode_range else "",
-				avbutils.BIN_COLUMN_ROLES["Modified Date"]: comp.last_modified,
-				avbutils.BIN_COLUMN_ROLES["Creation Date"]: comp.creation_time,
-				avbutils.BIN_COLUMN_ROLES[""]: bin_item_role,
-				avbutils.BIN_COLUMN_ROLES["Marker"]: viewitems.TRTMarkerViewItem(markers[0]) if markers else None,
-				avbutils.BIN_COLUMN_ROLES["Tracks"]: avbutils.format_track_labels(list(avbutils.get_tracks_from_composition(comp))) or None,
-				avbutils.BIN_COLUMN_ROLES["Tape"]: tape_name or "",
-				avbutils.BIN_COLUMN_ROLES["Drive"]: source_drive or "",
-				avbutils.BIN_COLUMN_ROLES["Source File"]: source_file_name or "",
-				avbutils.BIN_COLUMN_ROLES["Scene"]: user_attributes.get("Scene") or "",
-				avbutils.BIN_COLUMN_ROLES["Take"]: user_attributes.get("Take") or "",
-			}
-
-			for key, val in user_attributes.items():
-				item.update({"40_"+key: val})
-			
-			self._signals.sig_got_mob.emit(item)
+				self._bin_snapshot["mob_records"].extend(records)
+				self._mob_batcher.extend(mob_info_from_record(record) for record in records)
 
 	
 	def signals(self) -> Signals:
@@ -1046,6 +1138,17 @@ class MainApplication(QtWidgets.QApplication):
 		
 		self._threadpool = QtCore.QThreadPool(self)
 
+		# Previously parsed bins, so unchanged bins open without parsing
+		self._bin_cache = bincache.BinCache(os.path.join(QtCore.QStandardPaths.writableLocation(QtCore.QStandardPaths.StandardLocation.CacheLocation), "bin_cache.sqlite"))
+
+		# Notices when the open bin is saved (set a poll interval for network mounts that don't report changes)
+		self._bin_watcher = binwatcher.BinWatcher(self)
+		self._bin_watcher.sig_bin_changed.connect(self.binChangedOnDisk)
+
+		self._is_loading = False
+		self._reload_pending = False
+		"""Whether a load is running, and whether the bin changed again during it (and needs reloading after)"""
+
 		# Actions
 		self._act_open = QtGui.QAction("Open Bin...", self)
 		self._act_open.setIcon(QtGui.QIcon.fromTheme(QtGui.QIcon.ThemeIcon.DocumentOpen))
@@ -1053,6 +1156,12 @@ class MainApplication(QtWidgets.QApplication):
 		self._act_open.setShortcut(QtGui.QKeySequence.StandardKey.Open)
 		self._act_open.triggered.connect(self.browseForBin)
 
+		self._act_reload = QtGui.QAction("Reload Bin", self)
+		self._act_reload.setIcon(QtGui.QIcon.fromTheme(QtGui.QIcon.ThemeIcon.ViewRefresh))
+		self._act_reload.setToolTip("Update the bin contents with any changes saved since it was opened")
+		self._act_reload.setShortcut(QtGui.QKeySequence.StandardKey.Refresh)
+		self._act_reload.triggered.connect(self.reloadBin)
+
 		self._act_quit = QtGui.QAction("Quit")
 		self._act_quit.setIcon(QtGui.QIcon.fromTheme(QtGui.QIcon.ThemeIcon.ApplicationExit))
 		self._act_quit.setShortcut(QtGui.QKeySequence.StandardKey.Quit)
@@ -1061,6 +1170,7 @@ class MainApplication(QtWidgets.QApplication):
 
 		self._actgrp_file = QtGui.QActionGroup(self)
 		self._actgrp_file.addAction(self._act_open)
+		self._actgrp_file.addAction(self._act_reload)
 		self._actgrp_file.addAction(self._act_quit)
 
 
@@ -1201,6 +1311,7 @@ class MainApplication(QtWidgets.QApplication):
 
 		self._mnu_file = QtWidgets.QMenu("&File")
 		self._mnu_file.addAction(self._act_open)
+		self._mnu_file.addAction(self._act_reload)
 		self._mnu_file.addAction(self._act_quit)
 
 		self._mnu_view = QtWidgets.QMenu("&View")
@@ -1347,22 +1458,23 @@ class MainApplication(QtWidgets.QApplication):
 	@QtCore.Slot(object)
 	def sortBinContents(self, sorting:list[tuple[QtCore.Qt.SortOrder, str]]):
 		
-		# Get column names from treeview
-		names = []
-		for column in range(self._tree_bin_contents.header().count()):
-			names.append(self._tree_bin_contents.model().headerData(column, QtCore.Qt.Orientation.Horizontal, QtCore.Qt.ItemDataRole.DisplayRole))
-
-		#print(names)
-
-		for direction, column_name in sorting:
-			self._tree_bin_contents.sortByColumnName(column_name, direction)
+		self._tree_bin_contents.sortByColumnNames(sorting)
 
 	def loadBin(self, bin_path:str):
 		"""Load the bin in another thread"""
 
 
 		print(bin_path)
-		self._worker = BinViewLoader(bin_path)
+
+		# Reload whenever the bin is saved again
+		for watched_path in self._bin_watcher.watchedBins():
+			self._bin_watcher.unwatchBin(watched_path)
+		self._bin_watcher.watchBin(bin_path)
+
+		self._is_loading = True
+		self._reload_pending = False
+
+		self._worker = BinViewLoader(bin_path, process_count=os.cpu_count() or 0, bin_cache=self._bin_cache)
 		self._worker.signals().sig_begin_loading.connect(lambda: self._wnd_main.setWindowFilePath(bin_path))
 		self._worker.signals().sig_begin_loading.connect(lambda: self._wnd_main.setWindowFilePath(bin_path))
 		self._worker.signals().sig_begin_loading.connect(self._prog_loading.show)
@@ -1388,7 +1500,11 @@ class MainApplication(QtWidgets.QApplication):
 
 		self._worker.signals().sig_got_sort_settings.connect(self._sorting_presenter.setBinSortingProperties)
 
-		self._worker.signals().sig_got_mob.connect(self._contents_presenter.addMob)
+		# Buffer incoming mobs and insert them into the contents view model in chunks
+		self._worker.signals().sig_begin_loading.connect(self._contents_presenter.viewModel().beginBulkLoad)
+		self._worker.signals().sig_got_mobs.connect(self._contents_presenter.addMobs)
+		self._worker.signals().sig_got_resolution_stats.connect(lambda stats: self._wnd_main.statusBar().showMessage(f"Source lookups: {stats.get('saved', 0):,} of {stats.get('lookups', 0):,} saved by resolving each source mob once"))
+		self._worker.signals().sig_done_loading.connect(self._contents_presenter.viewModel().endBulkLoad)
 
 		#self._worker.signals().sig_done_loading.connect(self._tree_bin_contents.resizeAllColumnsToContents)
 		self._worker.signals().sig_done_loading.connect(self._tree_column_defs.resizeAllColumnsToContents)
@@ -1404,8 +1520,52 @@ class MainApplication(QtWidgets.QApplication):
 		self._worker.signals().sig_done_loading.connect(lambda: self._tree_column_defs.sortByColumn(0, QtCore.Qt.SortOrder.AscendingOrder))
 		self._worker.signals().sig_done_loading.connect(lambda: self._tree_property_data.sortByColumn(0, QtCore.Qt.SortOrder.DescendingOrder))
 		self._worker.signals().sig_done_loading.connect(self._prog_loading.hide)
+		self._worker.signals().sig_done_loading.connect(lambda worker=self._worker: self._loadingFinished(worker))
+		self._threadpool.start(self._worker)
+	
+	@QtCore.Slot(str)
+	def binChangedOnDisk(self, bin_path:str):
+		"""Reload the open bin after it's been saved elsewhere"""
+
+		if self._wnd_main.windowFilePath() and os.path.abspath(self._wnd_main.windowFilePath()) == bin_path:
+			self.reloadBin()
+
+	@QtCore.Slot()
+	def reloadBin(self):
+		"""Re-read the current bin, updating only the mobs that have changed"""
+
+		bin_path = self._wnd_main.windowFilePath()
+		if not bin_path:
+			return
+		
+		# Diffing against a partly loaded bin would add the rest of its mobs twice: reload once it's done
+		if self._is_loading:
+			self._reload_pending = True
+			return
+		
+		self._is_loading = True
+		
+		self._worker = BinViewLoader(bin_path, process_count=os.cpu_count() or 0, bin_cache=self._bin_cache, collect_mobs=True)
+		self._worker.signals().sig_begin_loading.connect(self._prog_loading.show)
+		self._worker.signals().sig_got_all_mobs.connect(self._contents_presenter.updateMobs)
+		self._worker.signals().sig_done_loading.connect(self._prog_loading.hide)
+		self._worker.signals().sig_done_loading.connect(lambda worker=self._worker: self._loadingFinished(worker))
+
 		self._threadpool.start(self._worker)
 	
+	def _loadingFinished(self, worker:BinViewLoader):
+		"""Start any reload that was held back while loading"""
+
+		# A bin opened since has its own load running
+		if worker is not self._worker:
+			return
+
+		self._is_loading = False
+
+		if self._reload_pending:
+			self._reload_pending = False
+			self.reloadBin()
+
 	@QtCore.Slot()
 	def browseForBin(self):
 
@@ -0,0 +1,46 @@
+"""
+Index every sequence in a project, then query the index without opening any bins
+
+Usage: test_timelineindex.py INDEX_PATH PROJECT_PATH [--name TEXT] [--modified-since YYYY-MM-DD] [--marker-color COLOR] [--marker-comment TEXT]
+"""
+
+import sys, time, argparse, datetime
+import avbutils
+from trt_model import timelineindex, datamodels
+
+def main() -> int:
+
+	parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+	parser.add_argument("index_path", help="Index database (created if needed)")
+	parser.add_argument("project_path", help="Project directory to index")
+	parser.add_argument("--name", default=None, help="Timeline name contains")
+	parser.add_argument("--modified-since", type=datetime.datetime.fromisoformat, default=None)
+	parser.add_argument("--marker-color", choices=[color.name for color in avbutils.MarkerColors], default=None)
+	parser.add_argument("--marker-comment", default=None, help="Marker comment contains")
+	args = parser.parse_args()
+
+	timeline_index = timelineindex.TRTTimelineIndex(args.index_path)
+
+	update_stats = timeline_index.update([args.project_path], bin_indexed=lambda bin_path, timeline_count: print(f"Indexed {timeline_count} timelines from {bin_path}", file=sys.stderr))
+	print(f"{update_stats.bins_scanned:,} of {update_stats.bins_found:,} bins rescanned, {update_stats.bins_removed:,} removed in {update_stats.elapsed:.1f}s", file=sys.stderr)
+
+	marker_preset = None
+	if args.marker_color or args.marker_comment:
+		marker_preset = datamodels.TRTMarkerPresetInfo(
+			preset_name = "Query",
+			color       = avbutils.MarkerColors[args.marker_color] if args.marker_color else None,
+			comment     = args.marker_comment,
+		)
+
+	time_start = time.perf_counter()
+	timeline_infos = timeline_index.query(name_contains=args.name, modified_since=args.modified_since, marker_preset=marker_preset)
+	time_query = time.perf_counter() - time_start
+
+	for timeline_info in timeline_infos:
+		print(f"{timeline_info.timeline_name}\t{timeline_info.date_modified}\t{timeline_info.bin_path}")
+	
+	print(f"{len(timeline_infos):,} of {timeline_index.timelineCount():,} timelines matched in {time_query * 1000:.1f}ms", file=sys.stderr)
+	return 0
+
+if __name__ == "__main__":
+	sys.exit(main())
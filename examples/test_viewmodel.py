@@ -56,14 +56,12 @@ def main():
 		viewitems.TRTAbstractViewHeaderItem("bin_lock", "Bin Lock", viewitems.TRTBinLockViewItem),
 	]
 
-	for head in headers[::-1]:
-		viewmodel_timelines.addHeader(head)
+	viewmodel_timelines.setHeaders(headers)
 
 
 	timelines = get_timelines_from_bin(sys.argv[1])
 
-	for timeline_info in timelines:
-		viewmodel_timelines.addTimeline(timeline_info)
+	viewmodel_timelines.addTimelines(timelines)
 
 	return app.exec()
 
@@ -0,0 +1,73 @@
+"""
+Batching Rows Sent From Loader Threads
+"""
+
+import typing, time
+
+T = typing.TypeVar("T")
+
+class TRTRowBatcher(typing.Generic[T]):
+	"""Collect rows produced in a worker thread and hand them off as lists
+
+	Emitting a signal per row from a worker means one queued event (and one model
+	insert) per row in the GUI thread.  Rows added here are instead passed to `flush_callback`
+	(typically a signal's `emit`) every `max_rows` rows, or once `max_interval` milliseconds
+	have passed since the last flush, so the view still fills in progressively.
+
+	Call `flush()` once the worker is done to send any remaining rows.
+	"""
+
+	def __init__(self, flush_callback:typing.Callable[[list[T]], typing.Any], max_rows:int=500, max_interval:int=100):
+
+		self._flush_callback = flush_callback
+		self._max_rows       = max_rows
+		self._max_interval   = max_interval / 1000
+
+		self._pending:list[T] = []
+		"""Rows added since the last flush"""
+
+		self._last_flush = time.monotonic()
+
+		self._batch_count = 0
+		self._row_count   = 0
+
+	def add(self, row:T):
+		"""Add a row, flushing if the batch is full or overdue"""
+
+		self._pending.append(row)
+
+		if len(self._pending) >= self._max_rows or time.monotonic() - self._last_flush >= self._max_interval:
+			self.flush()
+
+	def extend(self, rows:typing.Iterable[T]):
+		"""Add several rows, flushing as needed"""
+
+		for row in rows:
+			self.add(row)
+
+	def flush(self):
+		"""Send any pending rows now"""
+
+		self._last_flush = time.monotonic()
+
+		if not self._pending:
+			return
+
+		rows, self._pending = self._pending, []
+
+		self._batch_count += 1
+		self._row_count   += len(rows)
+
+		self._flush_callback(rows)
+
+	def batchCount(self) -> int:
+		"""Number of batches sent so far"""
+		return self._batch_count
+
+	def rowCount(self) -> int:
+		"""Number of rows sent so far"""
+		return self._row_count
+
+	def pendingCount(self) -> int:
+		"""Number of rows waiting for the next flush"""
+		return len(self._pending)
@@ -0,0 +1,326 @@
+"""
+Headless Scanning of Many Bins
+"""
+
+import os, time, json, typing, dataclasses, concurrent.futures, multiprocessing
+import avb, avbutils
+from . import datamodels
+
+TRTBinExtractor = typing.Callable[[avb.bin.Bin], typing.Any]
+"""Pulls something picklable out of an open bin's contents.  Must be a module-level function, so worker processes can unpickle it."""
+
+
+# Extractors
+def extract_font_info(bin_content:avb.bin.Bin) -> dict:
+	"""Bin font name and Mac font ID"""
+
+	return {
+		"font_name": bin_content.attributes.get("ATTR__BIN_FONT_NAME"),
+		"mac_font":  bin_content.mac_font,
+	}
+
+def extract_column_widths(bin_content:avb.bin.Bin) -> dict|None:
+	"""Column widths saved with the bin, by column name"""
+
+	column_widths = bin_content.attributes.get("BIN_COLUMNS_WIDTHS")
+	return json.loads(column_widths.decode("utf-8")) if column_widths else None
+
+def extract_sift_settings(bin_content:avb.bin.Bin) -> dict:
+	"""Whether the bin is sifted, and its sift criteria"""
+
+	return {
+		"sifted":   bool(bin_content.sifted),
+		"settings": [{"method": sift_item.method, "string": sift_item.string, "column": sift_item.column} for sift_item in bin_content.sifted_settings],
+	}
+
+def extract_timelines(bin_content:avb.bin.Bin) -> list[datamodels.TRTTimelineInfo]:
+	"""Info for each sequence in the bin, including its markers"""
+
+	bin_path = os.path.abspath(bin_content.root.f.name) if hasattr(bin_content.root, "f") else ""
+
+	return [datamodels.TRTTimelineInfo(
+		timeline_name     = timeline.name or "",
+		timeline_tc_range = avbutils.get_timecode_range_for_composition(timeline),
+		timeline_color    = avbutils.composition_clip_color(timeline),
+		date_created      = timeline.creation_time,
+		date_modified     = timeline.last_modified,
+		markers           = avbutils.get_markers_from_timeline(timeline),
+		bin_path          = bin_path,
+		bin_lock          = None,
+	) for timeline in avbutils.get_timelines_from_bin(bin_content)]
+
+def extract_markers(bin_content:avb.bin.Bin) -> dict[str, list[avbutils.MarkerInfo]]:
+	"""Markers of each sequence in the bin, by mob ID"""
+
+	return {str(timeline.mob_id): avbutils.get_markers_from_timeline(timeline) for timeline in avbutils.get_timelines_from_bin(bin_content)}
+
+EXTRACTORS:dict[str, TRTBinExtractor] = {
+	"font_info":      extract_font_info,
+	"column_widths":  extract_column_widths,
+	"sift_settings":  extract_sift_settings,
+	"timelines":      extract_timelines,
+	"markers":        extract_markers,
+}
+"""Built-in extractors by name"""
+
+
+@dataclasses.dataclass
+class TRTBinScanResult:
+	"""What the extractors found in one bin"""
+
+	bin_path:str
+	file_size:int
+	mtime_ns:int
+
+	results:dict[str, typing.Any] = dataclasses.field(default_factory=dict)
+	"""Extracted values by extractor name"""
+
+	errors:dict[str, str] = dataclasses.field(default_factory=dict)
+	"""Messages by extractor name, for extractors that failed"""
+
+	open_error:str|None = None
+	"""Why the bin couldn't be opened, if it couldn't"""
+
+	scan_time:float = 0
+	"""Seconds spent opening the bin and running the extractors"""
+
+	def succeeded(self) -> bool:
+		return self.open_error is None and not self.errors
+
+
+@dataclasses.dataclass
+class TRTBinScanStats:
+	"""Throughput of a scan so far"""
+
+	bins_found:int = 0
+	bins_scanned:int = 0
+	bins_skipped:int = 0
+	"""Bins already scanned according to the checkpoint"""
+
+	bins_failed:int = 0
+	bytes_scanned:int = 0
+	elapsed:float = 0
+
+	def binsPerSecond(self) -> float:
+		return self.bins_scanned / self.elapsed if self.elapsed else 0.0
+
+	def bytesPerSecond(self) -> float:
+		return self.bytes_scanned / self.elapsed if self.elapsed else 0.0
+
+	def __str__(self) -> str:
+		return (
+			f"{self.bins_scanned:,} of {self.bins_found:,} bins scanned ({self.bins_skipped:,} skipped, {self.bins_failed:,} failed) "
+			f"in {self.elapsed:.1f}s: {self.binsPerSecond():.1f} bins/s, {self.bytesPerSecond() / 1024 / 1024:.1f} MB/s"
+		)
+
+
+def scan_bin(bin_path:str, extractors:dict[str, TRTBinExtractor]) -> TRTBinScanResult:
+	"""Open a bin once and run every extractor on it (runs in a worker process)"""
+
+	time_start = time.perf_counter()
+
+	scan_result = TRTBinScanResult(bin_path, 0, 0)
+
+	try:
+		# The bin may have been moved or deleted since the walk found it
+		stat = os.stat(bin_path)
+		scan_result.file_size, scan_result.mtime_ns = stat.st_size, stat.st_mtime_ns
+
+		with avb.open(bin_path) as bin_handle:
+			for name, extractor in extractors.items():
+				try:
+					scan_result.results[name] = extractor(bin_handle.content)
+				except Exception as e:
+					scan_result.errors[name] = f"{type(e).__name__}: {e}"
+	except Exception as e:
+		scan_result.open_error = f"{type(e).__name__}: {e}"
+
+	scan_result.scan_time = time.perf_counter() - time_start
+	return scan_result
+
+def is_bin_path(path:os.DirEntry|str) -> bool:
+	"""Whether a file looks like an Avid bin (skipping hidden files such as `._` resource forks)"""
+
+	name = os.path.basename(path)
+	return not name.startswith(".") and name.casefold().endswith(".avb")
+
+
+class TRTBinScanCheckpoint:
+	"""Bins already scanned, recorded one per line as they finish so an interrupted scan can pick up where it left off
+
+	A bin counts as already scanned only if every extractor succeeded on it, it was scanned with the
+	same extractors, and its size and modification time haven't changed since.
+	"""
+
+	def __init__(self, checkpoint_path:os.PathLike, extractor_names:typing.Iterable[str]):
+
+		self._checkpoint_path = checkpoint_path
+		self._extractor_names = sorted(extractor_names)
+		self._scanned:dict[str, tuple[int, int]] = {}
+
+		if os.path.exists(checkpoint_path):
+			with open(checkpoint_path, encoding="utf-8") as checkpoint_file:
+				for line in checkpoint_file:
+					try:
+						entry = json.loads(line)
+						if entry["extractors"] != self._extractor_names:
+							continue	# Scanned for something else
+						self._scanned[entry["path"]] = (entry["size"], entry["mtime_ns"])
+					except (ValueError, KeyError):
+						continue	# Partly written when the last scan was interrupted
+
+		self._checkpoint_file = open(checkpoint_path, "a", encoding="utf-8")
+
+	def isScanned(self, bin_path:str, file_size:int, mtime_ns:int) -> bool:
+		return self._scanned.get(bin_path) == (file_size, mtime_ns)
+
+	def markScanned(self, scan_result:TRTBinScanResult):
+
+		self._scanned[scan_result.bin_path] = (scan_result.file_size, scan_result.mtime_ns)
+		self._checkpoint_file.write(json.dumps({"path": scan_result.bin_path, "size": scan_result.file_size, "mtime_ns": scan_result.mtime_ns, "extractors": self._extractor_names}) + "\n")
+		self._checkpoint_file.flush()
+
+	def scannedCount(self) -> int:
+		return len(self._scanned)
+
+	def close(self):
+		self._checkpoint_file.close()
+
+
+class TRTBinScanner:
+	"""Scan every bin under some directories with a set of extractors, in a process pool
+
+	Directories are walked by a pool of threads (network shares are mostly waiting on
+	round trips), bins are opened once each in worker processes with only a bounded
+	number in flight at a time, and results are yielded by `scan()` as they complete.
+	"""
+
+	DEFAULT_WALKER_THREADS:int = 8
+	"""Threads listing directories at once"""
+
+	IN_FLIGHT_PER_PROCESS:int = 4
+	"""Bins queued per worker process, by default, to keep workers busy without queueing the whole project"""
+
+	def __init__(self,
+		extractors:dict[str, TRTBinExtractor]|typing.Iterable[str],
+		process_count:int|None = None,
+		max_in_flight:int|None = None,
+		walker_threads:int = DEFAULT_WALKER_THREADS,
+		checkpoint_path:os.PathLike|None = None,
+	):
+
+		# Built-in extractors can be given by name
+		self._extractors = dict(extractors) if isinstance(extractors, dict) else {name: EXTRACTORS[name] for name in extractors}
+
+		self._process_count  = process_count or os.cpu_count() or 1
+		self._max_in_flight  = max_in_flight or self._process_count * self.IN_FLIGHT_PER_PROCESS
+		self._walker_threads = walker_threads
+		self._checkpoint_path = checkpoint_path
+
+		self._stats = TRTBinScanStats()
+
+	def stats(self) -> TRTBinScanStats:
+		"""Throughput of the current (or last) scan"""
+		return self._stats
+
+	def walkBins(self, root_paths:typing.Iterable[os.PathLike]) -> typing.Iterator[str]:
+		"""Bin paths under the given directories (or bin paths given directly), listing directories concurrently"""
+
+		def list_directory(dir_path:str) -> tuple[list[str], list[str]]:
+
+			dir_paths, bin_paths = [], []
+
+			try:
+				with os.scandir(dir_path) as entries:
+					for entry in entries:
+						if entry.name.startswith("."):
+							continue
+						elif entry.is_dir(follow_symlinks=False):
+							dir_paths.append(entry.path)
+						elif entry.is_file() and is_bin_path(entry.name):
+							bin_paths.append(entry.path)
+			except OSError as e:
+				print(f"Skipping {dir_path}: {e}")
+
+			return dir_paths, bin_paths
+
+		with concurrent.futures.ThreadPoolExecutor(max_workers=self._walker_threads) as executor:
+
+			pending = set()
+
+			for root_path in root_paths:
+				root_path = os.path.abspath(root_path)
+				if os.path.isdir(root_path):
+					pending.add(executor.submit(list_directory, root_path))
+				elif is_bin_path(root_path):
+					yield root_path
+
+			while pending:
+
+				done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+
+				for future in done:
+					dir_paths, bin_paths = future.result()
+					pending.update(executor.submit(list_directory, dir_path) for dir_path in dir_paths)
+					yield from bin_paths
+
+	def scan(self, root_paths:typing.Iterable[os.PathLike]) -> typing.Iterator[TRTBinScanResult]:
+		"""Scan all bins under the given paths, yielding results in the order they complete"""
+
+		self._stats = TRTBinScanStats()
+		time_start = time.perf_counter()
+
+		checkpoint = TRTBinScanCheckpoint(self._checkpoint_path, self._extractors) if self._checkpoint_path else None
+
+		try:
+			with concurrent.futures.ProcessPoolExecutor(
+				max_workers = self._process_count,
+				mp_context  = multiprocessing.get_context("spawn"),
+			) as executor:
+
+				in_flight = set()
+
+				def finished(done:set[concurrent.futures.Future]) -> typing.Iterator[TRTBinScanResult]:
+
+					for future in done:
+
+						scan_result = future.result()
+
+						self._stats.bins_scanned  += 1
+						self._stats.bytes_scanned += scan_result.file_size
+						self._stats.bins_failed   += not scan_result.succeeded()
+						self._stats.elapsed        = time.perf_counter() - time_start
+
+						if checkpoint is not None and scan_result.succeeded():
+							checkpoint.markScanned(scan_result)
+
+						yield scan_result
+
+				for bin_path in self.walkBins(root_paths):
+
+					self._stats.bins_found += 1
+
+					if checkpoint is not None:
+						try:
+							stat = os.stat(bin_path)
+						except OSError:
+							continue
+						if checkpoint.isScanned(bin_path, stat.st_size, stat.st_mtime_ns):
+							self._stats.bins_skipped += 1
+							continue
+
+					# Wait for a bin to finish before queueing more
+					if len(in_flight) >= self._max_in_flight:
+						done, in_flight = concurrent.futures.wait(in_flight, return_when=concurrent.futures.FIRST_COMPLETED)
+						yield from finished(done)
+
+					in_flight.add(executor.submit(scan_bin, bin_path, self._extractors))
+
+				while in_flight:
+					done, in_flight = concurrent.futures.wait(in_flight, return_when=concurrent.futures.FIRST_COMPLETED)
+					yield from finished(done)
+
+		finally:
+			self._stats.elapsed = time.perf_counter() - time_start
+			if checkpoint is not None:
+				checkpoint.close()
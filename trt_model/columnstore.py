@@ -0,0 +1,659 @@
+"""
+Column Store for View Models
+"""
+
+import typing, enum, array, collections, collections.abc
+from timecode import Timecode
+from PySide6 import QtCore, QtGui
+from . import viewitems
+
+
+class TRTAbstractColumn:
+	"""Values for one field across all rows in a `TRTColumnStore`"""
+
+	EMPTY_VALUE:typing.Any = 0
+	"""Stored in place of a value for rows without this field"""
+
+	def __init__(self, item_class:typing.Type[viewitems.TRTAbstractViewItem]):
+
+		self._item_class = item_class
+
+		self._present = bytearray()
+		"""Whether each row has an item for this field"""
+
+		self._values = self._create_values()
+		"""Encoded item data for each row"""
+
+	def _create_values(self) -> typing.MutableSequence:
+		return []
+
+	@classmethod
+	def can_store(cls, item:viewitems.TRTAbstractViewItem) -> bool:
+		"""Whether this type of column is suitable for a given item"""
+		return False
+
+	@classmethod
+	def from_item(cls, item:viewitems.TRTAbstractViewItem) -> "TRTAbstractColumn":
+		"""Create a column suitable for storing the given item"""
+		return cls(type(item))
+
+	def accepts(self, item:viewitems.TRTAbstractViewItem) -> bool:
+		"""Whether an item can be stored in this column without losing anything"""
+
+		# Icons and tooltips are per-item overrides that won't survive encoding
+		return type(item) is self._item_class and item._icon is None and item._tooltip is None
+
+	def _encode(self, item:viewitems.TRTAbstractViewItem) -> typing.Any:
+		raise NotImplementedError
+
+	def _decode(self, value:typing.Any) -> viewitems.TRTAbstractViewItem:
+		raise NotImplementedError
+
+	def append(self, item:viewitems.TRTAbstractViewItem|None):
+		"""Add an item (or `None` for no item) to the end of the column"""
+
+		if item is None:
+			self._present.append(0)
+			self._values.append(self.EMPTY_VALUE)
+		else:
+			self._present.append(1)
+			self._values.append(self._encode(item))
+
+	def pad(self, count:int):
+		"""Add empty rows to the end of the column"""
+
+		self._present.extend(bytes(count))
+		self._values.extend([self.EMPTY_VALUE] * count)
+
+	def insert(self, row:int, item:viewitems.TRTAbstractViewItem|None):
+		"""Insert an item (or `None` for no item) before the given row"""
+
+		if item is None:
+			self._present.insert(row, 0)
+			self._values.insert(row, self.EMPTY_VALUE)
+		else:
+			self._present.insert(row, 1)
+			self._values.insert(row, self._encode(item))
+
+	def set(self, row:int, item:viewitems.TRTAbstractViewItem|None):
+		"""Replace the item (or `None` for no item) in an existing row"""
+
+		if item is None:
+			self._present[row] = 0
+			self._values[row]  = self.EMPTY_VALUE
+		else:
+			self._present[row] = 1
+			self._values[row]  = self._encode(item)
+
+	def remove(self, first_row:int, last_row:int):
+		"""Remove a range of rows, inclusive"""
+
+		del self._present[first_row:last_row+1]
+		del self._values[first_row:last_row+1]
+
+	def has_item(self, row:int) -> bool:
+		return bool(self._present[row])
+
+	def item(self, row:int) -> viewitems.TRTAbstractViewItem|None:
+		"""Materialize the view item for a given row"""
+
+		if not self._present[row]:
+			return None
+		return self._decode(self._values[row])
+
+	def sort_keys(self, first_row:int, last_row:int) -> list[typing.Any]:
+		"""Sort key of each item in a range of rows, inclusive (`None` for rows without an item)"""
+
+		present = self._present
+		return [self._decode(self._values[row]).sort_key() if present[row] else None for row in range(first_row, last_row+1)]
+
+	def __len__(self) -> int:
+		return len(self._present)
+
+
+class TRTObjectColumn(TRTAbstractColumn):
+	"""Stores view items as-is, for anything that can't be stored more compactly"""
+
+	EMPTY_VALUE = None
+
+	def __init__(self, item_class:typing.Type[viewitems.TRTAbstractViewItem]|None=None):
+		super().__init__(item_class)
+
+	@classmethod
+	def from_column(cls, column:TRTAbstractColumn) -> "TRTObjectColumn":
+		"""Convert another column to an object column"""
+
+		object_column = cls()
+		for row in range(len(column)):
+			object_column.append(column.item(row))
+		return object_column
+
+	def accepts(self, item:viewitems.TRTAbstractViewItem) -> bool:
+		return True
+
+	def _encode(self, item:viewitems.TRTAbstractViewItem) -> viewitems.TRTAbstractViewItem:
+		return item
+
+	def _decode(self, value:viewitems.TRTAbstractViewItem) -> viewitems.TRTAbstractViewItem:
+		return value
+
+	def sort_keys(self, first_row:int, last_row:int) -> list[typing.Any]:
+		return [item.sort_key() if item is not None else None for item in self._values[first_row:last_row+1]]
+
+
+class TRTIntegerColumn(TRTAbstractColumn):
+	"""Stores integer values (frame counts, etc) in a typed array"""
+
+	def _create_values(self) -> array.array:
+		return array.array("q")
+
+	@staticmethod
+	def _is_storable(value:typing.Any) -> bool:
+		return type(value) is int and -(2**63) <= value < 2**63
+
+	@classmethod
+	def can_store(cls, item:viewitems.TRTAbstractViewItem) -> bool:
+		return cls._is_storable(item.raw_data())
+
+	def accepts(self, item:viewitems.TRTAbstractViewItem) -> bool:
+		return super().accepts(item) and self._is_storable(item.raw_data())
+
+	def _encode(self, item:viewitems.TRTAbstractViewItem) -> int:
+		return item.raw_data()
+
+	def _decode(self, value:int) -> viewitems.TRTAbstractViewItem:
+		return self._item_class(value)
+
+	def sort_keys(self, first_row:int, last_row:int) -> list[typing.Any]:
+
+		if self._item_class.sort_key is not viewitems.TRTNumericViewItem.sort_key:
+			return super().sort_keys(first_row, last_row)
+
+		return _present_values(self._present, self._values, first_row, last_row)
+
+
+class TRTStringColumn(TRTAbstractColumn):
+	"""Stores strings as indexes into a table of unique strings"""
+
+	def __init__(self, *args, **kwargs):
+
+		super().__init__(*args, **kwargs)
+
+		self._strings:list[str|None] = []
+		"""Unique strings, in the order they were first seen"""
+
+		self._string_ids:dict[str|None, int] = {}
+		"""Index into `_strings` for each unique string"""
+
+	def _create_values(self) -> array.array:
+		return array.array("L")
+
+	@classmethod
+	def can_store(cls, item:viewitems.TRTAbstractViewItem) -> bool:
+		return isinstance(item, viewitems.TRTStringViewItem) and (item.raw_data() is None or type(item.raw_data()) is str)
+
+	def accepts(self, item:viewitems.TRTAbstractViewItem) -> bool:
+		return super().accepts(item) and (item.raw_data() is None or type(item.raw_data()) is str)
+
+	def _encode(self, item:viewitems.TRTAbstractViewItem) -> int:
+
+		string = item.raw_data()
+
+		if string not in self._string_ids:
+			self._string_ids[string] = len(self._strings)
+			self._strings.append(string)
+
+		return self._string_ids[string]
+
+	def _decode(self, value:int) -> viewitems.TRTAbstractViewItem:
+		return self._item_class(self._strings[value])
+
+	def sort_keys(self, first_row:int, last_row:int) -> list[typing.Any]:
+
+		# Each unique string only needs its key computed once
+		key_for_string:dict[int, typing.Any] = {}
+		sort_keys = []
+
+		for row in range(first_row, last_row+1):
+
+			if not self._present[row]:
+				sort_keys.append(None)
+				continue
+
+			string_id = self._values[row]
+			if string_id not in key_for_string:
+				key_for_string[string_id] = self._decode(string_id).sort_key()
+			sort_keys.append(key_for_string[string_id])
+
+		return sort_keys
+
+
+class TRTTimecodeColumn(TRTAbstractColumn):
+	"""Stores timecodes as frame numbers at a single rate"""
+
+	def __init__(self, item_class:typing.Type[viewitems.TRTAbstractViewItem], rate:int):
+
+		super().__init__(item_class)
+		self._rate = rate
+
+	def _create_values(self) -> array.array:
+		return array.array("q")
+
+	@classmethod
+	def can_store(cls, item:viewitems.TRTAbstractViewItem) -> bool:
+		return isinstance(item.raw_data(), Timecode)
+
+	@classmethod
+	def from_item(cls, item:viewitems.TRTAbstractViewItem) -> "TRTTimecodeColumn":
+		return cls(type(item), item.raw_data().rate)
+
+	def accepts(self, item:viewitems.TRTAbstractViewItem) -> bool:
+		return super().accepts(item) and isinstance(item.raw_data(), Timecode) and item.raw_data().rate == self._rate
+
+	def _encode(self, item:viewitems.TRTAbstractViewItem) -> int:
+		return item.raw_data().frame_number
+
+	def _decode(self, value:int) -> viewitems.TRTAbstractViewItem:
+		return self._item_class(Timecode(value, rate=self._rate))
+
+	def sort_keys(self, first_row:int, last_row:int) -> list[typing.Any]:
+
+		if self._item_class.sort_key is not viewitems.TRTTimecodeViewItem.sort_key:
+			return super().sort_keys(first_row, last_row)
+
+		return _present_values(self._present, self._values, first_row, last_row)
+
+
+class TRTDateTimeColumn(TRTAbstractColumn):
+	"""Stores datetimes as milliseconds since the epoch"""
+
+	def __init__(self, item_class:typing.Type[viewitems.TRTDateTimeViewItem], format_string:QtCore.Qt.DateFormat|str):
+
+		super().__init__(item_class)
+		self._format_string = format_string
+
+	def _create_values(self) -> array.array:
+		return array.array("q")
+
+	@classmethod
+	def can_store(cls, item:viewitems.TRTAbstractViewItem) -> bool:
+		return isinstance(item, viewitems.TRTDateTimeViewItem)
+
+	@classmethod
+	def from_item(cls, item:viewitems.TRTDateTimeViewItem) -> "TRTDateTimeColumn":
+		return cls(type(item), item.formatString())
+
+	def accepts(self, item:viewitems.TRTAbstractViewItem) -> bool:
+		return super().accepts(item) and item.formatString() == self._format_string
+
+	def _encode(self, item:viewitems.TRTDateTimeViewItem) -> int:
+		return item.raw_data().toMSecsSinceEpoch()
+
+	def _decode(self, value:int) -> viewitems.TRTDateTimeViewItem:
+		return self._item_class(QtCore.QDateTime.fromMSecsSinceEpoch(value), self._format_string)
+
+	def sort_keys(self, first_row:int, last_row:int) -> list[typing.Any]:
+
+		if self._item_class.sort_key is not viewitems.TRTDateTimeViewItem.sort_key:
+			return super().sort_keys(first_row, last_row)
+
+		return _present_values(self._present, self._values, first_row, last_row)
+
+
+class TRTEnumColumn(TRTAbstractColumn):
+	"""Stores members of a single enum by value"""
+
+	def __init__(self, item_class:typing.Type[viewitems.TRTAbstractViewItem], enum_class:typing.Type[enum.Enum]):
+
+		super().__init__(item_class)
+		self._enum_class = enum_class
+
+	def _create_values(self) -> array.array:
+		return array.array("q")
+
+	@classmethod
+	def can_store(cls, item:viewitems.TRTAbstractViewItem) -> bool:
+		return isinstance(item.raw_data(), enum.Enum) and TRTIntegerColumn._is_storable(item.raw_data().value)
+
+	@classmethod
+	def from_item(cls, item:viewitems.TRTAbstractViewItem) -> "TRTEnumColumn":
+		return cls(type(item), type(item.raw_data()))
+
+	def accepts(self, item:viewitems.TRTAbstractViewItem) -> bool:
+		return super().accepts(item) and type(item.raw_data()) is self._enum_class
+
+	def _encode(self, item:viewitems.TRTAbstractViewItem) -> int:
+		return item.raw_data().value
+
+	def _decode(self, value:int) -> viewitems.TRTAbstractViewItem:
+		return self._item_class(self._enum_class(value))
+
+	def sort_keys(self, first_row:int, last_row:int) -> list[typing.Any]:
+
+		if self._item_class.sort_key is not viewitems.TRTEnumViewItem.sort_key:
+			return super().sort_keys(first_row, last_row)
+
+		return _present_values(self._present, self._values, first_row, last_row)
+
+
+class TRTColorColumn(TRTAbstractColumn):
+	"""Stores colors as packed 16-bit RGBA"""
+
+	def _create_values(self) -> array.array:
+		return array.array("Q")
+
+	@staticmethod
+	def _is_storable(color:QtGui.QColor) -> bool:
+		# A packed 0 is reserved for invalid colors, so fully transparent colors aren't stored
+		return not color.isValid() or color.alpha() > 0
+
+	@classmethod
+	def can_store(cls, item:viewitems.TRTAbstractViewItem) -> bool:
+		return isinstance(item, viewitems.TRTClipColorViewItem) and cls._is_storable(item.raw_data())
+
+	def accepts(self, item:viewitems.TRTAbstractViewItem) -> bool:
+		return super().accepts(item) and self._is_storable(item.raw_data())
+
+	def _encode(self, item:viewitems.TRTClipColorViewItem) -> int:
+
+		color = item.raw_data()
+
+		if not color.isValid():
+			return 0
+
+		rgba64 = color.rgba64()
+		return rgba64.red() << 48 | rgba64.green() << 32 | rgba64.blue() << 16 | rgba64.alpha()
+
+	def _decode(self, value:int) -> viewitems.TRTClipColorViewItem:
+
+		if not value:
+			return self._item_class(None)
+
+		return self._item_class(QtGui.QColor.fromRgba64(value >> 48 & 0xFFFF, value >> 32 & 0xFFFF, value >> 16 & 0xFFFF, value & 0xFFFF))
+
+
+def _present_values(present:bytearray, values:array.array, first_row:int, last_row:int) -> list[typing.Any]:
+	"""Stored values in a range of rows, inclusive, for columns whose stored values are already their sort keys"""
+
+	sort_keys = values[first_row:last_row+1].tolist()
+
+	# Typically only a few rows are missing an item, if any
+	if 0 in present[first_row:last_row+1]:
+		for offset, is_present in enumerate(present[first_row:last_row+1]):
+			if not is_present:
+				sort_keys[offset] = None
+
+	return sort_keys
+
+
+COLUMN_TYPES:tuple[typing.Type[TRTAbstractColumn], ...] = (
+	TRTStringColumn,
+	TRTTimecodeColumn,
+	TRTDateTimeColumn,
+	TRTColorColumn,
+	TRTEnumColumn,
+	TRTIntegerColumn,
+)
+"""Typed columns to try, in order, before falling back to `TRTObjectColumn`"""
+
+
+def get_column_for_item(item:viewitems.TRTAbstractViewItem) -> TRTAbstractColumn:
+	"""Create the most compact column able to store a given item"""
+
+	for column_type in COLUMN_TYPES:
+		if column_type.can_store(item):
+			column = column_type.from_item(item)
+			if column.accepts(item):
+				return column
+
+	return TRTObjectColumn()
+
+
+class TRTColumnStoreRow(collections.abc.Mapping):
+	"""A read-only `dict`-like view of one row in a `TRTColumnStore`"""
+
+	__slots__ = ("_store", "_row")
+
+	def __init__(self, store:"TRTColumnStore", row:int):
+		self._store = store
+		self._row   = row
+
+	def __getitem__(self, field_name:str) -> viewitems.TRTAbstractViewItem:
+
+		item = self._store.item(self._row, field_name)
+		if item is None:
+			raise KeyError(field_name)
+		return item
+
+	def __contains__(self, field_name:str) -> bool:
+		return self._store.hasItem(self._row, field_name)
+
+	def __iter__(self) -> typing.Iterator[str]:
+		return (field_name for field_name in self._store.fields() if self._store.hasItem(self._row, field_name))
+
+	def __len__(self) -> int:
+		return sum(1 for _ in self)
+
+
+class TRTColumnStore:
+	"""Row storage for `TRTTimelineViewModel` which keeps each field in a typed column
+
+	View items are only materialized when they are requested, and a limited number of
+	them are kept around for repeated lookups (e.g. repainting the visible rows).
+
+	Because items are re-created from the columns once they've been discarded, changes
+	made with an item's own `setData()` don't last.  Override role data with `setItemData()`
+	instead, which keeps it in the store and applies it whenever the item is materialized.
+	"""
+
+	MATERIALIZED_ITEMS_MAX:int = 4096
+	"""Maximum number of materialized view items to keep around"""
+
+	def __init__(self):
+
+		self._row_count = 0
+
+		self._columns:dict[str, TRTAbstractColumn] = {}
+		"""Columns by field name"""
+
+		self._materialized:collections.OrderedDict[tuple[int,str], viewitems.TRTAbstractViewItem] = collections.OrderedDict()
+		"""Recently materialized view items by `(row, field_name)`"""
+
+		self._overrides:dict[tuple[int,str], dict[QtCore.Qt.ItemDataRole, typing.Any]] = {}
+		"""Role data set with `setItemData()`, by `(row, field_name)`"""
+
+	def __len__(self) -> int:
+		return self._row_count
+
+	def __getitem__(self, row:int) -> TRTColumnStoreRow:
+
+		if row < 0:
+			row += self._row_count
+		if not 0 <= row < self._row_count:
+			raise IndexError("Row index out of range")
+
+		return TRTColumnStoreRow(self, row)
+
+	def __iter__(self) -> typing.Iterator[TRTColumnStoreRow]:
+		return (TRTColumnStoreRow(self, row) for row in range(self._row_count))
+
+	def fields(self) -> list[str]:
+		"""Field names of all stored columns"""
+		return list(self._columns)
+
+	def append(self, timeline:typing.Mapping[str, viewitems.TRTAbstractViewItem]):
+		"""Encode a row of view items into the columns"""
+
+		for field_name, item in timeline.items():
+
+			if item is None:
+				continue
+
+			self._columnForItem(field_name, item).append(item)
+			self._keepOverrides(self._row_count, field_name, item)
+
+		self._row_count += 1
+
+		# Fill in fields this row didn't have
+		for column in self._columns.values():
+			if len(column) < self._row_count:
+				column.append(None)
+
+	def extend(self, timelines:typing.Iterable[typing.Mapping[str, viewitems.TRTAbstractViewItem]]):
+		for timeline in timelines:
+			self.append(timeline)
+
+	def _columnForItem(self, field_name:str, item:viewitems.TRTAbstractViewItem) -> TRTAbstractColumn:
+		"""The column to store an item in, creating or converting the column as needed"""
+
+		column = self._columns.get(field_name)
+
+		if column is None:
+			column = get_column_for_item(item)
+			column.pad(self._row_count)
+			self._columns[field_name] = column
+
+		elif not column.accepts(item):
+			column = TRTObjectColumn.from_column(column)
+			self._columns[field_name] = column
+
+		return column
+
+	def insert(self, row:int, timelines:typing.Iterable[typing.Mapping[str, viewitems.TRTAbstractViewItem]]):
+		"""Insert rows of view items before the given row"""
+
+		row_count_before = self._row_count
+		inserted_items = []
+
+		for offset, timeline in enumerate(timelines):
+
+			for field_name, item in timeline.items():
+				if item is not None:
+					self._columnForItem(field_name, item)
+					inserted_items.append((row + offset, field_name, item))
+
+			for field_name, column in self._columns.items():
+				column.insert(row + offset, timeline.get(field_name))
+
+			self._row_count += 1
+		
+		self._shiftOverrides(row, self._row_count - row_count_before)
+
+		for item_row, field_name, item in inserted_items:
+			self._keepOverrides(item_row, field_name, item)
+
+		# Materialized items are keyed by row
+		self._materialized.clear()
+
+	def set(self, row:int, timeline:typing.Mapping[str, viewitems.TRTAbstractViewItem]):
+		"""Replace all view items in an existing row"""
+
+		for field_name, item in timeline.items():
+			if item is not None:
+				self._columnForItem(field_name, item)
+
+		for field_name, column in self._columns.items():
+			column.set(row, timeline.get(field_name))
+			self._materialized.pop((row, field_name), None)
+			self._overrides.pop((row, field_name), None)
+
+			if timeline.get(field_name) is not None:
+				self._keepOverrides(row, field_name, timeline[field_name])
+
+	def remove(self, first_row:int, last_row:int):
+		"""Remove a range of rows, inclusive"""
+
+		for column in self._columns.values():
+			column.remove(first_row, last_row)
+
+		self._row_count -= last_row - first_row + 1
+		self._materialized.clear()
+
+		for key in [key for key in self._overrides if first_row <= key[0] <= last_row]:
+			del self._overrides[key]
+		self._shiftOverrides(last_row + 1, first_row - last_row - 1)
+
+	def clear(self):
+		self._row_count = 0
+		self._columns = {}
+		self._materialized.clear()
+		self._overrides = {}
+	
+	def _keepOverrides(self, row:int, field_name:str, item:viewitems.TRTAbstractViewItem):
+		"""Keep any role data set on an item with its own `setData()`, which its column can't encode
+
+		Role data the item has only calculated and cached for itself is left out, since it's
+		calculated again when the item is materialized.
+		"""
+
+		if not item._data_roles:
+			return
+		
+		overrides = {role: data for role, data in item._data_roles.items() if data != item._prepare_role(role)}
+
+		if overrides:
+			self._overrides[(row, field_name)] = overrides
+	
+	def _shiftOverrides(self, first_row:int, row_offset:int):
+		"""Move overridden role data along with rows at or after `first_row` (there are rarely many overrides)"""
+
+		if not row_offset or not self._overrides:
+			return
+		
+		self._overrides = {
+			(row + row_offset if row >= first_row else row, field_name): role_data
+			for (row, field_name), role_data in self._overrides.items()
+		}
+	
+	def setItemData(self, row:int, field_name:str, role:QtCore.Qt.ItemDataRole, data:typing.Any) -> bool:
+		"""Override role data for an item, keeping it for as long as the row is in the store"""
+
+		if not self.hasItem(row, field_name):
+			return False
+		
+		key = (row, field_name)
+		self._overrides.setdefault(key, {})[role] = data
+
+		if key in self._materialized:
+			self._materialized[key].setData(role, data)
+		
+		return True
+
+	def sortKeys(self, field_name:str, first_row:int, last_row:int) -> list[typing.Any]:
+		"""Sort keys for a field in a range of rows, inclusive, without materializing view items where possible"""
+
+		column = self._columns.get(field_name)
+		if column is None:
+			return [None] * (last_row - first_row + 1)
+
+		return column.sort_keys(first_row, last_row)
+
+	def hasItem(self, row:int, field_name:str) -> bool:
+		"""Whether a row has an item for a given field"""
+
+		column = self._columns.get(field_name)
+		return column is not None and column.has_item(row)
+
+	def item(self, row:int, field_name:str) -> viewitems.TRTAbstractViewItem|None:
+		"""Get the view item for a given row and field"""
+
+		key = (row, field_name)
+
+		if key in self._materialized:
+			self._materialized.move_to_end(key)
+			return self._materialized[key]
+
+		column = self._columns.get(field_name)
+		if column is None:
+			return None
+
+		item = column.item(row)
+
+		for role, data in self._overrides.get(key, {}).items():
+			item.setData(role, data)
+
+		self._materialized[key] = item
+		if len(self._materialized) > self.MATERIALIZED_ITEMS_MAX:
+			self._materialized.popitem(last=False)
+
+		return item
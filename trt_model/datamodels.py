@@ -1,7 +1,8 @@
-import dataclasses
+import dataclasses, array, typing
 import avbutils
 from datetime import datetime, timezone
 from timecode import TimecodeRange, Timecode
+from .runningtotals import TRTRunningTotals
 
 @dataclasses.dataclass
 class TRTMarkerPresetInfo:
@@ -20,12 +21,192 @@ class TRTMarkerPresetInfo:
 	def match(self, marker:avbutils.MarkerInfo) -> bool:
 		"""Match this preset against a marker in a timeline"""
 
-		return all([
-			self.color   is not None and self.color     ==   marker.color,
-			self.author  is not None and self.author  not in marker.author,
-			self.comment is not None and self.comment not in marker.comment
+		return (
+			(self.color   is None or self.color == marker.color) and
+			(self.author  is None or self.author.casefold()  in (marker.author  or "").casefold()) and
+			(self.comment is None or self.comment.casefold() in (marker.comment or "").casefold())
+		)
+
+
+class TRTSubstringAutomaton:
+	"""Aho-Corasick automaton finding which of a set of casefolded substrings occur in a string, in one pass
+
+	Each substring carries a bitmask; `mask()` returns the masks of all substrings found, OR'd together.
+	"""
+
+	def __init__(self, substrings:typing.Iterable[tuple[str, int]]):
+
+		self._goto:list[dict[str, int]] = [{}]
+		self._fail:list[int] = [0]
+		self._output:list[int] = [0]
+		"""Per state: transitions, failure link, and masks of the substrings ending there"""
+
+		self._masks:dict[str, int] = {}
+		"""Masks by text already searched (the same authors and comments come up a lot)"""
+
+		for substring, mask in substrings:
+
+			state = 0
+			for char in substring.casefold():
+				if char not in self._goto[state]:
+					self._goto.append({})
+					self._fail.append(0)
+					self._output.append(0)
+					self._goto[state][char] = len(self._goto) - 1
+				state = self._goto[state][char]
+			
+			self._output[state] |= mask
+		
+		# Breadth-first from the root's children (which fail back to the root), so failure links always point to finished states
+		queue = list(self._goto[0].values())
+		for state in queue:
+			for char, next_state in self._goto[state].items():
+
+				fail_state = self._fail[state]
+				while fail_state and char not in self._goto[fail_state]:
+					fail_state = self._fail[fail_state]
+
+				self._fail[next_state] = self._goto[fail_state].get(char, 0)
+				self._output[next_state] |= self._output[self._fail[next_state]]
+				queue.append(next_state)
+	
+	def mask(self, text:str|None) -> int:
+		"""Masks of all substrings occurring in `text`"""
+
+		text = text or ""
+
+		try:
+			return self._masks[text]
+		except KeyError:
+			pass
+
+		goto, fail, output = self._goto, self._fail, self._output
+		state = 0
+		found = output[0]	# Empty substrings occur in everything
+
+		for char in text.casefold():
+			while state and char not in goto[state]:
+				state = fail[state]
+			state = goto[state].get(char, 0)
+			found |= output[state]
+		
+		self._masks[text] = found
+		return found
+
+
+class TRTMarkerPresetMatcher:
+	"""Several marker presets compiled to evaluate together in one pass over a timeline's markers
 
-		])
+	Each preset is a bit.  A marker's color picks out the presets accepting it from a
+	precomputed mask, and automata over the casefolded author and comment substrings
+	pick out the rest, so the presets a marker matches are just those masks AND'd together.
+	"""
+
+	def __init__(self, marker_presets:typing.Iterable[TRTMarkerPresetInfo]):
+
+		self._marker_presets = list(marker_presets)
+
+		self._any_color_mask = 0
+		self._color_masks:dict[avbutils.MarkerColors, int] = {}
+		"""Presets accepting any color, and presets accepting each color (including those accepting any)"""
+
+		for idx, preset in enumerate(self._marker_presets):
+			if preset.color is None:
+				self._any_color_mask |= 1 << idx
+			else:
+				self._color_masks[preset.color] = self._color_masks.get(preset.color, 0) | 1 << idx
+		
+		for color in self._color_masks:
+			self._color_masks[color] |= self._any_color_mask
+		
+		# Presets without an author or comment match the empty substring, which is in everything
+		self._author_automaton  = TRTSubstringAutomaton((preset.author  or "", 1 << idx) for idx, preset in enumerate(self._marker_presets))
+		self._comment_automaton = TRTSubstringAutomaton((preset.comment or "", 1 << idx) for idx, preset in enumerate(self._marker_presets))
+	
+	def markerPresets(self) -> list[TRTMarkerPresetInfo]:
+		return self._marker_presets
+	
+	def matchMask(self, marker:avbutils.MarkerInfo) -> int:
+		"""Bitmask of the presets (by index) matching a marker"""
+
+		mask = self._color_masks.get(marker.color, self._any_color_mask)
+
+		if mask:
+			mask &= self._author_automaton.mask(marker.author)
+
+		if mask:
+			mask &= self._comment_automaton.mask(marker.comment)
+
+		return mask
+	
+	def matchMarkers(self, markers:typing.Iterable[avbutils.MarkerInfo]) -> list[tuple[avbutils.MarkerInfo|None, avbutils.MarkerInfo|None]]:
+		"""The first and last marker matching each preset, in preset order"""
+
+		first:list[avbutils.MarkerInfo|None] = [None] * len(self._marker_presets)
+		last:list[avbutils.MarkerInfo|None]  = [None] * len(self._marker_presets)
+
+		for marker in markers:
+
+			mask = self.matchMask(marker)
+
+			while mask:
+
+				low_bit = mask & -mask
+				idx = low_bit.bit_length() - 1
+				mask ^= low_bit
+
+				if first[idx] is None or marker.frm_offset < first[idx].frm_offset:
+					first[idx] = marker
+				if last[idx] is None or marker.frm_offset > last[idx].frm_offset:
+					last[idx] = marker
+		
+		return list(zip(first, last))
+
+
+class TRTMarkerIndex:
+	"""A timeline's markers, sorted by offset once and grouped by color and author for matching presets"""
+
+	def __init__(self, markers:typing.Iterable[avbutils.MarkerInfo]):
+
+		self._markers = sorted(markers, key=lambda m: m.frm_offset)
+		"""All markers, in timeline order"""
+
+		self._by_color:dict[avbutils.MarkerColors, dict[str, list[avbutils.MarkerInfo]]] = {}
+		"""Markers in timeline order, by color and then by author"""
+
+		for marker in self._markers:
+			self._by_color.setdefault(marker.color, {}).setdefault(marker.author or "", []).append(marker)
+	
+	def markers(self) -> list[avbutils.MarkerInfo]:
+		"""All markers, in timeline order"""
+		return self._markers
+	
+	def find(self, marker_preset:TRTMarkerPresetInfo, from_end:bool=False) -> avbutils.MarkerInfo|None:
+		"""The first (or last) marker matching a preset"""
+
+		if marker_preset.color is None:
+			by_author_groups = self._by_color.values()
+		elif marker_preset.color in self._by_color:
+			by_author_groups = [self._by_color[marker_preset.color]]
+		else:
+			return None
+
+		found = None
+
+		for by_author in by_author_groups:
+			for author, markers in by_author.items():
+
+				if marker_preset.author is not None and marker_preset.author.casefold() not in author.casefold():
+					continue
+
+				# Markers are in order, so only the first that matches the comment in each group is a candidate
+				for marker in reversed(markers) if from_end else markers:
+					if marker_preset.comment is None or marker_preset.comment.casefold() in (marker.comment or "").casefold():
+						if found is None or (marker.frm_offset > found.frm_offset if from_end else marker.frm_offset < found.frm_offset):
+							found = marker
+						break
+		
+		return found
 
 
 # I think  COMBINE  these into one thing
@@ -64,6 +245,7 @@ class TRTTrimmedTimelineInfo:
 	def __init__(self, timeline_info:TRTTimelineInfo):
 		
 		self._timeline_info = timeline_info
+		self._marker_index  = TRTMarkerIndex(timeline_info.markers)
 
 		# Basic info interpreted to Qt objects
 		# self._clip_color = QtGui.QColor.fromRgba64(*self._timeline_info.timeline_color.as_rgb16(), self._timeline_info.timeline_color.max_16b()) if self._timeline_info.timeline_color else QtGui.QColor()
@@ -180,19 +362,347 @@ class TRTTrimmedTimelineInfo:
 	def _findMarkerFromPreset(self, marker_preset:TRTMarkerPresetInfo, from_end:bool=False):
 		"""Match a marker to the given preset criteria"""
 
-		for marker_info in sorted(self._timeline_info.markers, key=lambda m: m.frm_offset, reverse=from_end):
-			if marker_preset.match(marker_info):
-				return marker_info
-		
-		return None
+		return self._marker_index.find(marker_preset, from_end=from_end)
 
 
 
 class TRTDataModel:
+	"""Trims for every timeline in a session, calculated in batches
+
+	Start, end and duration frame counts for all timelines are kept in arrays, so
+	changing the global FFOA/LFOA or a marker preset recalculates every trimmed range,
+	FFOA/LFOA offset and the total running time in one pass over plain integers.
+	`Timecode`s are only created when a particular timeline's values are asked for.
+
+	Trimmed durations are also kept as running totals in timeline order, so changing
+	one timeline's trim (or swapping two) updates the session totals in O(log n).
+	"""
+
+	NO_MARKER:int = -1
+	"""Stored in place of a marker offset for timelines without a matching marker"""
 
 	def __init__(self):
 
 		self._marker_presets:list[TRTMarkerPresetInfo] = []
-		self._timelines:list[TRTTrimmedTimelineInfo] = []
+		self._timelines:list[TRTTimelineInfo] = []
+
+		self._marker_preset_matcher = TRTMarkerPresetMatcher([])
+		self._preset_first_frames:list[array.array] = []
+		self._preset_last_frames:list[array.array]  = []
+		"""For each of `_marker_presets`: offset of the first/last matching marker in each timeline (or `NO_MARKER`)"""
+
+		self._marker_indexes:list[TRTMarkerIndex] = []
+		"""Markers of each timeline, indexed for matching presets"""
+
+		self._rates:list[int|float] = []
+		"""Timecode rate of each timeline"""
 
+		self._start_frames    = array.array("q")
+		self._end_frames      = array.array("q")
+		self._duration_frames = array.array("q")
 
+		self._global_ffoa = 0
+		self._global_lfoa = 0
+		"""Default FFOA/LFOA offsets in frames, for timelines without a matched marker"""
+
+		self._marker_preset_ffoa:TRTMarkerPresetInfo|None = None
+		self._marker_preset_lfoa:TRTMarkerPresetInfo|None = None
+
+		self._marker_ffoa_frames = array.array("q")
+		self._marker_lfoa_frames = array.array("q")
+		"""Offset of the marker matched by the current FFOA/LFOA preset in each timeline (or `NO_MARKER`)"""
+
+		self._ffoa_offsets = array.array("q")
+		self._lfoa_offsets = array.array("q")
+		"""Resolved FFOA/LFOA offsets in frames for each timeline"""
+
+		self._running_totals = TRTRunningTotals()
+		"""Trimmed duration of each timeline in frames, with running totals in timeline order"""
+	
+	def timelineCount(self) -> int:
+		return len(self._timelines)
+	
+	def timelineInfo(self, index:int) -> TRTTimelineInfo:
+		return self._timelines[index]
+	
+	def addTimelines(self, timeline_infos:typing.Iterable[TRTTimelineInfo]):
+		"""Add timelines and calculate their trims"""
+
+		for timeline_info in timeline_infos:
+
+			tc_range = timeline_info.timeline_tc_range
+
+			self._timelines.append(timeline_info)
+			self._rates.append(tc_range.rate)
+			self._start_frames.append(tc_range.start.frame_number)
+			self._end_frames.append(tc_range.end.frame_number)
+			self._duration_frames.append(tc_range.duration.frame_number if isinstance(tc_range.duration, Timecode) else int(tc_range.duration))
+			marker_index = TRTMarkerIndex(timeline_info.markers)
+			self._marker_indexes.append(marker_index)
+			self._matchMarkerPresets(marker_index)
+			self._marker_ffoa_frames.append(self._findMarkerOffset(marker_index, self._marker_preset_ffoa, from_end=False))
+			self._marker_lfoa_frames.append(self._findMarkerOffset(marker_index, self._marker_preset_lfoa, from_end=True))
+
+			ffoa_offset, lfoa_offset = self._resolveTrim(len(self._timelines) - 1)
+			self._ffoa_offsets.append(ffoa_offset)
+			self._lfoa_offsets.append(lfoa_offset)
+			self._running_totals.append(self._duration_frames[-1] - ffoa_offset - lfoa_offset)
+	
+	def addTimeline(self, timeline_info:TRTTimelineInfo):
+		self.addTimelines([timeline_info])
+	
+	def clear(self):
+		"""Remove all timelines, keeping the current global offsets and marker presets"""
+
+		for frames in self._timelineSequences():
+			del frames[:]
+		
+		self._updateTrims()
+	
+	def _timelineSequences(self) -> list[typing.MutableSequence]:
+		"""Everything kept per timeline, in timeline order"""
+
+		return [
+			self._timelines, self._marker_indexes, self._rates,
+			self._start_frames, self._end_frames, self._duration_frames,
+			self._marker_ffoa_frames, self._marker_lfoa_frames,
+			self._ffoa_offsets, self._lfoa_offsets,
+			*self._preset_first_frames, *self._preset_last_frames,
+		]
+	
+	def moveTimeline(self, index:int, to_index:int):
+		"""Move a timeline to a new position in the session order"""
+
+		if index == to_index:
+			return
+
+		# Adjacent moves are the common case when reordering reels
+		if abs(index - to_index) == 1:
+			self.swapTimelines(index, to_index)
+			return
+
+		for values in self._timelineSequences():
+			values.insert(to_index, values.pop(index))
+		
+		self._running_totals.move(index, to_index)
+	
+	def swapTimelines(self, index:int, other_index:int):
+		"""Exchange the positions of two timelines in the session order"""
+
+		for values in self._timelineSequences():
+			values[index], values[other_index] = values[other_index], values[index]
+		
+		self._running_totals.swap(index, other_index)
+	
+	# Setters & Dynamic stuff
+	def setGlobalFFOA(self, ffoa_offset:Timecode|int):
+		"""Set the FFOA offset used for every timeline without a matched FFOA marker"""
+
+		self._global_ffoa = ffoa_offset.frame_number if isinstance(ffoa_offset, Timecode) else int(ffoa_offset)
+		self._updateTrims()
+	
+	def setGlobalLFOA(self, lfoa_offset:Timecode|int):
+		"""Set the LFOA offset used for every timeline without a matched LFOA marker"""
+
+		self._global_lfoa = lfoa_offset.frame_number if isinstance(lfoa_offset, Timecode) else int(lfoa_offset)
+		self._updateTrims()
+	
+	def setTimelineFFOA(self, index:int, ffoa_offset:Timecode|int|None):
+		"""Override the FFOA offset for one timeline (`None` to use the global FFOA), until the next FFOA preset is set"""
+
+		self._marker_ffoa_frames[index] = self.NO_MARKER if ffoa_offset is None else ffoa_offset.frame_number if isinstance(ffoa_offset, Timecode) else int(ffoa_offset)
+		self._updateTrim(index)
+	
+	def setTimelineLFOA(self, index:int, lfoa_offset:Timecode|int|None):
+		"""Override the LFOA offset for one timeline (`None` to use the global LFOA), until the next LFOA preset is set"""
+
+		self._marker_lfoa_frames[index] = self.NO_MARKER if lfoa_offset is None else lfoa_offset.frame_number if isinstance(lfoa_offset, Timecode) else int(lfoa_offset)
+		self._updateTrim(index)
+	
+	def setTimelineMarkerFFOA(self, index:int, marker_info:avbutils.MarkerInfo|None):
+		"""Use a particular marker as one timeline's FFOA (`None` to use the global FFOA)"""
+		self.setTimelineFFOA(index, marker_info.frm_offset if marker_info is not None else None)
+	
+	def setTimelineMarkerLFOA(self, index:int, marker_info:avbutils.MarkerInfo|None):
+		"""Use a particular marker as one timeline's LFOA (`None` to use the global LFOA)"""
+		self.setTimelineLFOA(index, marker_info.frm_offset if marker_info is not None else None)
+	
+	def markerPresets(self) -> list[TRTMarkerPresetInfo]:
+		return self._marker_presets
+	
+	def setMarkerPresets(self, marker_presets:typing.Iterable[TRTMarkerPresetInfo]):
+		"""Set the presets offered to the user, and match all of them against every timeline in one pass
+		
+		Switching FFOA/LFOA between these presets then needs no rescanning of markers.
+		"""
+
+		self._marker_presets = list(marker_presets)
+		self._marker_preset_matcher = TRTMarkerPresetMatcher(self._marker_presets)
+
+		self._preset_first_frames = [array.array("q") for _ in self._marker_presets]
+		self._preset_last_frames  = [array.array("q") for _ in self._marker_presets]
+
+		for marker_index in self._marker_indexes:
+			self._matchMarkerPresets(marker_index)
+	
+	def _matchMarkerPresets(self, marker_index:TRTMarkerIndex):
+		"""Append the first and last marker offsets for each preset in a timeline"""
+
+		if not self._marker_presets:
+			return
+
+		for idx, (first, last) in enumerate(self._marker_preset_matcher.matchMarkers(marker_index.markers())):
+			self._preset_first_frames[idx].append(first.frm_offset if first is not None else self.NO_MARKER)
+			self._preset_last_frames[idx].append(last.frm_offset if last is not None else self.NO_MARKER)
+	
+	def _presetIndex(self, marker_preset:TRTMarkerPresetInfo) -> int|None:
+		"""Index of a preset in `_marker_presets`, if it's one of them"""
+
+		try:
+			return self._marker_presets.index(marker_preset)
+		except ValueError:
+			return None
+	
+	def setMarkerFFOAFromPreset(self, marker_preset:TRTMarkerPresetInfo|None):
+		"""Use the first marker in each timeline matching a preset as its FFOA (`None` to use the global FFOA)"""
+
+		self._marker_preset_ffoa = marker_preset
+		preset_index = self._presetIndex(marker_preset) if marker_preset is not None else None
+
+		if preset_index is not None:
+			self._marker_ffoa_frames = array.array("q", self._preset_first_frames[preset_index])
+		else:
+			self._marker_ffoa_frames = array.array("q", (self._findMarkerOffset(marker_index, marker_preset, from_end=False) for marker_index in self._marker_indexes))
+		
+		self._updateTrims()
+	
+	def setMarkerLFOAFromPreset(self, marker_preset:TRTMarkerPresetInfo|None):
+		"""Use the last marker in each timeline matching a preset as its LFOA (`None` to use the global LFOA)"""
+
+		self._marker_preset_lfoa = marker_preset
+		preset_index = self._presetIndex(marker_preset) if marker_preset is not None else None
+
+		if preset_index is not None:
+			self._marker_lfoa_frames = array.array("q", self._preset_last_frames[preset_index])
+		else:
+			self._marker_lfoa_frames = array.array("q", (self._findMarkerOffset(marker_index, marker_preset, from_end=True) for marker_index in self._marker_indexes))
+		
+		self._updateTrims()
+	
+	def _findMarkerOffset(self, marker_index:TRTMarkerIndex, marker_preset:TRTMarkerPresetInfo|None, from_end:bool) -> int:
+		"""Offset of the first (or last) marker in a timeline matching a preset"""
+
+		if marker_preset is None:
+			return self.NO_MARKER
+
+		marker_info = marker_index.find(marker_preset, from_end=from_end)
+		return marker_info.frm_offset if marker_info is not None else self.NO_MARKER
+	
+	def _updateTrims(self):
+		"""Recalculate FFOA/LFOA offsets for all timelines, and the total running time"""
+
+		global_ffoa = self._global_ffoa
+		global_lfoa = self._global_lfoa
+		no_marker   = self.NO_MARKER
+
+		# FFOA offset must be less than the total duration of the sequence
+		self._ffoa_offsets = array.array("q", (
+			min(global_ffoa if marker_ffoa == no_marker else marker_ffoa, duration)
+			for marker_ffoa, duration in zip(self._marker_ffoa_frames, self._duration_frames)
+		))
+
+		# LFOA offset must be less than total duration minus FFOA
+		self._lfoa_offsets = array.array("q", (
+			min(global_lfoa if marker_lfoa == no_marker else marker_lfoa, duration - ffoa)
+			for marker_lfoa, duration, ffoa in zip(self._marker_lfoa_frames, self._duration_frames, self._ffoa_offsets)
+		))
+
+		self._running_totals.reset(
+			duration - ffoa - lfoa
+			for duration, ffoa, lfoa in zip(self._duration_frames, self._ffoa_offsets, self._lfoa_offsets)
+		)
+	
+	def _resolveTrim(self, index:int) -> tuple[int, int]:
+		"""FFOA and LFOA offsets in frames for one timeline"""
+
+		duration    = self._duration_frames[index]
+		marker_ffoa = self._marker_ffoa_frames[index]
+		marker_lfoa = self._marker_lfoa_frames[index]
+
+		ffoa_offset = min(self._global_ffoa if marker_ffoa == self.NO_MARKER else marker_ffoa, duration)
+		lfoa_offset = min(self._global_lfoa if marker_lfoa == self.NO_MARKER else marker_lfoa, duration - ffoa_offset)
+
+		return ffoa_offset, lfoa_offset
+	
+	def _updateTrim(self, index:int):
+		"""Recalculate one timeline's offsets, and the running totals after it"""
+
+		ffoa_offset, lfoa_offset = self._resolveTrim(index)
+
+		self._ffoa_offsets[index] = ffoa_offset
+		self._lfoa_offsets[index] = lfoa_offset
+		self._running_totals.set(index, self._duration_frames[index] - ffoa_offset - lfoa_offset)
+	
+	def ffoaOffsetFrames(self) -> typing.Sequence[int]:
+		"""Duration from head to FFOA for each timeline, in frames"""
+		return self._ffoa_offsets
+	
+	def lfoaOffsetFrames(self) -> typing.Sequence[int]:
+		"""Duration from LFOA to tail for each timeline, in frames"""
+		return self._lfoa_offsets
+	
+	def ffoaOffset(self, index:int) -> Timecode:
+		"""Duration from head to FFOA"""
+		return Timecode(self._ffoa_offsets[index], rate=self._rates[index])
+	
+	def lfoaOffset(self, index:int) -> Timecode:
+		"""Duration from LFOA to tail"""
+		return Timecode(self._lfoa_offsets[index], rate=self._rates[index])
+	
+	def timelineTimecodeTrimmed(self, index:int) -> TimecodeRange:
+		"""Trimmed timecode range (FFOA -> LFOA)"""
+
+		rate = self._rates[index]
+
+		return TimecodeRange(
+			start = Timecode(self._start_frames[index] + self._ffoa_offsets[index], rate=rate),
+			end   = Timecode(self._end_frames[index]   - self._lfoa_offsets[index], rate=rate),
+		)
+	
+	def trimmedDurationFrames(self) -> typing.Sequence[int]:
+		"""Trimmed duration of each timeline, in frames"""
+		return self._running_totals.values()
+	
+	def trimmedDuration(self, index:int) -> Timecode:
+		"""Trimmed duration of a timeline"""
+		return Timecode(self._running_totals.value(index), rate=self._rates[index])
+	
+	def runningTimeFrames(self, index:int) -> int:
+		"""Combined trimmed duration of the timelines up to and including `index`, in frames (as for `TRTFeetFramesViewItem`)"""
+		return self._running_totals.runningTotal(index)
+	
+	def runningTime(self, index:int) -> Timecode:
+		"""Combined trimmed duration of the timelines up to and including `index`"""
+		return Timecode(self.runningTimeFrames(index), rate=self._sessionRate())
+	
+	def rangeRunningTimeFrames(self, first_index:int, last_index:int) -> int:
+		"""Combined trimmed duration of a range of timelines, inclusive, in frames"""
+		return self._running_totals.rangeTotal(first_index, last_index)
+	
+	def totalRunningTimeFrames(self) -> int:
+		"""Combined duration of all trimmed timelines, in frames (as for `TRTFeetFramesViewItem`)"""
+		return self._running_totals.total()
+	
+	def totalRunningTime(self) -> Timecode:
+		"""Combined duration of all trimmed timelines"""
+		return Timecode(self.totalRunningTimeFrames(), rate=self._sessionRate())
+	
+	def _sessionRate(self) -> int|float:
+		"""The timecode rate shared by all timelines, for totalling them"""
+
+		rates = set(self._rates)
+
+		if len(rates) > 1:
+			raise ValueError("Timelines with different timecode rates can't be totalled as one timecode")
+		
+		return rates.pop() if rates else 24
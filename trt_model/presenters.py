@@ -17,14 +17,28 @@ class LBAbstractPresenter(QtCore.QObject):
 	def addRow(self, row_data:dict[str,viewitems.TRTAbstractViewItem]):
 		self._view_model.addTimeline(row_data)
 	
-	def addHeader(self, header_data:viewitems.TRTAbstractViewHeaderItem):
-		self._view_model.addHeader(header_data)
+	def addRows(self, rows:typing.Iterable[dict[str,viewitems.TRTAbstractViewItem]]):
+		self._view_model.addTimelines(rows)
+	
+	def addHeader(self, header_data:viewitems.TRTAbstractViewHeaderItem, column:int=0):
+		self._view_model.addHeader(header_data, column)
+	
+	def setHeaders(self, headers:typing.Iterable[viewitems.TRTAbstractViewHeaderItem]):
+		"""Replace all headers, in column order"""
+		self._view_model.setHeaders(headers)
 	
 
 class LBItemDefinitionView(LBAbstractPresenter):
 
 	@QtCore.Slot(object)
 	def addRow(self, row_data:dict[viewitems.TRTAbstractViewHeaderItem|str,viewitems.TRTAbstractViewItem|typing.Any], add_new_headers:bool=False):
+		return super().addRow(self._processRow(row_data, add_new_headers))
+	
+	@QtCore.Slot(object)
+	def addRows(self, rows:typing.Iterable[dict[viewitems.TRTAbstractViewHeaderItem|str,viewitems.TRTAbstractViewItem|typing.Any]], add_new_headers:bool=False):
+		return super().addRows([self._processRow(row_data, add_new_headers) for row_data in rows])
+	
+	def _processRow(self, row_data:dict[viewitems.TRTAbstractViewHeaderItem|str,viewitems.TRTAbstractViewItem|typing.Any], add_new_headers:bool=False) -> dict[str,viewitems.TRTAbstractViewItem]:
 		processed_row = dict()
 
 		for term, definition in row_data.items():
@@ -35,7 +49,7 @@ class LBItemDefinitionView(LBAbstractPresenter):
 			definition = self._buildViewItem(definition)
 			processed_row[term.field_name()] = definition
 
-		return super().addRow(processed_row)
+		return processed_row
 	
 	def _buildViewHeader(self, term:typing.Any) -> viewitems.TRTAbstractViewHeaderItem:
 		if isinstance(term, viewitems.TRTAbstractViewHeaderItem):
@@ -0,0 +1,145 @@
+"""
+Shared Qt Resource Caches for View Items
+"""
+
+import typing, collections
+from PySide6 import QtCore, QtGui, QtWidgets
+
+T = typing.TypeVar("T")
+
+class TRTResourceCache(typing.Generic[T]):
+	"""A bounded least-recently-used cache that keeps count of its hits and misses"""
+
+	def __init__(self, max_size:int=256):
+
+		self._max_size = max_size
+		self._resources:collections.OrderedDict[typing.Hashable, T] = collections.OrderedDict()
+
+		self._hits   = 0
+		self._misses = 0
+
+	def get(self, key:typing.Hashable, factory:typing.Callable[[], T]) -> T:
+		"""Get the resource for a key, creating it with `factory()` if it isn't cached"""
+
+		try:
+			resource = self._resources[key]
+
+		except KeyError:
+			self._misses += 1
+			resource = self._resources[key] = factory()
+
+			if len(self._resources) > self._max_size:
+				self._resources.popitem(last=False)
+
+		else:
+			self._hits += 1
+			self._resources.move_to_end(key)
+
+		return resource
+
+	def clear(self):
+		"""Remove all cached resources and reset the counters"""
+
+		self._resources.clear()
+		self._hits   = 0
+		self._misses = 0
+
+	def hits(self) -> int:
+		"""Number of lookups that found a cached resource"""
+		return self._hits
+
+	def misses(self) -> int:
+		"""Number of lookups that had to create a resource"""
+		return self._misses
+
+	def maxSize(self) -> int:
+		"""Maximum number of resources to keep"""
+		return self._max_size
+
+	def setMaxSize(self, max_size:int):
+		"""Set the maximum number of resources to keep, evicting the oldest as needed"""
+
+		self._max_size = max_size
+
+		while len(self._resources) > self._max_size:
+			self._resources.popitem(last=False)
+
+	def __len__(self) -> int:
+		return len(self._resources)
+
+
+ICON_CACHE:TRTResourceCache[QtGui.QIcon] = TRTResourceCache(max_size=256)
+"""Icons by file type or theme icon"""
+
+FONT_CACHE:TRTResourceCache[str] = TRTResourceCache(max_size=16)
+"""Font families by font role"""
+
+COLOR_CACHE:TRTResourceCache[QtGui.QColor] = TRTResourceCache(max_size=64)
+"""Colors by name"""
+
+_file_icon_provider:QtWidgets.QFileIconProvider|None = None
+"""Shared icon provider for file icons (created on first use, once there's a `QApplication`)"""
+
+_sort_collator:QtCore.QCollator|None = None
+"""Shared collator for natural sorting (created on first use)"""
+
+
+def icon_for_file_info(file_info:QtCore.QFileInfo) -> QtGui.QIcon:
+	"""Icon for a file, shared between all files with the same suffix"""
+
+	def create_icon() -> QtGui.QIcon:
+
+		global _file_icon_provider
+
+		if _file_icon_provider is None:
+			_file_icon_provider = QtWidgets.QFileIconProvider()
+
+		return _file_icon_provider.icon(file_info)
+
+	key = ("dir",) if file_info.isDir() else ("file", file_info.suffix().casefold())
+	return ICON_CACHE.get(key, create_icon)
+
+def icon_from_theme(theme_icon:QtGui.QIcon.ThemeIcon|str|None) -> QtGui.QIcon:
+	"""Icon from the current theme (or an empty icon for `None`)"""
+
+	return ICON_CACHE.get(("theme", theme_icon), lambda: QtGui.QIcon.fromTheme(theme_icon) if theme_icon is not None else QtGui.QIcon())
+
+def system_font_family(system_font:QtGui.QFontDatabase.SystemFont) -> str:
+	"""Family name of a system font role (fixed-width, title, etc)"""
+
+	return FONT_CACHE.get(("system_family", system_font), lambda: QtGui.QFontDatabase.systemFont(system_font).family())
+
+def color_from_name(color_name:str) -> QtGui.QColor:
+	"""Color from a name Qt understands (e.g. marker color names)"""
+
+	return COLOR_CACHE.get(color_name, lambda: QtGui.QColor(color_name))
+
+def sort_collator() -> QtCore.QCollator:
+	"""Collator mimicking Avid natural sorting (9 before 10, case-insensitive)"""
+
+	global _sort_collator
+
+	if _sort_collator is None:
+		_sort_collator = QtCore.QCollator()
+		_sort_collator.setNumericMode(True)
+		_sort_collator.setCaseSensitivity(QtCore.Qt.CaseSensitivity.CaseInsensitive)
+	
+	return _sort_collator
+
+def collation_key(text:str) -> QtCore.QCollatorSortKey:
+	"""Precomputed natural sort key for a string, much cheaper to compare than the string itself"""
+	return sort_collator().sortKey(text)
+
+def clear_caches():
+	"""Clear all resource caches (e.g. after the theme or system fonts change)"""
+
+	for cache in (ICON_CACHE, FONT_CACHE, COLOR_CACHE):
+		cache.clear()
+
+def cache_stats() -> dict[str, dict[str, int]]:
+	"""Size, hits and misses for each resource cache"""
+
+	return {
+		cache_name: {"size": len(cache), "hits": cache.hits(), "misses": cache.misses()}
+		for cache_name, cache in (("icons", ICON_CACHE), ("fonts", FONT_CACHE), ("colors", COLOR_CACHE))
+	}
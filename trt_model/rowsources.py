@@ -0,0 +1,55 @@
+"""
+Row Sources for Lazily Loaded View Models
+"""
+
+import typing
+from .viewitems import TRTAbstractViewItem
+
+
+class TRTAbstractRowSource:
+	"""Rows of view items, read a range at a time by `TRTLazyTimelineViewModel`
+
+	Sources should be cheap to count, and build view items only for the rows asked for.
+	"""
+
+	def rowCount(self) -> int:
+		"""Total number of rows available"""
+		raise NotImplementedError
+
+	def rows(self, first_row:int, last_row:int) -> list[dict[str, TRTAbstractViewItem]]:
+		"""View items by field name for a range of rows, inclusive"""
+		raise NotImplementedError
+
+
+class TRTRecordRowSource(TRTAbstractRowSource):
+	"""Rows built on demand from a sequence of plain records
+
+	For example: mob records from the on-disk bin cache, or the items of a parsed bin,
+	with `row_factory` turning one record into its view items.
+	"""
+
+	def __init__(self, records:typing.Sequence[typing.Any], row_factory:typing.Callable[[typing.Any], dict[str, TRTAbstractViewItem]]):
+
+		self._records     = records
+		self._row_factory = row_factory
+
+	def rowCount(self) -> int:
+		return len(self._records)
+
+	def rows(self, first_row:int, last_row:int) -> list[dict[str, TRTAbstractViewItem]]:
+		return [self._row_factory(record) for record in self._records[first_row:last_row+1]]
+
+
+class TRTGeneratedRowSource(TRTAbstractRowSource):
+	"""Rows built on demand from their row number, such as synthetic test data"""
+
+	def __init__(self, row_count:int, row_factory:typing.Callable[[int], dict[str, TRTAbstractViewItem]]):
+
+		self._row_count   = row_count
+		self._row_factory = row_factory
+
+	def rowCount(self) -> int:
+		return self._row_count
+
+	def rows(self, first_row:int, last_row:int) -> list[dict[str, TRTAbstractViewItem]]:
+		return [self._row_factory(row) for row in range(first_row, min(last_row, self._row_count - 1) + 1)]
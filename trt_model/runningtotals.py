@@ -0,0 +1,113 @@
+"""
+Running Totals Over Ordered Values
+"""
+
+import typing, array
+
+
+class TRTRunningTotals:
+	"""Prefix sums over a sequence of integers, kept up to date as values change
+
+	Values are held in a Fenwick (binary indexed) tree, so changing one value or
+	asking for the total up to any position both take O(log n), instead of
+	re-summing every value before it.
+	"""
+
+	def __init__(self, values:typing.Iterable[int]=()):
+
+		self._values = array.array("q")
+		"""The values themselves, in order"""
+
+		self._tree = array.array("q")
+		"""Fenwick tree: `_tree[i]` sums the `i & -i` values ending at position `i` (1-based)"""
+
+		self.reset(values)
+
+	def reset(self, values:typing.Iterable[int]):
+		"""Replace all values, building the tree in O(n)"""
+
+		self._values = array.array("q", values)
+		self._tree = array.array("q", [0])
+		self._tree.extend(self._values)
+
+		for idx in range(1, len(self._tree)):
+			parent = idx + (idx & -idx)
+			if parent < len(self._tree):
+				self._tree[parent] += self._tree[idx]
+
+	def __len__(self) -> int:
+		return len(self._values)
+
+	def value(self, index:int) -> int:
+		return self._values[index]
+
+	def values(self) -> typing.Sequence[int]:
+		return self._values
+
+	def set(self, index:int, value:int):
+		"""Change one value, in O(log n)"""
+
+		delta = value - self._values[index]
+
+		if not delta:
+			return
+
+		self._values[index] = value
+
+		idx = index + 1
+		while idx < len(self._tree):
+			self._tree[idx] += delta
+			idx += idx & -idx
+
+	def append(self, value:int):
+		"""Add a value to the end, in O(log n)"""
+
+		self._values.append(value)
+
+		# The new node covers the values ending here, which are the sums of its children plus itself
+		idx = len(self._tree)
+		node_total = value
+		child = idx - 1
+		while child > idx - (idx & -idx):
+			node_total += self._tree[child]
+			child -= child & -child
+
+		self._tree.append(node_total)
+
+	def swap(self, index:int, other_index:int):
+		"""Exchange two values, in O(log n)"""
+
+		value, other_value = self._values[index], self._values[other_index]
+		self.set(index, other_value)
+		self.set(other_index, value)
+
+	def move(self, index:int, to_index:int):
+		"""Move a value to a new position, shifting those between (O(n), like any list move)"""
+
+		values = list(self._values)
+		values.insert(to_index, values.pop(index))
+		self.reset(values)
+
+	def runningTotal(self, index:int) -> int:
+		"""Sum of all values up to and including `index`, in O(log n)"""
+
+		total = 0
+
+		idx = index + 1
+		while idx > 0:
+			total += self._tree[idx]
+			idx -= idx & -idx
+
+		return total
+
+	def rangeTotal(self, first_index:int, last_index:int) -> int:
+		"""Sum of values from `first_index` to `last_index`, inclusive"""
+
+		if last_index < first_index:
+			return 0
+
+		return self.runningTotal(last_index) - (self.runningTotal(first_index - 1) if first_index > 0 else 0)
+
+	def total(self) -> int:
+		"""Sum of all values"""
+		return self.runningTotal(len(self._values) - 1) if self._values else 0
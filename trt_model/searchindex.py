@@ -0,0 +1,143 @@
+"""
+Search Index for Finding Text in View Models
+"""
+
+import typing, array, bisect
+
+
+class TRTSearchIndex:
+	"""Casefolded text for each row, searchable all at once
+
+	Rows are kept as "haystack" strings, and joined into one big string for
+	searching so that `str.find()` can skip over non-matching rows without
+	any Python-level looping.
+	"""
+
+	CELL_SEPARATOR:str = "\x1f"
+	"""Placed between cells, so matches can't span two cells"""
+
+	ROW_SEPARATOR:str = "\x1e"
+	"""Placed between rows, so matches can't span two rows"""
+
+	DENSE_MATCH_RATIO:int = 16
+	"""Test each row individually once more than one in this many rows have matched"""
+
+	def __init__(self):
+
+		self._haystacks:list[str] = []
+		"""Casefolded text of each row, in row order"""
+
+		self._corpus:str|None = None
+		"""All haystacks joined together (`None` until it's needed again)"""
+
+		self._row_offsets:array.array = array.array("q")
+		"""Offset of each row's haystack in the corpus"""
+
+		self._generation = 0
+		"""Incremented whenever rows change"""
+
+	@classmethod
+	def haystack(cls, cells:typing.Iterable[str]) -> str:
+		"""Searchable text for a row of cell text"""
+		return cls.CELL_SEPARATOR.join(cells).casefold()
+
+	def __len__(self) -> int:
+		return len(self._haystacks)
+
+	def generation(self) -> int:
+		"""Changes whenever rows are inserted, removed or changed, so row numbers from earlier searches can be checked"""
+		return self._generation
+
+	def insertRows(self, first_row:int, rows:typing.Iterable[typing.Iterable[str]]):
+		"""Insert rows of cell text before the given row"""
+
+		self._haystacks[first_row:first_row] = [self.haystack(cells) for cells in rows]
+		self._rowsChanged()
+
+	def removeRows(self, first_row:int, last_row:int):
+		"""Remove a range of rows, inclusive"""
+
+		del self._haystacks[first_row:last_row+1]
+		self._rowsChanged()
+
+	def setRow(self, row:int, cells:typing.Iterable[str]):
+		"""Replace the text of an existing row"""
+
+		self._haystacks[row] = self.haystack(cells)
+		self._rowsChanged()
+
+	def clear(self):
+
+		self._haystacks = []
+		self._rowsChanged()
+
+	def snapshot(self) -> "TRTSearchIndex":
+		"""A copy of the index which won't change along with this one, for searching from another thread"""
+
+		snapshot = TRTSearchIndex()
+		snapshot._haystacks   = list(self._haystacks)
+		snapshot._corpus      = self._corpus
+		snapshot._row_offsets = self._row_offsets
+		snapshot._generation  = self._generation
+
+		return snapshot
+
+	def _rowsChanged(self):
+
+		self._corpus = None
+		self._generation += 1
+
+	def _buildCorpus(self):
+		"""Join all haystacks into one string and note where each one starts"""
+
+		self._corpus = self.ROW_SEPARATOR.join(self._haystacks)
+
+		offsets = array.array("q", bytes(8 * len(self._haystacks)))
+		offset  = 0
+
+		for row, haystack in enumerate(self._haystacks):
+			offsets[row] = offset
+			offset += len(haystack) + len(self.ROW_SEPARATOR)
+
+		self._row_offsets = offsets
+
+	def search(self, text:str, within:typing.Iterable[int]|None=None) -> list[int]:
+		"""Rows containing the text (case-insensitive), in row order
+
+		If `within` is given, only those rows are tested.  This is useful to refine a previous search:
+		every row that matches "abc" must have also matched "ab".
+		"""
+
+		needle = text.casefold()
+
+		if within is not None:
+			return [row for row in within if needle in self._haystacks[row]]
+
+		if not needle:
+			return list(range(len(self._haystacks)))
+
+		if self._corpus is None:
+			self._buildCorpus()
+
+		corpus      = self._corpus
+		row_offsets = self._row_offsets
+		row_count   = len(self._haystacks)
+
+		matches = []
+		match_position = corpus.find(needle)
+
+		while match_position != -1:
+
+			# Jumping between matches only pays off when they're sparse
+			if len(matches) > row_count // self.DENSE_MATCH_RATIO:
+				return [row for row, haystack in enumerate(self._haystacks) if needle in haystack]
+
+			row = bisect.bisect_right(row_offsets, match_position) - 1
+			matches.append(row)
+
+			# Skip ahead to the next row
+			if row + 1 >= row_count:
+				break
+			match_position = corpus.find(needle, row_offsets[row + 1])
+
+		return matches
@@ -0,0 +1,287 @@
+"""
+Project-Wide Index of Timelines Across Many Bins
+"""
+
+import os, time, typing, pickle, sqlite3, contextlib, datetime, dataclasses
+from PySide6 import QtCore
+from . import datamodels, binscanner
+
+
+@dataclasses.dataclass
+class TRTTimelineIndexUpdateStats:
+	"""What an index update found"""
+
+	bins_found:int = 0
+	bins_scanned:int = 0
+	bins_removed:int = 0
+	timelines_indexed:int = 0
+	elapsed:float = 0
+
+
+class TRTTimelineIndex:
+	"""Every sequence in a project's bins, in an SQLite database
+
+	Queries by name, dates and markers are answered from the database without opening
+	any bins.  `update()` rescans only bins whose size or modification time has changed
+	since they were indexed, and forgets bins that have gone.
+	"""
+
+	def __init__(self, database_path:os.PathLike):
+
+		self._database_path = database_path
+
+		os.makedirs(os.path.dirname(os.path.abspath(database_path)), exist_ok=True)
+
+		with self._connect() as db:
+			db.executescript("""
+				CREATE TABLE IF NOT EXISTS bins (
+					path          TEXT PRIMARY KEY,
+					size          INTEGER NOT NULL,
+					mtime_ns      INTEGER NOT NULL,
+					indexed_at    REAL NOT NULL
+				);
+
+				CREATE TABLE IF NOT EXISTS timelines (
+					id            INTEGER PRIMARY KEY,
+					bin_path      TEXT NOT NULL REFERENCES bins(path) ON DELETE CASCADE,
+					name_folded   TEXT NOT NULL,
+					date_created  REAL,
+					date_modified REAL,
+					info          BLOB NOT NULL
+				);
+				CREATE INDEX IF NOT EXISTS timelines_bin_path      ON timelines (bin_path);
+				CREATE INDEX IF NOT EXISTS timelines_date_modified ON timelines (date_modified);
+
+				CREATE TABLE IF NOT EXISTS markers (
+					timeline_id    INTEGER NOT NULL REFERENCES timelines(id) ON DELETE CASCADE,
+					frm_offset     INTEGER NOT NULL,
+					color          TEXT,
+					author_folded  TEXT NOT NULL,
+					comment_folded TEXT NOT NULL
+				);
+				CREATE INDEX IF NOT EXISTS markers_color_timeline ON markers (color, timeline_id);
+				CREATE INDEX IF NOT EXISTS markers_timeline       ON markers (timeline_id);
+			""")
+
+	@contextlib.contextmanager
+	def _connect(self) -> typing.Iterator[sqlite3.Connection]:
+		"""A connection for one transaction (connections can't be shared between threads)"""
+
+		with contextlib.closing(sqlite3.connect(self._database_path, timeout=10)) as db:
+			db.execute("PRAGMA foreign_keys = ON")
+			with db:
+				yield db
+
+	@staticmethod
+	def _timestamp(date:datetime.datetime|None) -> float|None:
+		return date.timestamp() if date is not None else None
+
+	@staticmethod
+	def _colorName(color:typing.Any) -> str|None:
+		"""Marker color as stored in the index"""
+
+		if color is None:
+			return None
+		return color.name if hasattr(color, "name") else str(color)
+
+	# Updating
+	def indexedBins(self) -> dict[str, tuple[int, int]]:
+		"""Size and modification time of each indexed bin, when it was indexed"""
+
+		with self._connect() as db:
+			return {path: (size, mtime_ns) for path, size, mtime_ns in db.execute("SELECT path, size, mtime_ns FROM bins")}
+
+	def setBinTimelines(self, bin_path:str, file_size:int, mtime_ns:int, timeline_infos:typing.Iterable[datamodels.TRTTimelineInfo]) -> int:
+		"""Replace everything indexed for one bin, returning the number of timelines indexed"""
+
+		timeline_count = 0
+
+		with self._connect() as db:
+
+			# Cascades to the bin's timelines and their markers
+			db.execute("DELETE FROM bins WHERE path = ?", (bin_path,))
+			db.execute("INSERT INTO bins (path, size, mtime_ns, indexed_at) VALUES (?, ?, ?, ?)", (bin_path, file_size, mtime_ns, time.time()))
+
+			for timeline_info in timeline_infos:
+
+				timeline_id = db.execute(
+					"INSERT INTO timelines (bin_path, name_folded, date_created, date_modified, info) VALUES (?, ?, ?, ?, ?)",
+					(
+						bin_path,
+						timeline_info.timeline_name.casefold(),
+						self._timestamp(timeline_info.date_created),
+						self._timestamp(timeline_info.date_modified),
+						pickle.dumps(timeline_info, protocol=pickle.HIGHEST_PROTOCOL),
+					)
+				).lastrowid
+
+				db.executemany(
+					"INSERT INTO markers (timeline_id, frm_offset, color, author_folded, comment_folded) VALUES (?, ?, ?, ?, ?)",
+					[(timeline_id, marker.frm_offset, self._colorName(marker.color), (marker.author or "").casefold(), (marker.comment or "").casefold()) for marker in timeline_info.markers]
+				)
+
+				timeline_count += 1
+
+		return timeline_count
+
+	def removeBin(self, bin_path:str):
+		"""Forget a bin and its timelines"""
+
+		with self._connect() as db:
+			db.execute("DELETE FROM bins WHERE path = ?", (bin_path,))
+
+	def update(self, root_paths:typing.Iterable[os.PathLike], scanner:binscanner.TRTBinScanner|None=None, bin_indexed:typing.Callable[[str, int], typing.Any]|None=None) -> TRTTimelineIndexUpdateStats:
+		"""Bring the index up to date with the bins under some directories
+
+		`bin_indexed(bin_path, timeline_count)` is called as each changed bin is indexed.
+		"""
+
+		time_start = time.perf_counter()
+		stats = TRTTimelineIndexUpdateStats()
+
+		root_paths = [os.path.abspath(root_path) for root_path in root_paths]
+		scanner = scanner or binscanner.TRTBinScanner(["timelines"])
+
+		indexed_bins = self.indexedBins()
+		changed_bins = []
+		found_bins = set()
+
+		for bin_path in scanner.walkBins(root_paths):
+
+			try:
+				stat = os.stat(bin_path)
+			except OSError:
+				continue
+
+			found_bins.add(bin_path)
+
+			if indexed_bins.get(bin_path) != (stat.st_size, stat.st_mtime_ns):
+				changed_bins.append(bin_path)
+
+		stats.bins_found = len(found_bins)
+
+		for scan_result in scanner.scan(changed_bins):
+
+			if scan_result.open_error is not None or "timelines" not in scan_result.results:
+				continue
+
+			timeline_count = self.setBinTimelines(scan_result.bin_path, scan_result.file_size, scan_result.mtime_ns, scan_result.results["timelines"])
+
+			stats.bins_scanned += 1
+			stats.timelines_indexed += timeline_count
+
+			if bin_indexed is not None:
+				bin_indexed(scan_result.bin_path, timeline_count)
+
+		# Forget bins that have been removed from under these directories
+		for bin_path in indexed_bins:
+			if bin_path not in found_bins and any(os.path.commonpath([bin_path, root_path]) == root_path for root_path in root_paths):
+				self.removeBin(bin_path)
+				stats.bins_removed += 1
+
+		stats.elapsed = time.perf_counter() - time_start
+		return stats
+
+	# Querying
+	def query(self,
+		name_contains:str|None = None,
+		modified_since:datetime.datetime|None = None,
+		modified_before:datetime.datetime|None = None,
+		marker_preset:datamodels.TRTMarkerPresetInfo|None = None,
+		bin_path:str|None = None,
+		limit:int|None = None,
+	) -> list[datamodels.TRTTimelineInfo]:
+		"""Timelines matching all the given criteria, most recently modified first
+
+		`marker_preset` matches timelines with at least one marker matching the preset,
+		as `TRTMarkerPresetInfo.match()` would (e.g. `TRTMarkerPresetInfo("FFOA", color=MarkerColors.RED)`).
+		"""
+
+		conditions, parameters = [], []
+
+		if name_contains is not None:
+			conditions.append("instr(name_folded, ?) > 0")
+			parameters.append(name_contains.casefold())
+
+		if modified_since is not None:
+			conditions.append("date_modified >= ?")
+			parameters.append(self._timestamp(modified_since))
+
+		if modified_before is not None:
+			conditions.append("date_modified < ?")
+			parameters.append(self._timestamp(modified_before))
+
+		if bin_path is not None:
+			conditions.append("bin_path = ?")
+			parameters.append(os.path.abspath(bin_path))
+
+		if marker_preset is not None:
+
+			marker_conditions = ["markers.timeline_id = timelines.id"]
+
+			if marker_preset.color is not None:
+				marker_conditions.append("markers.color = ?")
+				parameters.append(self._colorName(marker_preset.color))
+
+			if marker_preset.author is not None:
+				marker_conditions.append("instr(markers.author_folded, ?) > 0")
+				parameters.append(marker_preset.author.casefold())
+
+			if marker_preset.comment is not None:
+				marker_conditions.append("instr(markers.comment_folded, ?) > 0")
+				parameters.append(marker_preset.comment.casefold())
+
+			conditions.append(f"EXISTS (SELECT 1 FROM markers WHERE {' AND '.join(marker_conditions)})")
+
+		sql = "SELECT info FROM timelines"
+
+		if conditions:
+			sql += " WHERE " + " AND ".join(conditions)
+
+		sql += " ORDER BY date_modified DESC"
+
+		if limit is not None:
+			sql += " LIMIT ?"
+			parameters.append(limit)
+
+		with self._connect() as db:
+			return [pickle.loads(info) for info, in db.execute(sql, parameters)]
+
+	def timelineCount(self) -> int:
+
+		with self._connect() as db:
+			return db.execute("SELECT COUNT(*) FROM timelines").fetchone()[0]
+
+	def binCount(self) -> int:
+
+		with self._connect() as db:
+			return db.execute("SELECT COUNT(*) FROM bins").fetchone()[0]
+
+
+class TRTTimelineIndexUpdateTask(QtCore.QRunnable):
+	"""Update a timeline index in the background"""
+
+	class Signals(QtCore.QObject):
+
+		sig_bin_indexed = QtCore.Signal(str, int)
+		"""A changed bin has been indexed, with this many timelines"""
+
+		sig_update_complete = QtCore.Signal(object)
+		"""The index is up to date (`TRTTimelineIndexUpdateStats`)"""
+
+	def __init__(self, timeline_index:TRTTimelineIndex, root_paths:typing.Iterable[os.PathLike], scanner:binscanner.TRTBinScanner|None=None):
+
+		super().__init__()
+
+		self._timeline_index = timeline_index
+		self._root_paths     = list(root_paths)
+		self._scanner        = scanner
+		self._signals        = self.Signals()
+
+	def signals(self) -> Signals:
+		return self._signals
+
+	def run(self):
+
+		stats = self._timeline_index.update(self._root_paths, self._scanner, self._signals.sig_bin_indexed.emit)
+		self._signals.sig_update_complete.emit(stats)
@@ -7,11 +7,14 @@ import avbutils
 from timecode import Timecode
 from PySide6 import QtCore, QtGui, QtWidgets
 from functools import singledispatch
+from . import resourcecache
 
 
 class TRTAbstractViewHeaderItem:
 	"""An abstract header item for TRT views"""
 
+	__slots__ = ("_field_name", "_field_id", "_format_id", "_display_name", "_item_factory", "_icon", "_delgate", "_data_roles")
+
 	def __init__(self, field_name:str, display_name:str, field_id:int=0, format_id:int=0, icon:QtGui.QIcon|None=None, item_factory:typing.Type["TRTAbstractViewItem"]|None=None, delegate:QtWidgets.QStyledItemDelegate|None=None):
 
 		self._field_name = field_name
@@ -63,6 +66,19 @@ class TRTAbstractViewHeaderItem:
 class TRTAbstractViewItem:
 	"""An abstract item for TRT views"""
 
+	__slots__ = ("_data", "_icon", "_tooltip", "_data_roles")
+
+	PREPARED_ROLES:tuple[QtCore.Qt.ItemDataRole, ...] = (
+		QtCore.Qt.ItemDataRole.DisplayRole,
+		QtCore.Qt.ItemDataRole.ToolTipRole,
+		QtCore.Qt.ItemDataRole.DecorationRole,
+		QtCore.Qt.ItemDataRole.InitialSortOrderRole,
+		QtCore.Qt.ItemDataRole.UserRole,
+		QtCore.Qt.ItemDataRole.FontRole,
+		QtCore.Qt.ItemDataRole.BackgroundRole,
+	)
+	"""Roles an item may calculate data for, reported together by `itemData()`"""
+
 	def __init__(self, raw_data:typing.Any, icon:QtGui.QIcon|None=None, tooltip:QtWidgets.QToolTip|str|None=None):
 
 		self._data = raw_data
@@ -70,31 +86,57 @@ class TRTAbstractViewItem:
 		self._tooltip = tooltip
 
 		self._data_roles = {}
-		self._prepare_data()
+		"""Data for roles which have been calculated so far, or overridden with `setData()` (roles without any data aren't kept)"""
+	
+	def _prepare_role(self, role:QtCore.Qt.ItemDataRole) -> typing.Any:
+		"""Calculate the data for a role.  Called the first time the role is requested."""
+
+		if role == QtCore.Qt.ItemDataRole.DisplayRole:
+			return self.to_string(self._data)
+		elif role == QtCore.Qt.ItemDataRole.ToolTipRole:
+			return self._tooltip if self._tooltip is not None else repr(self._data)
+		elif role == QtCore.Qt.ItemDataRole.DecorationRole:
+			return self._icon
+		elif role == QtCore.Qt.ItemDataRole.InitialSortOrderRole:
+			return self.to_string(self._data)	# QCollator just compares strings
+		elif role == QtCore.Qt.ItemDataRole.UserRole:
+			return self
+		
+		return None
 	
-	def _prepare_data(self):
-		"""Precalculate them datas for all them roles"""
-		self._data_roles.update({
-			QtCore.Qt.ItemDataRole.DisplayRole:          self.to_string(self._data),
-			QtCore.Qt.ItemDataRole.ToolTipRole:          self._tooltip if self._tooltip is not None else repr(self._data),
-			QtCore.Qt.ItemDataRole.DecorationRole:       self._icon,
-			QtCore.Qt.ItemDataRole.InitialSortOrderRole: self.to_string(self._data),	# QCollator just compares strings
-			QtCore.Qt.ItemDataRole.UserRole:             self,
-		})
 	def raw_data(self) -> typing.Any:
 		"""Get the original data for this item in its original format"""
 		return self._data
+	
+	def sort_key(self) -> typing.Any:
+		"""A key for sorting items of this type against each other.  By default, the natural sort key of its string."""
+		return resourcecache.collation_key(self.to_string(self._data))
 
 	def data(self, role:QtCore.Qt.ItemDataRole) -> typing.Any:
 		"""Get item data for a given role.  By default, returns the raw data as a string."""
-		return self._data_roles.get(role, None)
+
+		try:
+			return self._data_roles[role]
+		except KeyError:
+			pass
+
+		# Views ask for plenty of roles items have nothing for (alignment, size hints...), which would otherwise pile up here
+		role_data = self._prepare_role(role)
+		if role_data is not None:
+			self._data_roles[role] = role_data
+		
+		return role_data
 	
 	def setData(self, role:QtCore.Qt.ItemDataRole, data:typing.Any):
 		"""Override data for a particular role"""
 		self._data_roles[role] = data
 	
 	def itemData(self) -> dict[QtCore.Qt.ItemDataRole, typing.Any]:
-		"""Get all item data roles"""
+		"""Get all item data roles that have data"""
+
+		for role in self.PREPARED_ROLES:
+			self.data(role)
+		
 		return self._data_roles
 	
 	def to_json(self) -> str:
@@ -108,45 +150,49 @@ class TRTAbstractViewItem:
 class TRTStringViewItem(TRTAbstractViewItem):
 	"""A standard string"""
 
-	def _prepare_data(self):
-		super()._prepare_data()
-
-		self._data_roles.update({
-			QtCore.Qt.ItemDataRole.DisplayRole: self.to_string(self._data),
-		})
+	__slots__ = ()
 
 class TRTEnumViewItem(TRTAbstractViewItem):
 	"""Represents an Enum"""
 
+	__slots__ = ()
+
 	def __init__(self, raw_data:enum.Enum, *args, **kwargs):
 		super().__init__(raw_data, *args, **kwargs)
 
-	def _prepare_data(self):
-		super()._prepare_data()
+	def _prepare_role(self, role:QtCore.Qt.ItemDataRole) -> typing.Any:
 
-		self._data_roles.update({
-			QtCore.Qt.ItemDataRole.DisplayRole:          self._data.name.replace("_", " ").title(),
-			QtCore.Qt.ItemDataRole.InitialSortOrderRole: self.to_string(self._data.value),
-		})
+		if role == QtCore.Qt.ItemDataRole.DisplayRole:
+			return self._data.name.replace("_", " ").title()
+		elif role == QtCore.Qt.ItemDataRole.InitialSortOrderRole:
+			return self.to_string(self._data.value)
+		
+		return super()._prepare_role(role)
+	
+	def sort_key(self) -> int:
+		return self._data.value
 	
 
 class TRTNumericViewItem(TRTAbstractViewItem):
 	"""A numeric value"""
 
+	__slots__ = ()
+
 	STRING_PADDING:int = 0
 	"""Left-side padding for string formatting"""
 
 	def __init__(self, raw_data:int, *args, **kwargs):
 		super().__init__(raw_data, *args, **kwargs)
 
-	def _prepare_data(self):
-		super()._prepare_data()
+	def _prepare_role(self, role:QtCore.Qt.ItemDataRole) -> typing.Any:
 
-		self._data_roles.update({
-			QtCore.Qt.ItemDataRole.DisplayRole:          self.to_string(self._data),
-			#QtCore.Qt.ItemDataRole.InitialSortOrderRole: self._data,
-			QtCore.Qt.ItemDataRole.FontRole:             QtGui.QFontDatabase.systemFont(QtGui.QFontDatabase.SystemFont.FixedFont).family(),
-		})
+		if role == QtCore.Qt.ItemDataRole.FontRole:
+			return resourcecache.system_font_family(QtGui.QFontDatabase.SystemFont.FixedFont)
+		
+		return super()._prepare_role(role)
+	
+	def sort_key(self) -> int|float:
+		return self._data
 	
 	def to_json(self) -> int:
 		return self.data(QtCore.Qt.ItemDataRole.UserRole) # NOTE to self: need to change this to access item's _data
@@ -158,18 +204,24 @@ class TRTNumericViewItem(TRTAbstractViewItem):
 class TRTPathViewItem(TRTAbstractViewItem):
 	"""A file path"""
 
+	__slots__ = ()
+
 	def __init__(self, raw_data:str|QtCore.QFileInfo):
 		super().__init__(QtCore.QFileInfo(raw_data))
 	
-	def _prepare_data(self):
-		super()._prepare_data()
+	def _prepare_role(self, role:QtCore.Qt.ItemDataRole) -> typing.Any:
 
-		self._data_roles.update({
-			QtCore.Qt.ItemDataRole.DisplayRole:          self._data.fileName(),
-			QtCore.Qt.ItemDataRole.InitialSortOrderRole: self._data.fileName(),
-			QtCore.Qt.ItemDataRole.DecorationRole:       QtWidgets.QFileIconProvider().icon(self._data),
-			QtCore.Qt.ItemDataRole.ToolTipRole:          QtCore.QDir.toNativeSeparators(self._data.absoluteFilePath()),
-		})
+		if role in (QtCore.Qt.ItemDataRole.DisplayRole, QtCore.Qt.ItemDataRole.InitialSortOrderRole):
+			return self._data.fileName()
+		elif role == QtCore.Qt.ItemDataRole.DecorationRole:
+			return resourcecache.icon_for_file_info(self._data)
+		elif role == QtCore.Qt.ItemDataRole.ToolTipRole:
+			return QtCore.QDir.toNativeSeparators(self._data.absoluteFilePath())
+		
+		return super()._prepare_role(role)
+	
+	def sort_key(self) -> QtCore.QCollatorSortKey:
+		return resourcecache.collation_key(self._data.fileName())
 	
 	def to_json(self) -> str:
 		return QtCore.QDir.toNativeSeparators(self.data(QtCore.Qt.ItemDataRole.UserRole).absoluteFilePath())
@@ -177,6 +229,8 @@ class TRTPathViewItem(TRTAbstractViewItem):
 class TRTDateTimeViewItem(TRTAbstractViewItem):
 	"""A datetime entry"""
 
+	__slots__ = ("_format_string",)
+
 	def __init__(self, raw_data:datetime.datetime, format_string:QtCore.Qt.DateFormat|str=QtCore.Qt.DateFormat.TextDate):
 		
 		self._format_string = format_string
@@ -186,19 +240,23 @@ class TRTDateTimeViewItem(TRTAbstractViewItem):
 	def setFormatString(self, format_string:str):
 		"""Set the datetime formatting string used by strftime"""
 		self._format_string = format_string
-		self._data_roles.update()
+		self._data_roles.pop(QtCore.Qt.ItemDataRole.DisplayRole, None)
 	
 	def formatString(self) -> str:
 		"""The datetime formatting string used by strftime"""
 		return self._format_string
 
-	def _prepare_data(self):
-		super()._prepare_data()
+	def _prepare_role(self, role:QtCore.Qt.ItemDataRole) -> typing.Any:
+
+		if role == QtCore.Qt.ItemDataRole.DisplayRole:
+			return self._data.toString(self._format_string)
+		elif role == QtCore.Qt.ItemDataRole.InitialSortOrderRole:
+			return str(self._data.toMSecsSinceEpoch())
+		
+		return super()._prepare_role(role)
 	
-		self._data_roles.update({
-			QtCore.Qt.ItemDataRole.DisplayRole: self._data.toString(self._format_string),
-			QtCore.Qt.ItemDataRole.InitialSortOrderRole: str(self._data.toMSecsSinceEpoch())
-		})
+	def sort_key(self) -> int:
+		return self._data.toMSecsSinceEpoch()
 	
 	def to_json(self) -> dict:
 		return {
@@ -210,16 +268,22 @@ class TRTDateTimeViewItem(TRTAbstractViewItem):
 class TRTTimecodeViewItem(TRTNumericViewItem):
 	"""A timecode"""
 
+	__slots__ = ()
+
 	def __init__(self, raw_data:Timecode, *args, **kwargs):
 		if not isinstance(raw_data, Timecode):
 			raise TypeError("Data must be an instance of `Timecode`")
 		super().__init__(raw_data, *args, **kwargs)
 	
-	def _prepare_data(self):
-		super()._prepare_data()
-		self._data_roles.update({
-			QtCore.Qt.ItemDataRole.InitialSortOrderRole: str(self._data.frame_number),
-		})
+	def _prepare_role(self, role:QtCore.Qt.ItemDataRole) -> typing.Any:
+
+		if role == QtCore.Qt.ItemDataRole.InitialSortOrderRole:
+			return str(self._data.frame_number)
+		
+		return super()._prepare_role(role)
+	
+	def sort_key(self) -> int:
+		return self._data.frame_number
 	
 	def to_json(self) -> dict:
 		tc = self.data(QtCore.Qt.ItemDataRole.UserRole)
@@ -233,11 +297,7 @@ class TRTTimecodeViewItem(TRTNumericViewItem):
 class TRTDurationViewItem(TRTTimecodeViewItem):
 	"""A duration (hh:mm:ss:ff), a subset of timecode"""
 
-	def _prepare_data(self):
-		super()._prepare_data()
-		self._data_roles.update({
-			QtCore.Qt.ItemDataRole.DisplayRole: self.to_string(self._data),
-		})
+	__slots__ = ()
 	
 	@classmethod
 	def to_string(cls, data):
@@ -257,14 +317,13 @@ class TRTDurationViewItem(TRTTimecodeViewItem):
 class TRTFeetFramesViewItem(TRTNumericViewItem):
 	"""A frame offset described in feet & frames (f+ff)"""
 
+	__slots__ = ()
+
 	def __init__(self, raw_data:int, *args, **kwargs):
 
 		if not isinstance(raw_data, int):
 			raise TypeError(f"Data must be an integer (not {type(raw_data)})")
 		super().__init__(raw_data, *args, **kwargs)
-
-	def _prepare_data(self):
-		super()._prepare_data()
 	
 	def to_json(self) -> dict:
 		return {
@@ -282,6 +341,8 @@ class TRTFeetFramesViewItem(TRTNumericViewItem):
 class TRTClipColorViewItem(TRTAbstractViewItem):
 	"""A clip color"""
 
+	__slots__ = ()
+
 	def __init__(self, raw_data:avbutils.ClipColor|QtGui.QRgba64|None, *args, **kwargs):
 
 		if isinstance(raw_data, avbutils.ClipColor):
@@ -295,17 +356,23 @@ class TRTClipColorViewItem(TRTAbstractViewItem):
 		
 		super().__init__(raw_data, *args, **kwargs)
 	
-	def _prepare_data(self):
+	def _prepare_role(self, role:QtCore.Qt.ItemDataRole) -> typing.Any:
 		# Not calling super, would be weird
 
-		color = QtGui.QColor(self._data)
-
-		self._data_roles.update({
-			QtCore.Qt.ItemDataRole.UserRole: self._data,
-			#QtCore.Qt.ItemDataRole.BackgroundRole: self._data,
-			QtCore.Qt.ItemDataRole.ToolTipRole: f"R: {color.red()} G: {color.green()} B: {color.blue()}" if color.isValid() else "No Color",
-			QtCore.Qt.ItemDataRole.InitialSortOrderRole: self.to_string(self._data.getRgb())
-		})
+		if role == QtCore.Qt.ItemDataRole.UserRole:
+			return self._data
+		#elif role == QtCore.Qt.ItemDataRole.BackgroundRole:
+		#	return self._data
+		elif role == QtCore.Qt.ItemDataRole.ToolTipRole:
+			color = QtGui.QColor(self._data)
+			return f"R: {color.red()} G: {color.green()} B: {color.blue()}" if color.isValid() else "No Color"
+		elif role == QtCore.Qt.ItemDataRole.InitialSortOrderRole:
+			return self.to_string(self._data.getRgb())
+		
+		return None
+	
+	def sort_key(self) -> tuple[int, ...]:
+		return tuple(self._data.getRgb())
 	
 	def to_json(self) -> dict|None:
 
@@ -326,31 +393,37 @@ class TRTClipColorViewItem(TRTAbstractViewItem):
 class TRTMarkerViewItem(TRTAbstractViewItem):
 	"""Marker column"""
 
-	def __init__(self, raw_data:avbutils.MarkerInfo, *args, **kwargs):
+	__slots__ = ()
 
+	def __init__(self, raw_data:avbutils.MarkerInfo, *args, **kwargs):
 		super().__init__(raw_data, *args, **kwargs)
-		self._prepare_data()
 	
-	def _prepare_data(self):
-		super()._prepare_data()
-		self._data_roles.update({
-			QtCore.Qt.ItemDataRole.DisplayRole: None,
-			QtCore.Qt.ItemDataRole.BackgroundRole: QtGui.QColor(self._data.color.name),
-		})
+	def _prepare_role(self, role:QtCore.Qt.ItemDataRole) -> typing.Any:
+
+		if role == QtCore.Qt.ItemDataRole.DisplayRole:
+			return None
+		elif role == QtCore.Qt.ItemDataRole.BackgroundRole:
+			return resourcecache.color_from_name(self._data.color.name)
+		
+		return super()._prepare_role(role)
 
 class TRTBinLockViewItem(TRTAbstractViewItem):
 	"""Bin lock info"""
 
+	__slots__ = ()
+
 	# Note: For now I think we'll do a string, but want to expand this later probably
 	def __init__(self, raw_data:avbutils.LockInfo, *args, **kwargs):
 		super().__init__(raw_data, *args, **kwargs)
 
-	def _prepare_data(self):
-		super()._prepare_data()
-		self._data_roles.update({
-			QtCore.Qt.ItemDataRole.DisplayRole:    self._data.name if self._data else "",
-			QtCore.Qt.ItemDataRole.DecorationRole: QtGui.QIcon.fromTheme(QtGui.QIcon.ThemeIcon.SystemLockScreen if self._data else None)
-		})
+	def _prepare_role(self, role:QtCore.Qt.ItemDataRole) -> typing.Any:
+
+		if role == QtCore.Qt.ItemDataRole.DisplayRole:
+			return self._data.name if self._data else ""
+		elif role == QtCore.Qt.ItemDataRole.DecorationRole:
+			return resourcecache.icon_from_theme(QtGui.QIcon.ThemeIcon.SystemLockScreen if self._data else None)
+		
+		return super()._prepare_role(role)
 	
 	def to_json(self) -> str|None:
 		return self.data(QtCore.Qt.ItemDataRole.DisplayRole) or None
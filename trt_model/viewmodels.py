@@ -1,14 +1,67 @@
 """
 View Models
 """
-import typing
+import typing, array, collections
 from .viewitems import TRTAbstractViewItem, TRTAbstractViewHeaderItem
+from .columnstore import TRTColumnStore
+from .rowsources import TRTAbstractRowSource
+from .searchindex import TRTSearchIndex
+from . import resourcecache
 from PySide6 import QtCore
 import avbutils
 
+class TRTSearchFilterTask(QtCore.QRunnable):
+	"""Search a snapshot of a search index in another thread"""
+
+	class Signals(QtCore.QObject):
+
+		sig_search_complete = QtCore.Signal(int, str, object)
+		"""Emits the filter pass ID, the text searched for, and the matching rows (unless cancelled)"""
+	
+	def __init__(self, pass_id:int, search_index:TRTSearchIndex, search_text:str, within:list[int]|None=None, *args, **kwargs):
+
+		super().__init__(*args, **kwargs)
+
+		self._pass_id      = pass_id
+		self._search_index = search_index
+		self._search_text  = search_text
+		self._within       = within
+
+		self._is_cancelled = False
+		self._signals = self.Signals()
+	
+	def run(self):
+
+		if self._is_cancelled:
+			return
+		
+		match_rows = self._search_index.search(self._search_text, within=self._within)
+
+		if not self._is_cancelled:
+			self._signals.sig_search_complete.emit(self._pass_id, self._search_text, match_rows)
+	
+	def cancel(self):
+		"""Discard the results of this search"""
+		self._is_cancelled = True
+	
+	def signals(self) -> Signals:
+		return self._signals
+
 class TRTSortFilterProxyModel(QtCore.QSortFilterProxyModel):
 	"""QSortFilterProxyModel that implements natural sorting and such"""
 
+	ITEM_TYPES_FIELD_ID:int = 200
+	"""Field ID of the source column containing each item's `BinDisplayItemTypes`"""
+
+	FILTER_DEBOUNCE_INTERVAL:int = 150
+	"""Milliseconds to wait for more filter changes (e.g. typing) before filtering"""
+
+	SEARCH_INDEX_CHUNK_ROWS:int = 1000
+	"""Source rows read into the search index at a time, letting the event loop run in between"""
+
+	sig_filter_applied = QtCore.Signal()
+	"""Filter changes have been applied to the rows"""
+
 	def __init__(self, *args, **kwargs):
 		super().__init__(*args, **kwargs)
 
@@ -20,15 +73,214 @@ class TRTSortFilterProxyModel(QtCore.QSortFilterProxyModel):
 		self._filter_bin_display_items = avbutils.BinDisplayItemTypes(0)
 		self._filter_search_text       = ""
 
+		self._applied_search_text = ""
+		"""Search text the current search matches are for (may lag behind `_filter_search_text` while filtering)"""
+
+		self._filter_pass_id = 0
+		self._filter_task:TRTSearchFilterTask|None = None
+		"""The most recent filter pass, which may be running in the thread pool"""
+
+		self._filter_task_generation = -1
+		"""Search index generation the running filter pass is searching"""
+
+		self._filter_debounce_timer = QtCore.QTimer(self)
+		self._filter_debounce_timer.setSingleShot(True)
+		self._filter_debounce_timer.setInterval(self.FILTER_DEBOUNCE_INTERVAL)
+		self._filter_debounce_timer.timeout.connect(self._startFilterPass)
+
+		self._source_field_columns:dict[int,int]|None = None
+		"""Source column index for each field ID (`None` until it's needed again)"""
+
+		self._source_item_types:array.array|None = None
+		"""`BinDisplayItemTypes` value for each source row, or `-1` if unavailable (`None` until it's needed again)"""
+
+		self._accepted_item_types:dict[int,bool] = {}
+		"""Bin display filter results for each `BinDisplayItemTypes` value seen so far"""
+
+		self._search_index:TRTSearchIndex|None = None
+		"""Display text of each source row (`None` until a search needs it, then built a chunk of rows at a time)"""
+
+		self._search_index_timer = QtCore.QTimer(self)
+		self._search_index_timer.setSingleShot(True)
+		self._search_index_timer.setInterval(0)
+		self._search_index_timer.timeout.connect(self._indexSourceRows)
+
+		self._filter_awaiting_index = False
+		"""A filter pass is waiting for the search index to be built"""
+
+		self._search_matches:bytearray|None = None
+		"""Whether each source row matches the search text (`None` until it's needed again)"""
+
+		self._search_match_rows:list[int] = []
+		self._search_match_text:str = ""
+		self._search_match_generation:int = -1
+		"""Rows matched by the previous search, the text they matched, and the search index generation they came from"""
+
+		self._source_sort_keys:dict[int, list] = {}
+		"""Typed sort key of each source row, by source column (`None` for rows without an item)"""
+
+		self._source_sort_ranks:dict[int, array.array] = {}
+		"""Sorted position of each source row, by source column (only valid until rows change)"""
+
+		self._sort_specification:list[tuple[QtCore.Qt.SortOrder, int|str]] = []
+		"""Multi-column sort as given to `setSortSpecification()`, least significant first"""
+
+		self._resolved_sort_specification:list[tuple[int, QtCore.Qt.SortOrder]]|None = None
+		"""Sort specification as source columns, most significant first (`None` until it's needed again)"""
+
+		self._specification_sort_ranks:array.array|None = None
+		"""Sorted position of each source row for the whole sort specification (only valid until rows change)"""
+
 		self.setSortRole(QtCore.Qt.ItemDataRole.InitialSortOrderRole)
+	
+	def setSourceModel(self, source_model:QtCore.QAbstractItemModel|None):
+
+		if self.sourceModel() is not None:
+			for signal, slot in self._sourceModelConnections(self.sourceModel()):
+				signal.disconnect(slot)
+
+		# Connect before QSortFilterProxyModel does, so the caches are up-to-date by the time it filters new rows
+		if source_model is not None:
+			for signal, slot in self._sourceModelConnections(source_model):
+				signal.connect(slot)
+		
+		self._invalidateSourceColumns()
+		super().setSourceModel(source_model)
+	
+	def _sourceModelConnections(self, source_model:QtCore.QAbstractItemModel) -> list[tuple[QtCore.SignalInstance, typing.Callable]]:
+		"""Source model signals used to keep the source caches current"""
+
+		return [
+			(source_model.columnsInserted,   self._invalidateSourceColumns),
+			(source_model.columnsRemoved,    self._invalidateSourceColumns),
+			(source_model.columnsMoved,      self._invalidateSourceColumns),
+			(source_model.headerDataChanged, self._invalidateSourceColumns),
+			(source_model.modelReset,        self._invalidateSourceColumns),
+			(source_model.layoutChanged,     self._invalidateSourceRows),
+			(source_model.rowsInserted,      self._sourceRowsInserted),
+			(source_model.rowsRemoved,       self._sourceRowsRemoved),
+			(source_model.rowsMoved,         self._invalidateSourceRows),
+			(source_model.dataChanged,       self._sourceDataChanged),
+		]
+
+	@QtCore.Slot()
+	def _invalidateSourceColumns(self):
+		"""Rebuild the field ID lookup (and everything based on it) when next needed"""
+
+		self._source_field_columns = None
+		self._resolved_sort_specification = None
+		self._invalidateSourceRows()
+	
+	@QtCore.Slot()
+	def _invalidateSourceRows(self):
+		"""Re-read per-row data from the source model when next needed"""
+
+		self._source_item_types = None
+		self._search_index      = None
+		self._search_matches    = None
+		self._source_sort_keys  = {}
+		self._invalidateSortRanks()
+	
+	@QtCore.Slot(QtCore.QModelIndex, int, int)
+	def _sourceRowsInserted(self, parent:QtCore.QModelIndex, first:int, last:int):
+
+		if parent.isValid():
+			return
+		
+		if self._source_item_types is not None:
+			self._source_item_types[first:first] = array.array("q", self._readSourceItemTypes(first, last))
+		
+		# A partly built index only holds leading rows; the rest are read as it's built
+		if self._search_index is not None and first <= len(self._search_index):
+			self._search_index.insertRows(first, self._readSourceRowTexts(first, last))
+
+			if self._search_matches is not None:
+				self._search_matches[first:first] = self._searchRange(first, last)
+		
+		for column, sort_keys in self._source_sort_keys.items():
+			sort_keys[first:first] = self._readSourceSortKeys(column, first, last)
+		self._invalidateSortRanks()
+	
+	@QtCore.Slot(QtCore.QModelIndex, int, int)
+	def _sourceRowsRemoved(self, parent:QtCore.QModelIndex, first:int, last:int):
+
+		if parent.isValid():
+			return
+		
+		if self._source_item_types is not None:
+			del self._source_item_types[first:last+1]
+		
+		if self._search_index is not None and first < len(self._search_index):
+			self._search_index.removeRows(first, min(last, len(self._search_index) - 1))
+
+			if self._search_matches is not None:
+				del self._search_matches[first:last+1]
+		
+		for sort_keys in self._source_sort_keys.values():
+			del sort_keys[first:last+1]
+		self._invalidateSortRanks()
+	
+	@QtCore.Slot(QtCore.QModelIndex, QtCore.QModelIndex)
+	def _sourceDataChanged(self, top_left:QtCore.QModelIndex, bottom_right:QtCore.QModelIndex, roles:list[int]|None=None):
+
+		first, last = top_left.row(), bottom_right.row()
+		
+		item_types_column = self.sourceColumnForFieldId(self.ITEM_TYPES_FIELD_ID)
+		
+		if self._source_item_types is not None and item_types_column is not None and top_left.column() <= item_types_column <= bottom_right.column():
+			self._source_item_types[first:last+1] = array.array("q", self._readSourceItemTypes(first, last))
+		
+		if self._search_index is not None and first < len(self._search_index):
+			for row, row_texts in enumerate(self._readSourceRowTexts(first, min(last, len(self._search_index) - 1)), start=first):
+				self._search_index.setRow(row, row_texts)
+			
+			if self._search_matches is not None:
+				self._search_matches[first:last+1] = self._searchRange(first, last)
+		
+		for column, sort_keys in self._source_sort_keys.items():
+			if top_left.column() <= column <= bottom_right.column():
+				sort_keys[first:last+1] = self._readSourceSortKeys(column, first, last)
+		self._invalidateSortRanks()
+
+	def sourceColumnForFieldId(self, field_id:int) -> int|None:
+		"""Source column index for a given field ID, or `None` if the source model doesn't have it"""
+
+		if self._source_field_columns is None:
+
+			self._source_field_columns = dict()
+
+			if self.sourceModel() is not None:
+				for source_col in range(self.sourceModel().columnCount()):
+					source_field_id = self.sourceModel().headerData(source_col, QtCore.Qt.Orientation.Horizontal, QtCore.Qt.ItemDataRole.UserRole+1)
+					self._source_field_columns.setdefault(source_field_id, source_col)
+		
+		return self._source_field_columns.get(field_id)
+	
+	def _readSourceItemTypes(self, first_row:int, last_row:int) -> typing.Iterator[int]:
+		"""Read `BinDisplayItemTypes` values for a range of source rows"""
+
+		item_types_column = self.sourceColumnForFieldId(self.ITEM_TYPES_FIELD_ID)
+
+		for source_row in range(first_row, last_row+1):
+
+			item = self.sourceModel().index(source_row, item_types_column, QtCore.QModelIndex()).data(QtCore.Qt.ItemDataRole.UserRole) if item_types_column is not None else None
+			item_types = item.raw_data() if item is not None else None
+
+			yield item_types.value if isinstance(item_types, avbutils.BinDisplayItemTypes) else -1
+	
+	def _sourceItemTypes(self) -> array.array:
+		"""`BinDisplayItemTypes` values for all source rows"""
+
+		if self._source_item_types is None:
+			self._source_item_types = array.array("q", self._readSourceItemTypes(0, self.sourceModel().rowCount()-1))
+		
+		return self._source_item_types
 
 	def filterAcceptsRow(self, source_row:int, source_parent:QtCore.QModelIndex) -> bool:
 		"""Filter rows based on all the applicable sift/bin display/search stuff"""
 
-		return all((
-			self.binDisplayFilter(source_row, source_parent),
-			self.searchTextFilter(source_row, source_parent),
-		))
+		return self.binDisplayFilter(source_row, source_parent) \
+			and self.searchTextFilter(source_row, source_parent)
 
 		
 		#return super().filterAcceptsRow(source_row, source_parent)
@@ -37,103 +289,458 @@ class TRTSortFilterProxyModel(QtCore.QSortFilterProxyModel):
 		"""Filter rows based on item type (via Bin Display settings)"""
 
 		# Determine BinItemType column index from the source model (since it could be hidden)
-		# NOTE: Once this is exclusively an AVB proxy model, won't need the `try`
-		try:
-			item_type_header_index = next(c
-				for c in range(self.sourceModel().columnCount(source_parent))
-				if self.sourceModel().headerData(c, QtCore.Qt.Orientation.Horizontal, role=QtCore.Qt.ItemDataRole.UserRole+1) == 200
-			)
-		except StopIteration:
-#			print("Item types not available")
+		# NOTE: Once this is exclusively an AVB proxy model, won't need the `if`
+		if source_parent.isValid() or self.sourceColumnForFieldId(self.ITEM_TYPES_FIELD_ID) is None:
 			# TODO: Pass through exception -- in AVB the type should definitely be available
 			return super().filterAcceptsRow(source_row, source_parent)
 		
-		# Get the item type from the source moddel
-		src_index = self.sourceModel().index(source_row, item_type_header_index, source_parent)
-		item_types = src_index.data(QtCore.Qt.ItemDataRole.UserRole).raw_data()
+		item_types = self._sourceItemTypes()[source_row]
 
-		if isinstance(item_types, avbutils.BinDisplayItemTypes):
-			return bool(item_types in self._filter_bin_display_items)
-		else:
-			raise ValueError(f"Invalid data type `{type(item_types).__name__}` for filter (expected `BinDisplayItemTypes`)")
+		# Each distinct combination of item types only needs testing against the filter once
+		try:
+			return self._accepted_item_types[item_types]
+		except KeyError:
+			pass
+
+		if item_types < 0:
+			item = self.sourceModel().index(source_row, self.sourceColumnForFieldId(self.ITEM_TYPES_FIELD_ID), source_parent).data(QtCore.Qt.ItemDataRole.UserRole)
+			raise ValueError(f"Invalid data type `{type(item.raw_data() if item is not None else None).__name__}` for filter (expected `BinDisplayItemTypes`)")
+		
+		is_accepted = self._accepted_item_types[item_types] = bool(avbutils.BinDisplayItemTypes(item_types) in self._filter_bin_display_items)
+		return is_accepted
 	
 	def searchTextFilter(self, source_row:int, source_parent:QtCore.QModelIndex) -> bool:
 		"""Filter rows based on display text"""
 
-		if not self._filter_search_text:
+		if not self._applied_search_text or source_parent.isValid():
 			return True
 
-		search_text = self._filter_search_text.casefold()
+		return bool(self._searchMatches()[source_row])
+	
+	def _readSourceRowTexts(self, first_row:int, last_row:int) -> typing.Iterator[list[str]]:
+		"""Read the display text of each searchable cell for a range of source rows"""
+
+		# TODO: For later: ignore hidden columns
+		source_columns = [source_col for source_col in range(self.sourceModel().columnCount()) if self.filterAcceptsColumn(source_col, QtCore.QModelIndex())]
+
+		for source_row in range(first_row, last_row+1):
+
+			row_texts = []
+
+			for source_col in source_columns:
+				source_text = self.sourceModel().index(source_row, source_col, QtCore.QModelIndex()).data(QtCore.Qt.ItemDataRole.DisplayRole)
+				if source_text is not None:
+					row_texts.append(str(source_text))
+			
+			yield row_texts
+	
+	def _searchIndexComplete(self) -> bool:
+		"""Whether the search index holds every source row"""
+		return self._search_index is not None and len(self._search_index) == self.sourceModel().rowCount()
+
+	@QtCore.Slot()
+	def _indexSourceRows(self):
+		"""Read the next chunk of source rows into the search index, then carry on after other events"""
+
+		if self.sourceModel() is None:
+			return
 		
-		for source_col in range(self.sourceModel().columnCount()):
+		if self._search_index is None:
+			self._search_index = TRTSearchIndex()
+		
+		first_row = len(self._search_index)
+		last_row  = min(first_row + self.SEARCH_INDEX_CHUNK_ROWS, self.sourceModel().rowCount()) - 1
 
-			# TODO: For later: ignore hidden columns
-			if not self.filterAcceptsColumn(source_col, source_parent):
-				continue
+		if first_row <= last_row:
+			self._search_index.insertRows(first_row, self._readSourceRowTexts(first_row, last_row))
+		
+		if not self._searchIndexComplete():
+			self._search_index_timer.start()
+		
+		elif self._filter_awaiting_index:
+			self._filter_awaiting_index = False
+			self._startFilterPass()
+	
+	def _searchIndex(self) -> TRTSearchIndex:
+		"""Search index of the source model's display text, finishing it here if it's still being built
 
-			source_text = self.sourceModel().data(self.sourceModel().index(source_row, source_col, source_parent), QtCore.Qt.ItemDataRole.DisplayRole) or ""
-			if search_text in source_text.casefold():
-				return True
+		Filter passes wait for `_indexSourceRows()` to build it instead; this is for
+		re-matching rows straight away after the source model has been reset.
+		"""
+
+		if not self._searchIndexComplete():
+
+			if self._search_index is None:
+				self._search_index = TRTSearchIndex()
+
+			self._search_index.insertRows(len(self._search_index), self._readSourceRowTexts(len(self._search_index), self.sourceModel().rowCount()-1))
+		
+		return self._search_index
+	
+	def _searchRange(self, first_row:int, last_row:int) -> bytearray:
+		"""Search a range of source rows for the current search text"""
+
+		matches = bytearray(last_row - first_row + 1)
+
+		for source_row in self._searchIndex().search(self._applied_search_text, within=range(first_row, last_row+1)):
+			matches[source_row - first_row] = 1
+		
+		return matches
+	
+	def _searchMatches(self) -> bytearray:
+		"""Whether each source row matches the current search text"""
+
+		if self._search_matches is not None:
+			return self._search_matches
+
+		search_index = self._searchIndex()
+		search_text  = self._applied_search_text.casefold()
+
+		self._setSearchMatches(search_text, search_index.search(search_text, within=self._searchRefinementRows(search_text)), search_index.generation())
+		return self._search_matches
+	
+	def _searchRefinementRows(self, search_text:str) -> list[int]|None:
+		"""If the search text refines the previous search (e.g. typing another character), only the previous matches need searching"""
+
+		if self._search_match_generation == self._searchIndex().generation() and self._search_match_text and self._search_match_text in search_text.casefold():
+			return self._search_match_rows
+		
+		return None
+	
+	def _setSearchMatches(self, search_text:str, match_rows:list[int], generation:int):
+
+		self._search_matches = bytearray(len(self._searchIndex()))
+		for source_row in match_rows:
+			self._search_matches[source_row] = 1
+		
+		self._search_match_rows       = match_rows
+		self._search_match_text       = search_text.casefold()
+		self._search_match_generation = generation
+	
+	@QtCore.Slot()
+	def _startFilterPass(self):
+		"""Filter using the latest settings, searching in the thread pool if needed"""
+
+		self._filter_pass_id += 1
+		self._filter_awaiting_index = False
+
+		if self._filter_task is not None:
+			self._filter_task.cancel()
+			QtCore.QThreadPool.globalInstance().tryTake(self._filter_task)
+			self._filter_task = None
+		
+		# Nothing to search for (or only the item types changed): cheap enough to apply here
+		if self._filter_search_text == self._applied_search_text and (self._search_matches is not None or not self._applied_search_text):
+			self.invalidateRowsFilter()
+			self.sig_filter_applied.emit()
+			return
+		
+		if not self._filter_search_text or self.sourceModel() is None:
+			self._applied_search_text = self._filter_search_text
+			self._search_matches = None
+			self.invalidateRowsFilter()
+			self.sig_filter_applied.emit()
+			return
+		
+		# Searching waits until the index is built, rather than building it all in one go here
+		if not self._searchIndexComplete():
+			self._filter_awaiting_index = True
+			if not self._search_index_timer.isActive():
+				self._search_index_timer.start()
+			return
 		
-		return False
+		search_index = self._searchIndex()
+		self._filter_task_generation = search_index.generation()
+
+		self._filter_task = TRTSearchFilterTask(
+			self._filter_pass_id,
+			search_index.snapshot(),
+			self._filter_search_text,
+			self._searchRefinementRows(self._filter_search_text),
+		)
+		self._filter_task.signals().sig_search_complete.connect(self._applyFilterPass)
+		QtCore.QThreadPool.globalInstance().start(self._filter_task)
 	
+	@QtCore.Slot(int, str, object)
+	def _applyFilterPass(self, pass_id:int, search_text:str, match_rows:list[int]):
+		"""Apply the results of a background search, if they're still current"""
+
+		if pass_id != self._filter_pass_id:
+			return
+		
+		self._filter_task = None
 
+		# Rows were reset while searching: search again once they've been indexed
+		if not self._searchIndexComplete():
+			self._startFilterPass()
+			return
 
+		# The search text may have changed again since: these matches are still for what was searched,
+		# and the next pass (already waiting on the debounce timer) will see that it differs
+		self._applied_search_text = search_text
+
+		# Rows changed while searching: match against the current rows instead
+		if self._filter_task_generation != self._search_index.generation():
+			self._search_matches = None
+		else:
+			self._setSearchMatches(self._applied_search_text, match_rows, self._filter_task_generation)
+		
+		self.invalidateRowsFilter()
+		self.sig_filter_applied.emit()
+	
+	def filterDebounceInterval(self) -> int:
+		"""Milliseconds to wait for more filter changes before filtering"""
+		return self._filter_debounce_timer.interval()
 	
+	def setFilterDebounceInterval(self, interval:int):
+		"""Set the milliseconds to wait for more filter changes before filtering"""
+		self._filter_debounce_timer.setInterval(interval)
 
 	@QtCore.Slot(object)
 	def setSearchText(self, search_text:str):
-		"""Set the text filter"""
+		"""Set the text filter (applied once typing settles)"""
 
 		self._filter_search_text = search_text
-		self.invalidateRowsFilter()
+		self._filter_debounce_timer.start()
 
 	
-	def lessThan(self, source_left:QtCore.QModelIndex, source_right:QtCore.QModelIndex) -> bool:
-		return self._sort_collator.compare(
-			source_left.data(self.sortRole()),
-			source_right.data(self.sortRole())
-		) <= 0	# gt OR EQUAL TO reverses sort even if all thingies are equal, I like it
+	def _readSourceSortKeys(self, column:int, first_row:int, last_row:int) -> list[typing.Any]:
+		"""Read typed sort keys from the source model, or natural sort keys of its sort role data"""
+
+		source_model = self.sourceModel()
+
+		if hasattr(source_model, "sortKeys"):
+			return source_model.sortKeys(column, first_row, last_row)
+		
+		sort_keys = []
+		for row in range(first_row, last_row+1):
+			sort_data = source_model.index(row, column, QtCore.QModelIndex()).data(self.sortRole())
+			sort_keys.append(resourcecache.collation_key(sort_data) if isinstance(sort_data, str) else sort_data)
+		
+		return sort_keys
+	
+	def _sourceSortKeys(self, column:int) -> list[typing.Any]:
+
+		if column not in self._source_sort_keys:
+			self._source_sort_keys[column] = self._readSourceSortKeys(column, 0, self.sourceModel().rowCount() - 1)
+		return self._source_sort_keys[column]
 	
+	@staticmethod
+	def _sortKeyLessThan(left_key:typing.Any, right_key:typing.Any) -> bool:
+		"""Compare two sort keys, with missing items (`None`) first"""
+
+		if left_key is None or right_key is None:
+			return left_key is None and right_key is not None
+
+		try:
+			return left_key < right_key
+		except TypeError:
+			# Mixed types of items in one column: keep like with like
+			return (type(left_key).__name__, str(left_key)) < (type(right_key).__name__, str(right_key))
+
+	def _sourceSortRanks(self, column:int) -> array.array:
+		"""Sorted position of each source row for a column (equal keys share a rank): one argsort instead of comparing keys for every pair of rows"""
+
+		if column in self._source_sort_ranks:
+			return self._source_sort_ranks[column]
+
+		sort_keys = self._sourceSortKeys(column)
+
+		# Rows without an item sort first
+		sorted_rows = [row for row, sort_key in enumerate(sort_keys) if sort_key is None]
+		keyed_rows  = [row for row, sort_key in enumerate(sort_keys) if sort_key is not None]
+
+		try:
+			keyed_rows.sort(key=sort_keys.__getitem__)
+		except TypeError:
+			keyed_rows.sort(key=lambda row: (type(sort_keys[row]).__name__, str(sort_keys[row])))
+
+		sorted_rows.extend(keyed_rows)
+
+		sort_ranks = array.array("q", bytes(8 * len(sort_keys)))
+		rank = 0
+
+		for position, row in enumerate(sorted_rows):
+			if position and self._sortKeyLessThan(sort_keys[sorted_rows[position-1]], sort_keys[row]):
+				rank += 1
+			sort_ranks[row] = rank
+
+		self._source_sort_ranks[column] = sort_ranks
+		return sort_ranks
+
+	def _invalidateSortRanks(self):
+
+		self._source_sort_ranks = {}
+		self._specification_sort_ranks = None
+
+	def _sortSpecification(self) -> list[tuple[int, QtCore.Qt.SortOrder]]:
+		"""The sort specification as source columns, most significant first"""
+
+		if self._resolved_sort_specification is not None:
+			return self._resolved_sort_specification
+
+		source_model = self.sourceModel()
+		column_names = [source_model.headerData(column, QtCore.Qt.Orientation.Horizontal, QtCore.Qt.ItemDataRole.DisplayRole) for column in range(source_model.columnCount())] if source_model is not None else []
+
+		resolved = []
+		for direction, column in reversed(self._sort_specification):
+
+			if isinstance(column, str):
+				if column not in column_names:
+					continue
+				column = column_names.index(column)
+
+			elif not 0 <= column < len(column_names):
+				continue
+
+			# A column sorted again later overrides its earlier entry
+			if column not in (resolved_column for resolved_column, _ in resolved):
+				resolved.append((column, QtCore.Qt.SortOrder(direction)))
+
+		self._resolved_sort_specification = resolved
+		return resolved
+
+	def _specificationSortRanks(self) -> array.array:
+		"""Sorted position of each source row for the whole sort specification, from one lexicographic sort"""
+
+		if self._specification_sort_ranks is not None:
+			return self._specification_sort_ranks
+
+		column_ranks = [(self._sourceSortRanks(column), direction == QtCore.Qt.SortOrder.DescendingOrder) for column, direction in self._sortSpecification()]
+		row_count = self.sourceModel().rowCount()
+
+		# Ties are left in source order
+		sorted_rows = sorted(range(row_count), key=lambda row: tuple(-sort_ranks[row] if descending else sort_ranks[row] for sort_ranks, descending in column_ranks))
+
+		sort_ranks = array.array("q", bytes(8 * row_count))
+		for position, row in enumerate(sorted_rows):
+			sort_ranks[row] = position
+
+		self._specification_sort_ranks = sort_ranks
+		return sort_ranks
+
+	def _specificationLessThan(self, left_row:int, right_row:int) -> bool:
+		"""Whether one source row sorts before another according to the sort specification"""
+
+		if self._specification_sort_ranks is not None:
+			return self._specification_sort_ranks[left_row] < self._specification_sort_ranks[right_row]
+
+		# Rows have changed since the last full sort
+		for column, direction in self._sortSpecification():
+
+			sort_keys = self._sourceSortKeys(column)
+			left_key, right_key = sort_keys[left_row], sort_keys[right_row]
+
+			if direction == QtCore.Qt.SortOrder.DescendingOrder:
+				left_key, right_key = right_key, left_key
+
+			if self._sortKeyLessThan(left_key, right_key):
+				return True
+			elif self._sortKeyLessThan(right_key, left_key):
+				return False
+
+		return left_row < right_row
+
+	@QtCore.Slot(object)
+	def setSortSpecification(self, sorting:list[tuple[QtCore.Qt.SortOrder, int|str]]):
+		"""Sort by several columns at once
+
+		`sorting` is a list of `(direction, column)` pairs, where `column` is a column index or header name.
+		As with Avid's bin sort settings, each entry takes precedence over the ones before it, so the last
+		entry is the primary sort.
+		"""
+
+		self._sort_specification = list(sorting)
+		self._resolved_sort_specification = None
+		self._specification_sort_ranks    = None
+
+		if self.sourceModel() is None or not self._sortSpecification():
+			return
+
+		self._specificationSortRanks()
+
+		primary_column, primary_direction = self._sortSpecification()[0]
+		super().sort(primary_column, primary_direction)
+
+	def sortSpecification(self) -> list[tuple[QtCore.Qt.SortOrder, int|str]]:
+		"""The current multi-column sort, as given to `setSortSpecification()`"""
+		return list(self._sort_specification)
+
+	def sort(self, column:int, order:QtCore.Qt.SortOrder=QtCore.Qt.SortOrder.AscendingOrder):
+		"""Sort by a column, ranking all rows up front so comparisons are cheap"""
+
+		# Sorting by a single column replaces any multi-column sort
+		self._sort_specification = []
+		self._resolved_sort_specification = None
+		self._specification_sort_ranks    = None
+
+		if column >= 0 and self.sourceModel() is not None and self.sortRole() == QtCore.Qt.ItemDataRole.InitialSortOrderRole:
+			self._sourceSortRanks(column)	# Columns aren't filtered, so proxy and source columns are the same
+
+		super().sort(column, order)
+
+	def lessThan(self, source_left:QtCore.QModelIndex, source_right:QtCore.QModelIndex) -> bool:
+
+		column = source_left.column()
+
+		if self.sortRole() != QtCore.Qt.ItemDataRole.InitialSortOrderRole or column != source_right.column():
+			return self._sort_collator.compare(
+				source_left.data(self.sortRole()),
+				source_right.data(self.sortRole())
+			) <= 0	# gt OR EQUAL TO reverses sort even if all thingies are equal, I like it
+
+		if self._sort_specification and self._sortSpecification():
+
+			# Qt reverses the comparison itself for a descending primary sort, so undo that
+			if self.sortOrder() == QtCore.Qt.SortOrder.DescendingOrder:
+				return self._specificationLessThan(source_right.row(), source_left.row())
+			return self._specificationLessThan(source_left.row(), source_right.row())
+
+		# Ranks are ready after a full sort; rows inserted since then compare by key
+		if column in self._source_sort_ranks:
+			sort_ranks = self._source_sort_ranks[column]
+			return sort_ranks[source_left.row()] < sort_ranks[source_right.row()]
+
+		sort_keys = self._sourceSortKeys(column)
+		return self._sortKeyLessThan(sort_keys[source_left.row()], sort_keys[source_right.row()])
+
 	@QtCore.Slot(object)
 	def setBinDisplayItemTypes(self, types:avbutils.BinDisplayItemTypes):
 
 		self._filter_bin_display_items = types
+		self._accepted_item_types = {}
 		print(self.binDisplayItemTypes().__repr__())
-		self.invalidateRowsFilter()
+		self._filter_debounce_timer.start()
 	
 	def binDisplayItemTypes(self) -> avbutils.BinDisplayItemTypes:
 		return self._filter_bin_display_items
 	
 	@QtCore.Slot(object)
 	def setSearchFilterText(self, search_text:str):
-		self._filter_search_text = search_text
+		self._filter_search_text  = search_text
+		self._applied_search_text = search_text
+		self._search_matches = None
 
 	def searchFilterText(self) -> str:
 		return self._filter_search_text
 		
 
-class TRTTimelineViewModel(QtCore.QAbstractItemModel):
-	"""A view model for timelines"""
-
-	def __init__(self):
+class TRTAbstractTimelineViewModel(QtCore.QAbstractItemModel):
+	"""Headers and columns shared by the timeline view models, which differ only in how they keep rows"""
 
-		super().__init__()
+	def __init__(self, *args, **kwargs):
 
-		self._timelines:list[dict[str, TRTAbstractViewItem]] = []
-		"""List of view items by key"""
+		super().__init__(*args, **kwargs)
 
 		self._headers:list[TRTAbstractViewHeaderItem] = []
 		"""List of view headers"""
 
+		self._column_fields:list[str] = []
+		"""Field name of each column, in column order"""
+
 	def parent(self, /, child:QtCore.QModelIndex) -> QtCore.QModelIndex:
 		return QtCore.QModelIndex()
 	
-	def rowCount(self, /, parent:QtCore.QModelIndex=QtCore.QModelIndex()) -> int:
-		if parent.isValid():
-			return 0
-		return len(self._timelines)
-	
 	def columnCount(self, /, parent:QtCore.QModelIndex=QtCore.QModelIndex()) -> int:
 		if parent.isValid():
 			return 0
@@ -144,41 +751,460 @@ class TRTTimelineViewModel(QtCore.QAbstractItemModel):
 			return QtCore.QModelIndex()
 		return self.createIndex(row, column)
 	
+	def headerData(self, section:int, orientation:QtCore.Qt.Orientation, /, role:QtCore.Qt.ItemDataRole) -> typing.Any:
+		if orientation == QtCore.Qt.Orientation.Horizontal:
+			return self._headers[section].data(role)
+	
+	def fields(self) -> list[str]:
+		"""Field names for mapping headers and columns, in order"""
+		return list(self._column_fields)
+	
+	def _updateColumnFields(self):
+		"""Note the field name of each column, after the headers change"""
+		self._column_fields = [header.field_name() for header in self._headers]
+	
+	def addHeader(self, header:TRTAbstractViewHeaderItem, column:int=0) -> bool:
+		"""Insert a header before the given column (at the front by default).  Use `setHeaders()` to lay out many columns at once."""
+
+		self.beginInsertColumns(QtCore.QModelIndex(), column, column)
+		self._headers.insert(column, header)
+		self._updateColumnFields()
+		self.endInsertColumns()
+		return True
+	
+	def setHeaders(self, headers:typing.Iterable[TRTAbstractViewHeaderItem]) -> bool:
+		"""Replace all headers, in column order, with a single notification
+
+		Views see one column insert if there were no columns yet, otherwise one model reset.
+		"""
+
+		headers = list(headers)
+
+		if not self._headers:
+
+			if not headers:
+				return False
+
+			self.beginInsertColumns(QtCore.QModelIndex(), 0, len(headers) - 1)
+			self._headers = headers
+			self._updateColumnFields()
+			self.endInsertColumns()
+			return True
+
+		self.beginResetModel()
+		self._headers = headers
+		self._updateColumnFields()
+		self.endResetModel()
+		return True
+
+
+class TRTTimelineViewModel(TRTAbstractTimelineViewModel):
+	"""A view model for timelines"""
+
+	BULK_LOAD_CHUNK_SIZE:int = 1000
+	"""Number of rows buffered during a bulk load before they are inserted as one chunk"""
+
+	BULK_LOAD_FLUSH_INTERVAL:int = 50
+	"""Milliseconds to wait before a partial chunk is inserted during a bulk load"""
+
+	ROW_LAYOUT_MAX_ROWS:int = 256
+	"""Rows kept laid out in column order for `data()`, a few screens' worth (the oldest laid out are dropped first)"""
+
+	def __init__(self, column_store:bool=False):
+
+		super().__init__()
+
+		self._use_column_store = column_store
+		"""Store timelines in a `TRTColumnStore` rather than as `dict`s of view items"""
+
+		self._timelines:list[dict[str, TRTAbstractViewItem]]|TRTColumnStore = self._createTimelineStorage()
+		"""List of view items by key"""
+
+		self._row_cells:collections.OrderedDict[int, tuple[TRTAbstractViewItem|None, ...]] = collections.OrderedDict()
+		"""View items of recently displayed rows in column order, by row"""
+
+		self._bulk_loading = False
+		self._bulk_pending:list[dict[str, TRTAbstractViewItem]] = []
+		"""Rows received during a bulk load which have not yet been inserted"""
+
+		self._bulk_flush_timer = QtCore.QTimer(self)
+		self._bulk_flush_timer.setSingleShot(True)
+		self._bulk_flush_timer.setInterval(self.BULK_LOAD_FLUSH_INTERVAL)
+		self._bulk_flush_timer.timeout.connect(self.flushBulkLoad)
+
+	def rowCount(self, /, parent:QtCore.QModelIndex=QtCore.QModelIndex()) -> int:
+		if parent.isValid():
+			return 0
+		return len(self._timelines)
+	
 	def data(self, index:QtCore.QModelIndex, /, role:QtCore.Qt.ItemDataRole) -> typing.Any:
 		if not index.isValid():
 			return None
 		
-		timeline   = self._timelines[index.row()]
-		field_name = self._headers[index.column()].field_name()
+		# Views ask for many roles of every cell in a row on each repaint, so look the row's items up once
+		row_cells = self._row_cells.get(index.row()) or self._layOutRow(index.row())
+		item = row_cells[index.column()]
 
-		if field_name not in timeline:
-			return None
+		return item.data(role) if item is not None else None
+	
+	def _layOutRow(self, row:int) -> tuple[TRTAbstractViewItem|None, ...]:
+		"""Look up a row's view items in column order, keeping them for the next `data()` calls"""
+
+		if self._use_column_store:
+			row_cells = tuple(self._timelines.item(row, field_name) for field_name in self._column_fields)
+		else:
+			timeline = self._timelines[row]
+			row_cells = tuple(timeline.get(field_name) for field_name in self._column_fields)
+		
+		self._row_cells[row] = row_cells
+		if len(self._row_cells) > self.ROW_LAYOUT_MAX_ROWS:
+			self._row_cells.popitem(last=False)
+		
+		return row_cells
+	
+	def _updateColumnFields(self):
+		super()._updateColumnFields()
+		self._row_cells.clear()
+	
+	def setData(self, index:QtCore.QModelIndex, value:typing.Any, /, role:QtCore.Qt.ItemDataRole=QtCore.Qt.ItemDataRole.EditRole) -> bool:
+		"""Override an item's data for a role (items from a column store are re-created, so go through here rather than the item)"""
+
+		if not index.isValid():
+			return False
+		
+		row, field_name = index.row(), self._column_fields[index.column()]
 
-		return timeline.get(field_name).data(role)
+		if self._use_column_store:
+			if not self._timelines.setItemData(row, field_name, role, value):
+				return False
+		else:
+			item = self._timelines[row].get(field_name)
+			if item is None:
+				return False
+			item.setData(role, value)
+		
+		# The laid out item may have been re-created by the column store since
+		self._row_cells.pop(row, None)
+		
+		self.dataChanged.emit(index, index, [role])
+		return True
 	
 	def clear(self):
 		self.beginResetModel()
-		self._timelines = []
+		self._timelines = self._createTimelineStorage()
 		self._headers = []
+		self._bulk_pending = []
+		self._updateColumnFields()
 		self.endResetModel()
 	
-	def headerData(self, section:int, orientation:QtCore.Qt.Orientation, /, role:QtCore.Qt.ItemDataRole) -> typing.Any:
-		if orientation == QtCore.Qt.Orientation.Horizontal:
-			return self._headers[section].data(role)
+	def _createTimelineStorage(self) -> list[dict[str, TRTAbstractViewItem]]|TRTColumnStore:
+		return TRTColumnStore() if self._use_column_store else []
 	
-	def fields(self) -> list[str]:
-		"""Field names for mapping headers and columns, in order"""
-		return [x.field_name() for x in self._headers]
+	def usesColumnStore(self) -> bool:
+		"""Whether timelines are kept in a column store"""
+		return self._use_column_store
 	
-	def addHeader(self, header:TRTAbstractViewHeaderItem) -> bool:
-		self.beginInsertColumns(QtCore.QModelIndex(), 0, 0)
-		self._headers.insert(0, header)
-		self.endInsertColumns()
-		return True
+	def sortKeys(self, column:int, first_row:int=0, last_row:int|None=None) -> list[typing.Any]:
+		"""Typed sort keys for a column in a range of rows, inclusive (`None` for rows without an item)"""
+
+		field_name = self._column_fields[column]
+		last_row   = len(self._timelines) - 1 if last_row is None else last_row
+
+		if self._use_column_store:
+			return self._timelines.sortKeys(field_name, first_row, last_row)
 
+		return [timeline[field_name].sort_key() if field_name in timeline else None for timeline in self._timelines[first_row:last_row+1]]
+	
 	def addTimeline(self, timeline:dict[str,TRTAbstractViewItem]) -> bool:
+		"""Append a single timeline (buffered if a bulk load is in progress)"""
+
+		return self.addTimelines([timeline])
+
+	def addTimelines(self, timelines:typing.Iterable[dict[str,TRTAbstractViewItem]]) -> bool:
+		"""Append timelines to the end of the model with a single insert notification"""
+
+		timelines = list(timelines)
+
+		if self._bulk_loading:
+			self._bulk_pending.extend(timelines)
+
+			if len(self._bulk_pending) >= self.BULK_LOAD_CHUNK_SIZE:
+				self.flushBulkLoad()
+			elif not self._bulk_flush_timer.isActive():
+				self._bulk_flush_timer.start()
+
+			return True
+
+		if not timelines:
+			return False
+
+		first_row = len(self._timelines)
+
+		self.beginInsertRows(QtCore.QModelIndex(), first_row, first_row + len(timelines) - 1)
+		self._timelines.extend(timelines)
+		self.endInsertRows()
+		return True
+
+	def timeline(self, row:int) -> typing.Mapping[str,TRTAbstractViewItem]:
+		"""View items for a given row, by field name"""
+		return self._timelines[row]
+
+	def insertTimelines(self, row:int, timelines:typing.Iterable[dict[str,TRTAbstractViewItem]]) -> bool:
+		"""Insert timelines before the given row with a single insert notification"""
+
+		timelines = list(timelines)
+
+		if not timelines:
+			return False
+
+		self.flushBulkLoad()
+
+		self.beginInsertRows(QtCore.QModelIndex(), row, row + len(timelines) - 1)
+		if self._use_column_store:
+			self._timelines.insert(row, timelines)
+		else:
+			self._timelines[row:row] = timelines
+		self._row_cells.clear()
+		self.endInsertRows()
+		return True
+
+	def removeTimelines(self, first_row:int, last_row:int) -> bool:
+		"""Remove a range of timelines, inclusive"""
+
+		if not 0 <= first_row <= last_row < len(self._timelines):
+			return False
+
+		self.flushBulkLoad()
+
+		self.beginRemoveRows(QtCore.QModelIndex(), first_row, last_row)
+		if self._use_column_store:
+			self._timelines.remove(first_row, last_row)
+		else:
+			del self._timelines[first_row:last_row+1]
+		self._row_cells.clear()
+		self.endRemoveRows()
+		return True
+
+	def setTimeline(self, row:int, timeline:dict[str,TRTAbstractViewItem]) -> bool:
+		"""Replace the timeline in a given row, notifying views only of the cells that changed"""
+
+		previous = self._timelines[row]
+
+		changed_columns = [
+			column for column, field_name in enumerate(self._column_fields)
+			if not self._itemsMatch(previous.get(field_name), timeline.get(field_name))
+		]
+
+		if self._use_column_store:
+			self._timelines.set(row, timeline)
+		else:
+			self._timelines[row] = timeline
+		self._row_cells.pop(row, None)
+
+		# One notification per run of adjacent changed columns
+		run_start = None
+		for idx, column in enumerate(changed_columns):
+
+			if run_start is None:
+				run_start = column
+
+			if idx + 1 == len(changed_columns) or changed_columns[idx + 1] != column + 1:
+				self.dataChanged.emit(self.index(row, run_start, QtCore.QModelIndex()), self.index(row, column, QtCore.QModelIndex()))
+				run_start = None
+
+		return bool(changed_columns)
+
+	@staticmethod
+	def _itemsMatch(item:TRTAbstractViewItem|None, other:TRTAbstractViewItem|None) -> bool:
+		"""Whether two view items would display the same"""
+
+		if item is None or other is None:
+			return item is other
+
+		return type(item) is type(other) and item.raw_data() == other.raw_data()
+
+	@QtCore.Slot()
+	def beginBulkLoad(self):
+		"""Buffer added timelines and insert them in chunks until `endBulkLoad()` is called"""
+
+		self._bulk_loading = True
+
+	@QtCore.Slot()
+	def flushBulkLoad(self):
+		"""Insert any timelines buffered by the current bulk load"""
+
+		self._bulk_flush_timer.stop()
+
+		pending, self._bulk_pending = self._bulk_pending, []
+
+		# Insert directly, bypassing the bulk buffer
+		is_bulk_loading, self._bulk_loading = self._bulk_loading, False
+		self.addTimelines(pending)
+		self._bulk_loading = is_bulk_loading
+
+	@QtCore.Slot()
+	def endBulkLoad(self):
+		"""Insert remaining buffered timelines and return to inserting timelines immediately"""
+
+		self.flushBulkLoad()
+		self._bulk_loading = False
+
+	def isBulkLoading(self) -> bool:
+		"""Whether a bulk load is in progress"""
+		return self._bulk_loading
+
+
+class TRTLazyTimelineViewModel(TRTAbstractTimelineViewModel):
+	"""A view model for timelines which reads rows from a row source only as they're needed
+
+	Rows are revealed to views `FETCH_SIZE` at a time through `canFetchMore()`/`fetchMore()`
+	as the user scrolls, and view items are built a page of rows at a time when first
+	displayed.  Only the `MAX_CACHED_PAGES` most recently used pages are kept, so rows
+	scrolled well out of view are dropped and rebuilt from the source if needed again.
+	"""
+
+	FETCH_SIZE:int = 1000
+	"""Number of rows revealed to views by each `fetchMore()`"""
+
+	PAGE_SIZE:int = 256
+	"""Number of rows materialized from the row source at a time"""
+
+	MAX_CACHED_PAGES:int = 32
+	"""Number of materialized pages kept before the least recently used are evicted"""
+
+	def __init__(self, row_source:TRTAbstractRowSource|None=None):
+
+		super().__init__()
+
+		self._row_source = row_source
+
+		self._fetched_count = 0
+		"""Number of rows revealed to views so far"""
 
-		self.beginInsertRows(QtCore.QModelIndex(), 0, 0)
-		self._timelines.insert(0, timeline)
+		self._pages:collections.OrderedDict[int, list[dict[str, TRTAbstractViewItem]]] = collections.OrderedDict()
+		"""Materialized pages of rows by page number, least recently used first"""
+
+		self._page_loads     = 0
+		self._page_evictions = 0
+
+	def rowSource(self) -> TRTAbstractRowSource|None:
+		return self._row_source
+
+	def setRowSource(self, row_source:TRTAbstractRowSource|None):
+		"""Show rows from a different source, starting again from the first page"""
+
+		self.beginResetModel()
+		self._row_source = row_source
+		self._fetched_count = 0
+		self._pages.clear()
+		self.endResetModel()
+
+	def rowCount(self, /, parent:QtCore.QModelIndex=QtCore.QModelIndex()) -> int:
+		if parent.isValid():
+			return 0
+		return self._fetched_count
+
+	def canFetchMore(self, /, parent:QtCore.QModelIndex) -> bool:
+		if parent.isValid() or self._row_source is None:
+			return False
+		return self._fetched_count < self._row_source.rowCount()
+
+	def fetchMore(self, /, parent:QtCore.QModelIndex):
+		"""Reveal the next `FETCH_SIZE` rows (without materializing them)"""
+
+		if not self.canFetchMore(parent):
+			return
+
+		fetch_count = min(self.FETCH_SIZE, self._row_source.rowCount() - self._fetched_count)
+
+		self.beginInsertRows(QtCore.QModelIndex(), self._fetched_count, self._fetched_count + fetch_count - 1)
+		self._fetched_count += fetch_count
+		self.endInsertRows()
+
+	def fetchAll(self):
+		"""Reveal all remaining rows at once, such as before sorting the whole source"""
+
+		if not self.canFetchMore(QtCore.QModelIndex()):
+			return
+
+		self.beginInsertRows(QtCore.QModelIndex(), self._fetched_count, self._row_source.rowCount() - 1)
+		self._fetched_count = self._row_source.rowCount()
 		self.endInsertRows()
-		return True
\ No newline at end of file
+
+	def _readPage(self, page:int) -> list[dict[str, TRTAbstractViewItem]]:
+		"""Rows of a page from the row source, without caching them"""
+
+		self._page_loads += 1
+		return self._row_source.rows(page * self.PAGE_SIZE, (page + 1) * self.PAGE_SIZE - 1)
+
+	def _page(self, page:int) -> list[dict[str, TRTAbstractViewItem]]:
+		"""Rows of a page, materializing it (and evicting the least recently used) if needed"""
+
+		try:
+			self._pages.move_to_end(page)
+			return self._pages[page]
+		except KeyError:
+			pass
+
+		rows = self._pages[page] = self._readPage(page)
+
+		while len(self._pages) > self.MAX_CACHED_PAGES:
+			self._pages.popitem(last=False)
+			self._page_evictions += 1
+
+		return rows
+
+	def timeline(self, row:int) -> typing.Mapping[str,TRTAbstractViewItem]:
+		"""View items for a given row, by field name"""
+		return self._page(row // self.PAGE_SIZE)[row % self.PAGE_SIZE]
+
+	def data(self, index:QtCore.QModelIndex, /, role:QtCore.Qt.ItemDataRole) -> typing.Any:
+		if not index.isValid():
+			return None
+
+		item = self.timeline(index.row()).get(self._column_fields[index.column()])
+		return item.data(role) if item is not None else None
+
+	def sortKeys(self, column:int, first_row:int=0, last_row:int|None=None) -> list[typing.Any]:
+		"""Typed sort keys for a column in a range of fetched rows, inclusive
+
+		Pages which aren't already materialized are read and discarded, rather than cached, so sorting doesn't flush the rows on screen.
+		"""
+
+		field_name = self._column_fields[column]
+		last_row   = self._fetched_count - 1 if last_row is None else last_row
+
+		sort_keys = []
+
+		for page in range(first_row // self.PAGE_SIZE, last_row // self.PAGE_SIZE + 1):
+
+			rows = self._pages.get(page) or self._readPage(page)
+			page_first = page * self.PAGE_SIZE
+
+			for timeline in rows[max(first_row - page_first, 0):last_row - page_first + 1]:
+				sort_keys.append(timeline[field_name].sort_key() if field_name in timeline else None)
+
+		return sort_keys
+
+	def refreshRows(self, first_row:int, last_row:int):
+		"""Drop materialized rows in a range after the row source has changed them, notifying views"""
+
+		for page in range(first_row // self.PAGE_SIZE, last_row // self.PAGE_SIZE + 1):
+			self._pages.pop(page, None)
+
+		last_row = min(last_row, self._fetched_count - 1)
+
+		if first_row <= last_row and self._headers:
+			self.dataChanged.emit(self.index(first_row, 0, QtCore.QModelIndex()), self.index(last_row, len(self._headers) - 1, QtCore.QModelIndex()))
+
+	def cachedPageCount(self) -> int:
+		"""Number of pages of rows currently materialized"""
+		return len(self._pages)
+
+	def pageLoadCount(self) -> int:
+		"""Number of pages read from the row source so far"""
+		return self._page_loads
+
+	def pageEvictionCount(self) -> int:
+		"""Number of materialized pages dropped to stay within `MAX_CACHED_PAGES`"""
+		return self._page_evictions